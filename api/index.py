@@ -4,4 +4,7 @@ import os
 # Add the root directory to the python path so imports like "app.routes" work from backend
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
 
+# Serverless instances are frozen between invocations; don't keep pooled connections.
+os.environ.setdefault("DB_POOL_MODE", "null")
+
 from main import app
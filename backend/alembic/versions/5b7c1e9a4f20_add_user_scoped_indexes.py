@@ -0,0 +1,51 @@
+"""Add user scoped indexes
+
+Revision ID: 5b7c1e9a4f20
+Revises: 0e46db03d933
+Create Date: 2026-10-18 10:02:17.554810
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b7c1e9a4f20'
+down_revision: Union[str, Sequence[str], None] = '0e46db03d933'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+USER_ID_TABLES = ['pantry', 'recurring', 'goals', 'plans', 'budget_limits', 'fuel_entries']
+
+
+def _existing_tables() -> set:
+    # fuel_entries predates alembic and was only ever created by create_all()
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_transactions_user_date', 'transactions', ['user_id', 'date', 'id'], unique=False)
+    op.create_index(
+        'ix_transactions_user_type_date',
+        'transactions',
+        ['user_id', 'type', 'date'],
+        unique=False,
+        postgresql_include=['amount', 'category'],
+    )
+    existing = _existing_tables()
+    for table in USER_ID_TABLES:
+        if table in existing:
+            op.create_index(op.f(f'ix_{table}_user_id'), table, ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    existing = _existing_tables()
+    for table in reversed(USER_ID_TABLES):
+        if table in existing:
+            op.drop_index(op.f(f'ix_{table}_user_id'), table_name=table)
+    op.drop_index('ix_transactions_user_type_date', table_name='transactions')
+    op.drop_index('ix_transactions_user_date', table_name='transactions')
@@ -0,0 +1,77 @@
+"""Store transactions.date as DATE
+
+Revision ID: 9d2f4a6c8e13
+Revises: 5b7c1e9a4f20
+Create Date: 2026-10-18 11:26:48.907311
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d2f4a6c8e13'
+down_revision: Union[str, Sequence[str], None] = '5b7c1e9a4f20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rows whose text date cannot be parsed at all land here instead of failing the cast
+FALLBACK_DATE = '1970-01-01'
+
+
+def _normalize_dates() -> None:
+    """Rewrite every stored value as a plain YYYY-MM-DD string before the cast."""
+    conn = op.get_bind()
+    rows = conn.execute(sa.text("SELECT id, date FROM transactions")).fetchall()
+    fixes = []
+    for tx_id, value in rows:
+        raw = (value or '').strip()
+        try:
+            normalized = date.fromisoformat(raw[:10]).isoformat()
+        except ValueError:
+            normalized = FALLBACK_DATE
+        if normalized != value:
+            fixes.append({'id': tx_id, 'date': normalized})
+    if fixes:
+        conn.execute(sa.text("UPDATE transactions SET date = :date WHERE id = :id"), fixes)
+
+
+def _is_sqlite() -> bool:
+    # SQLAlchemy's Date type is stored as ISO text on SQLite, which is exactly what
+    # the normalized column already holds. Recreating the table would CAST the
+    # values to NUMERIC affinity and truncate them to the year, so the type change
+    # only happens on real DATE backends.
+    return op.get_bind().dialect.name == 'sqlite'
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _normalize_dates()
+    if _is_sqlite():
+        return
+    op.alter_column(
+        'transactions',
+        'date',
+        existing_type=sqlmodel.sql.sqltypes.AutoString(),
+        type_=sa.Date(),
+        existing_nullable=False,
+        postgresql_using='date::date',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if _is_sqlite():
+        return
+    op.alter_column(
+        'transactions',
+        'date',
+        existing_type=sa.Date(),
+        type_=sqlmodel.sql.sqltypes.AutoString(),
+        existing_nullable=False,
+        postgresql_using="to_char(date, 'YYYY-MM-DD')",
+    )
@@ -1,5 +1,8 @@
+import asyncio
 import os
 import secrets
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
@@ -7,10 +10,12 @@ import bcrypt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
+from starlette.concurrency import run_in_threadpool
 
-from app.database import get_session
+from app.database import get_async_session
 from sqlmodel import select
 from app.models.domain import User
+from app.core.cache import principal_cache
 
 SECRET_KEY = os.getenv("SECRET_KEY")
 if not SECRET_KEY:
@@ -20,6 +25,17 @@ if not SECRET_KEY:
     SECRET_KEY = secrets.token_hex(32)
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
+PRINCIPAL_CACHE_TTL_SECONDS = int(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "60"))
+
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "64"))
+
+# bcrypt releases the GIL, so a small thread pool runs hashes in parallel
+# without blocking the event loop.
+_hash_executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt")
+_pending_lock = threading.Lock()
+_pending_hashes = 0
 
 def verify_password(plain_password, hashed_password):
 
@@ -33,7 +49,30 @@ def get_password_hash(password):
     if isinstance(password, str):
         password = password.encode("utf-8")
 
-    return bcrypt.hashpw(password, bcrypt.gensalt()).decode("utf-8")
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode("utf-8")
+
+async def _run_hash(func, *args):
+    """Run a bcrypt call on the hash pool, shedding load once too many are queued."""
+    global _pending_hashes
+    with _pending_lock:
+        if _pending_hashes >= PASSWORD_HASH_MAX_PENDING:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many authentication attempts in progress, please retry",
+                headers={"Retry-After": "1"},
+            )
+        _pending_hashes += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_hash_executor, func, *args)
+    finally:
+        with _pending_lock:
+            _pending_hashes -= 1
+
+async def verify_password_async(plain_password, hashed_password) -> bool:
+    return await _run_hash(verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password) -> str:
+    return await _run_hash(get_password_hash, password)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
@@ -72,11 +111,40 @@ async def get_current_user(request: Request):
     except JWTError:
         raise credentials_exception
 
-    with next(get_session()) as session:
-        user = session.exec(select(User).where(User.username == username)).first()
-    
+    user = await load_principal(username, payload.get("uid"))
     if user is None:
         raise credentials_exception
-        
-    return user.model_dump()
 
+    return user
+
+async def load_principal(username: str, user_id: Optional[int] = None) -> Optional[dict]:
+    """The authenticated user as a plain dict (without the password hash).
+
+    Tokens carry the user id in a "uid" claim, which keys a short-lived
+    principal cache; only a miss, or an older token without the claim, costs a
+    database lookup. The username check guards against a reused id. Cache
+    backends may do blocking I/O, so they're reached from the threadpool.
+    """
+    key = None
+    if user_id is not None:
+        key, principal = await run_in_threadpool(_cached_principal, user_id)
+        if principal is not None and principal["username"] == username:
+            return principal
+
+    async for session in get_async_session():
+        if user_id is not None:
+            user = await session.get(User, user_id)
+        else:
+            user = (await session.exec(select(User).where(User.username == username))).first()
+
+    if user is None or user.username != username:
+        return None
+
+    principal = {"id": user.id, "username": user.username, "email": user.email}
+    if key is not None:
+        await run_in_threadpool(principal_cache.set, key, principal, PRINCIPAL_CACHE_TTL_SECONDS)
+    return principal
+
+def _cached_principal(user_id: int):
+    key = principal_cache.key("principal", user_id, "")
+    return key, principal_cache.get(key)
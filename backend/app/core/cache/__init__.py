@@ -0,0 +1,145 @@
+import logging
+import os
+import secrets
+from typing import Any, Dict, Optional
+from .base import CacheBackend, CacheStats
+from .memory import MemoryBackend
+from .sqlite import SQLiteBackend
+from .redis import RedisBackend
+
+logger = logging.getLogger(__name__)
+
+EPOCH_TTL_SECONDS = 30 * 24 * 3600
+
+def multi_process() -> bool:
+    """Whether requests are spread over several processes/instances: uvicorn or
+    gunicorn workers (WEB_CONCURRENCY), serverless (VERCEL), or declared with
+    CACHE_MULTI_PROCESS=1 when neither is visible from the environment."""
+    return (
+        int(os.getenv("WEB_CONCURRENCY", "1") or 1) > 1
+        or bool(os.getenv("VERCEL"))
+        or os.getenv("CACHE_MULTI_PROCESS", "").lower() in ("1", "true", "yes")
+    )
+
+class UserScopedCache:
+    """Cache where every key belongs to a user and can be dropped per user.
+
+    Keys embed a per-user generation counter stored in the backend;
+    invalidating a user bumps it, so their old entries can no longer be
+    reached and simply age out. With a shared backend an invalidation in one
+    worker is seen by all of them; a disabled cache (per-process backend in a
+    multi-process deployment) stores nothing and never serves stale data.
+    """
+
+    def __init__(self, backend: CacheBackend, scope: str = "gen", enabled: bool = True):
+        self.backend = backend
+        self.scope = scope
+        self.enabled = enabled
+
+    def key(self, namespace: str, user_id: Optional[int], parts: str) -> Optional[str]:
+        """Build the key before computing a value and store under that same key:
+        a write landing in between then leaves the result unreachable instead of
+        caching stale data under the new generation. None (unknown generation)
+        makes get() miss and set() a no-op."""
+        generation = self.version(user_id)
+        if generation is None:
+            return None
+        return f"{namespace}:{user_id}:{generation}:{parts}"
+
+    def get(self, key: Optional[str]) -> Optional[Any]:
+        if not self.enabled or key is None:
+            return None
+        return self.backend.get(key)
+
+    def set(self, key: Optional[str], value: Any, ttl_seconds: float):
+        if self.enabled and key is not None:
+            self.backend.set(key, value, ttl_seconds)
+
+    def invalidate_user(self, user_id: int):
+        self.backend.incr(f"{self.scope}:{user_id}")
+
+    def version(self, user_id: int) -> Optional[int]:
+        """The user's data version, bumped by every invalidate_user(); None when
+        the backend can't tell right now."""
+        return self.backend.get_counter(f"{self.scope}:{user_id}")
+
+    def epoch(self) -> str:
+        """Random token identifying the backend's current counter state.
+
+        Counters restart from 0 when the backend is cleared or lost; anything
+        derived from a version (ETags) must include the epoch so an old value
+        can never match again. Losing the epoch entry only rotates it.
+        """
+        epoch = self.backend.get("epoch")
+        if epoch is None:
+            epoch = secrets.token_hex(8)
+            self.backend.set("epoch", epoch, EPOCH_TTL_SECONDS)
+        return epoch
+
+    def clear(self):
+        self.backend.clear()
+        self.backend.stats.reset()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": self.backend.name, "enabled": self.enabled, **self.backend.stats.snapshot()}
+
+def create_backend(env_prefix: str = "CACHE", default: str = "memory", default_path: str = "hess_cache.db") -> CacheBackend:
+    """CACHE_BACKEND picks memory (default), sqlite or redis; CACHE_URL is the
+    SQLite file path or the redis:// URL. Other caches read the same settings
+    under their own `env_prefix`."""
+    kind = os.getenv(f"{env_prefix}_BACKEND", default).lower()
+    maxsize = int(os.getenv(f"{env_prefix}_MAX_ENTRIES", "1024"))
+    if kind == "sqlite":
+        return SQLiteBackend(os.getenv(f"{env_prefix}_URL", default_path), maxsize=maxsize)
+    if kind == "redis":
+        return RedisBackend(os.getenv(f"{env_prefix}_URL", "redis://localhost:6379/0"))
+    if kind != "memory":
+        raise ValueError(f"Unknown {env_prefix}_BACKEND: {kind}")
+    return MemoryBackend(maxsize=maxsize)
+
+def create_user_cache() -> UserScopedCache:
+    """Per-user caching is only correct when invalidations reach every process.
+
+    With several workers a per-process backend is refused when configured
+    explicitly, and turns caching off when it is merely the default.
+    """
+    backend = create_backend()
+    if backend.shared or not multi_process():
+        return UserScopedCache(backend)
+    if os.getenv("CACHE_BACKEND"):
+        raise ValueError(
+            f"CACHE_BACKEND={backend.name} is per-process but the app runs in several processes: use sqlite or redis"
+        )
+    logger.warning("[CACHE] several processes and no shared CACHE_BACKEND: per-user caching disabled")
+    return UserScopedCache(backend, enabled=False)
+
+user_cache = create_user_cache()
+# Authenticated principals share the backend but have their own generation, so
+# ordinary data writes don't force a user lookup on the next request.
+principal_cache = UserScopedCache(user_cache.backend, scope="auth", enabled=user_cache.enabled)
+
+def invalidate_user(user_id: Optional[int]):
+    """Drop everything cached for this user; repositories call it after each write."""
+    if user_id is not None:
+        user_cache.invalidate_user(user_id)
+
+def invalidate_principal(user_id: Optional[int]):
+    """Force the next request of this user to re-read them from the database."""
+    if user_id is not None:
+        principal_cache.invalidate_user(user_id)
+
+__all__ = [
+    "CacheBackend",
+    "CacheStats",
+    "MemoryBackend",
+    "SQLiteBackend",
+    "RedisBackend",
+    "UserScopedCache",
+    "create_backend",
+    "create_user_cache",
+    "multi_process",
+    "user_cache",
+    "principal_cache",
+    "invalidate_user",
+    "invalidate_principal",
+]
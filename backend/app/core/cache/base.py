@@ -0,0 +1,62 @@
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+class CacheStats:
+    """Per-process counters; every backend reports through one of these."""
+
+    FIELDS = ("hits", "misses", "sets", "evictions", "expirations", "errors", "lost_invalidations")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(self.FIELDS, 0)
+
+    def incr(self, field: str, amount: int = 1):
+        with self._lock:
+            self._counts[field] += amount
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+    def reset(self):
+        with self._lock:
+            self._counts = dict.fromkeys(self.FIELDS, 0)
+
+class CacheBackend(ABC):
+    """Storage for cached values plus the integer counters used for invalidation.
+
+    Counters live outside the entry space: they never expire and are never
+    evicted, otherwise a dropped generation would resurrect stale entries.
+    """
+
+    name = "base"
+    # True when every worker/instance reads and writes the same entries and counters
+    shared = False
+
+    def __init__(self):
+        self.stats = CacheStats()
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Return the value, or None when missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl_seconds: float):
+        pass
+
+    @abstractmethod
+    def get_counter(self, key: str) -> Optional[int]:
+        """The counter's value (0 when never incremented), or None when it
+        can't be read: callers must then bypass the cache."""
+
+    @abstractmethod
+    def incr(self, key: str):
+        pass
+
+    @abstractmethod
+    def clear(self):
+        pass
+
+    def close(self):
+        pass
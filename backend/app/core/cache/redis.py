@@ -0,0 +1,184 @@
+import logging
+import socket
+import threading
+from typing import Any, List, Optional
+from urllib.parse import urlparse
+import orjson
+from .base import CacheBackend
+
+logger = logging.getLogger(__name__)
+
+class RedisError(Exception):
+    pass
+
+class RespConnection:
+    """Just enough of the Redis wire protocol (RESP2) for the cache backend."""
+
+    def __init__(self, host: str, port: int, db: int = 0, password: Optional[str] = None, timeout: float = 1.0):
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._reader = None
+
+    def _connect(self):
+        self._sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._reader = self._sock.makefile("rb")
+        if self.password:
+            self._roundtrip("AUTH", self.password)
+        if self.db:
+            self._roundtrip("SELECT", self.db)
+
+    def close(self):
+        if self._sock is not None:
+            try:
+                self._reader.close()
+                self._sock.close()
+            finally:
+                self._sock = None
+                self._reader = None
+
+    def execute(self, *args) -> Any:
+        if self._sock is None:
+            self._connect()
+        try:
+            return self._roundtrip(*args)
+        except (OSError, EOFError):
+            self.close()
+            raise
+
+    def _roundtrip(self, *args) -> Any:
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            data = arg if isinstance(arg, bytes) else str(arg).encode()
+            parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+        self._sock.sendall(b"".join(parts))
+        return self._read_reply()
+
+    def _read_reply(self) -> Any:
+        line = self._reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise EOFError("connection closed by server")
+        kind, payload = line[:1], line[1:-2]
+        if kind == b"+":
+            return payload.decode()
+        if kind == b"-":
+            raise RedisError(payload.decode())
+        if kind == b":":
+            return int(payload)
+        if kind == b"$":
+            length = int(payload)
+            if length < 0:
+                return None
+            data = self._reader.read(length + 2)
+            return data[:-2]
+        if kind == b"*":
+            length = int(payload)
+            if length < 0:
+                return None
+            return [self._read_reply() for _ in range(length)]
+        raise RedisError(f"unexpected reply {line!r}")
+
+_FAILED = object()
+
+class RedisBackend(CacheBackend):
+    """Cache shared across hosts through any server speaking the Redis protocol.
+
+    Fails open: when the server is unreachable reads are misses and writes are
+    dropped, so an outage costs latency rather than requests. A counter that
+    can't be read makes the caller bypass the cache rather than fall back to
+    an old generation. Entries expire server-side (SET PX); LRU eviction is
+    left to the server's maxmemory policy. Values are stored as JSON, never
+    unpickled from a server other processes can write to.
+    """
+
+    name = "redis"
+    shared = True
+
+    def __init__(self, url: str = "redis://localhost:6379/0", prefix: str = "hess:cache:", max_connections: int = 8):
+        super().__init__()
+        parsed = urlparse(url)
+        db = parsed.path.lstrip("/")
+        self.prefix = prefix
+        self._connect_args = {
+            "host": parsed.hostname or "localhost",
+            "port": parsed.port or 6379,
+            "db": int(db) if db else 0,
+            "password": parsed.password,
+        }
+        # idle connections; each command borrows one, so callers never share a socket
+        self._idle: List[RespConnection] = []
+        self._pool_lock = threading.Lock()
+        self.max_connections = max_connections
+
+    def _borrow(self) -> RespConnection:
+        with self._pool_lock:
+            if self._idle:
+                return self._idle.pop()
+        return RespConnection(**self._connect_args)
+
+    def _release(self, conn: RespConnection):
+        with self._pool_lock:
+            if conn._sock is not None and len(self._idle) < self.max_connections:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def _execute(self, *args) -> Any:
+        """Run one command; returns _FAILED (and counts an error) when it can't."""
+        conn = self._borrow()
+        try:
+            return conn.execute(*args)
+        except (OSError, EOFError, RedisError) as e:
+            self.stats.incr("errors")
+            logger.warning(f"[CACHE] redis {args[0]} failed: {e}")
+            return _FAILED
+        finally:
+            self._release(conn)
+
+    def get(self, key: str) -> Optional[Any]:
+        data = self._execute("GET", self.prefix + key)
+        if data is None or data is _FAILED:
+            self.stats.incr("misses")
+            return None
+        self.stats.incr("hits")
+        return orjson.loads(data)
+
+    def set(self, key: str, value: Any, ttl_seconds: float):
+        blob = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        if self._execute("SET", self.prefix + key, blob, "PX", max(1, int(ttl_seconds * 1000))) is not _FAILED:
+            self.stats.incr("sets")
+
+    def get_counter(self, key: str) -> Optional[int]:
+        value = self._execute("GET", self.prefix + "counter:" + key)
+        if value is _FAILED:
+            return None
+        return int(value) if value is not None else 0
+
+    def incr(self, key: str):
+        for _ in range(2):
+            if self._execute("INCR", self.prefix + "counter:" + key) is not _FAILED:
+                return
+        self.stats.incr("lost_invalidations")
+        logger.error(f"[CACHE] invalidation of {key} lost: entries may stay stale until they expire")
+
+    def clear(self):
+        cursor = b"0"
+        while True:
+            reply = self._execute("SCAN", cursor, "MATCH", self.prefix + "*", "COUNT", 500)
+            if reply is _FAILED:
+                return
+            cursor, keys = reply
+            if keys:
+                self._execute("DEL", *keys)
+            if cursor == b"0":
+                return
+
+    def close(self):
+        with self._pool_lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
@@ -0,0 +1,111 @@
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+from .base import CacheBackend
+
+class SQLiteBackend(CacheBackend):
+    """Cache shared by every worker on one host through a local SQLite file.
+
+    Runs in WAL mode so readers never wait on the single writer. Values are
+    pickled; the file is a private cache, not an exchange format. Hits refresh
+    the LRU timestamp at most once per `touch_interval` seconds, so hot keys
+    are served by plain reads instead of a write on every hit.
+    """
+
+    name = "sqlite"
+    shared = True
+
+    def __init__(self, path: str, maxsize: int = 1024, touch_interval: float = 30.0):
+        super().__init__()
+        self.path = path
+        self.maxsize = maxsize
+        self.touch_interval = touch_interval
+        self._local = threading.local()
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS ix_cache_entries_accessed ON cache_entries (accessed_at)")
+        conn.execute("CREATE TABLE IF NOT EXISTS cache_counters (key TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[Any]:
+        conn = self._conn()
+        now = time.time()
+        row = conn.execute(
+            "SELECT value, expires_at, accessed_at FROM cache_entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self.stats.incr("misses")
+            return None
+        if row[1] < now:
+            conn.execute("DELETE FROM cache_entries WHERE key = ? AND expires_at < ?", (key, now))
+            self.stats.incr("expirations")
+            self.stats.incr("misses")
+            return None
+        if now - row[2] >= self.touch_interval:
+            conn.execute("UPDATE cache_entries SET accessed_at = ? WHERE key = ?", (now, key))
+        self.stats.incr("hits")
+        return pickle.loads(row[0])
+
+    def set(self, key: str, value: Any, ttl_seconds: float):
+        conn = self._conn()
+        now = time.time()
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, blob, now + ttl_seconds, now),
+            )
+            expired = conn.execute("DELETE FROM cache_entries WHERE expires_at < ?", (now,)).rowcount
+            overflow = conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0] - self.maxsize
+            evicted = 0
+            if overflow > 0:
+                evicted = conn.execute(
+                    "DELETE FROM cache_entries WHERE key IN "
+                    "(SELECT key FROM cache_entries ORDER BY accessed_at LIMIT ?)",
+                    (overflow,),
+                ).rowcount
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        self.stats.incr("sets")
+        if expired:
+            self.stats.incr("expirations", expired)
+        if evicted:
+            self.stats.incr("evictions", evicted)
+
+    def get_counter(self, key: str) -> int:
+        row = self._conn().execute("SELECT value FROM cache_counters WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else 0
+
+    def incr(self, key: str):
+        self._conn().execute(
+            "INSERT INTO cache_counters (key, value) VALUES (?, 1) "
+            "ON CONFLICT(key) DO UPDATE SET value = value + 1",
+            (key,),
+        )
+
+    def clear(self):
+        conn = self._conn()
+        conn.execute("DELETE FROM cache_entries")
+        conn.execute("DELETE FROM cache_counters")
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
@@ -0,0 +1,24 @@
+from datetime import date, timedelta
+from typing import Tuple, Union
+
+DateLike = Union[date, str]
+
+def to_date(value: DateLike) -> date:
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(value[:10])
+
+def year_range(year: Union[int, str]) -> Tuple[date, date]:
+    """Half-open [Jan 1st, next Jan 1st) bounds, so filters stay index range scans."""
+    y = int(year)
+    return date(y, 1, 1), date(y + 1, 1, 1)
+
+def month_range(year: Union[int, str], month: Union[int, str]) -> Tuple[date, date]:
+    y, m = int(year), int(month)
+    start = date(y, m, 1)
+    end = date(y + 1, 1, 1) if m == 12 else date(y, m + 1, 1)
+    return start, end
+
+def inclusive_range(start: DateLike, end: DateLike) -> Tuple[date, date]:
+    """Turn an inclusive [start, end] pair of days into half-open bounds."""
+    return to_date(start), to_date(end) + timedelta(days=1)
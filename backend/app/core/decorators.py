@@ -1,28 +1,44 @@
+import asyncio
+import inspect
 import logging
 import time
 from functools import wraps
 from typing import Callable
+from app.core.cache import user_cache
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def cached(ttl_seconds: int = 300):
-    cache = {}
+def cached(ttl_seconds: int = 300, user_arg: str = "user_id"):
+    """Cache results per user in the configured backend (app.core.cache.user_cache).
+
+    The `user_arg` argument scopes the entry so invalidate_user() drops it; the
+    remaining arguments (minus `self`) form the rest of the key. Hits, misses
+    and evictions are counted by the backend, see user_cache.stats(). None is
+    never cached, and cached values may be shared between callers, so treat
+    them as read-only.
+    """
 
     def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        namespace = f"{func.__module__}.{func.__qualname__}"
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            key = f"{func.__name__}:{args}:{kwargs}"
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            arguments.pop("self", None)
+            user_id = arguments.pop(user_arg, None)
+            key = user_cache.key(namespace, user_id, repr(sorted(arguments.items())))
 
-            if key in cache:
-                result, timestamp = cache[key]
-                if time.time() - timestamp < ttl_seconds:
-                    logger.info(f"[CACHE HIT] {func.__name__}")
-                    return result
+            result = user_cache.get(key)
+            if result is not None:
+                return result
 
             result = func(*args, **kwargs)
-            cache[key] = (result, time.time())
-            logger.info(f"[CACHE MISS] {func.__name__}")
+            if result is not None:
+                user_cache.set(key, result, ttl_seconds)
             return result
 
         return wrapper
@@ -30,13 +46,30 @@ def cached(ttl_seconds: int = 300):
     return decorator
 
 def logged(func: Callable) -> Callable:
-    @wraps(func)
-    def wrapper(*args, **kwargs):
+    def before(args):
         logger.info(
             f"[LOG] Calling {func.__name__} with args={args[:2]}..."
             if args
             else f"[LOG] Calling {func.__name__}"
         )
+
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            before(args)
+            try:
+                result = await func(*args, **kwargs)
+                logger.info(f"[LOG] {func.__name__} completed successfully")
+                return result
+            except Exception as e:
+                logger.error(f"[LOG] {func.__name__} failed with error: {e}")
+                raise
+
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        before(args)
         try:
             result = func(*args, **kwargs)
             logger.info(f"[LOG] {func.__name__} completed successfully")
@@ -48,6 +81,17 @@ def logged(func: Callable) -> Callable:
     return wrapper
 
 def timed(func: Callable) -> Callable:
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            start_time = time.time()
+            result = await func(*args, **kwargs)
+            elapsed = time.time() - start_time
+            logger.info(f"[TIMER] {func.__name__} took {elapsed:.4f}s")
+            return result
+
+        return async_wrapper
+
     @wraps(func)
     def wrapper(*args, **kwargs):
         start_time = time.time()
@@ -59,7 +103,41 @@ def timed(func: Callable) -> Callable:
     return wrapper
 
 def retry(max_attempts: int = 3, delay: float = 1.0):
+    """Retry with exponential backoff. Coroutine functions back off with
+    asyncio.sleep, so waiting for the next attempt never blocks the loop."""
+
     def decorator(func: Callable) -> Callable:
+        def log_retry(attempt, current_delay):
+            logger.warning(
+                f"[RETRY] {func.__name__} attempt {attempt + 1} failed, retrying in {current_delay}s..."
+            )
+
+        def log_failure():
+            logger.error(
+                f"[RETRY] {func.__name__} failed after {max_attempts} attempts"
+            )
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                last_exception = None
+                current_delay = delay
+
+                for attempt in range(max_attempts):
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception as e:
+                        last_exception = e
+                        if attempt < max_attempts - 1:
+                            log_retry(attempt, current_delay)
+                            await asyncio.sleep(current_delay)
+                            current_delay *= 2
+
+                log_failure()
+                raise last_exception
+
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             last_exception = None
@@ -71,15 +149,11 @@ def retry(max_attempts: int = 3, delay: float = 1.0):
                 except Exception as e:
                     last_exception = e
                     if attempt < max_attempts - 1:
-                        logger.warning(
-                            f"[RETRY] {func.__name__} attempt {attempt + 1} failed, retrying in {current_delay}s..."
-                        )
+                        log_retry(attempt, current_delay)
                         time.sleep(current_delay)
                         current_delay *= 2
 
-            logger.error(
-                f"[RETRY] {func.__name__} failed after {max_attempts} attempts"
-            )
+            log_failure()
             raise last_exception
 
         return wrapper
@@ -11,6 +11,7 @@ from app.repositories import (
     PlansRepository,
     BudgetRepository,
     FuelRepository,
+    AuditRepository,
 )
 
 def get_transaction_repository(session: Session = Depends(get_session)):
@@ -34,10 +35,16 @@ def get_plans_repository(session: Session = Depends(get_session)):
 def get_budget_repository(session: Session = Depends(get_session)):
     return BudgetRepository(session)
 
+def get_audit_repository(session: Session = Depends(get_session)):
+    return AuditRepository(session)
+
 def get_dashboard_service(session: Session = Depends(get_session)):
     service = ServiceFactory.create_dashboard_service(session)
     return service
 
+def get_import_service(session: Session = Depends(get_session)):
+    return ServiceFactory.create_import_service(session)
+
 def get_coach_service():
     return ServiceFactory.create_coach_service()
 
@@ -0,0 +1,85 @@
+import hashlib
+from datetime import date
+from typing import Optional
+from fastapi import Depends, HTTPException, Request
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.auth_utils import get_current_user
+from app.core.cache import multi_process, user_cache
+from app.core.compression import COMPRESSION_ALGORITHMS, accepted_encodings
+
+CACHE_CONTROL = "private, no-cache"
+
+def _negotiated_encoding(request: Request) -> str:
+    accepted = accepted_encodings(request.headers.get("Accept-Encoding", ""))
+    return next((a for a in COMPRESSION_ALGORITHMS if a in accepted), "identity")
+
+def etags_enabled() -> bool:
+    """ETags rest on the cache's per-user versions, which only track every
+    write when all workers share the backend: a per-process counter would let
+    a worker that never saw a write answer 304 for changed data."""
+    return user_cache.enabled and (user_cache.backend.shared or not multi_process())
+
+def data_etag(request: Request, user_id: int) -> Optional[str]:
+    """Strong ETag for a user's GET: their data version, the exact URL, the
+    negotiated content coding and today's date (dashboards depend on it).
+    None when the version can't be read."""
+    version = user_cache.version(user_id)
+    if version is None:
+        return None
+    key = "|".join((
+        user_cache.epoch(),
+        str(user_id),
+        str(version),
+        request.url.path,
+        str(sorted(request.query_params.multi_items())),
+        _negotiated_encoding(request),
+        date.today().isoformat(),
+    ))
+    return '"' + hashlib.sha256(key.encode()).hexdigest()[:32] + '"'
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    tags = [t.strip() for t in if_none_match.split(",")]
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+async def conditional_get(request: Request, current_user: dict = Depends(get_current_user)):
+    """Route dependency: answer 304 while the user's data hasn't changed.
+
+    Runs before the handler's other dependencies, so a revalidation costs no
+    query and no serialization. Otherwise the ETag is left on request.state
+    for ETagMiddleware to put on the 200 response. Without a reliable
+    version (see etags_enabled) responses simply go out untagged.
+    """
+    if not etags_enabled():
+        return
+    # cache backends may do blocking I/O
+    etag = await run_in_threadpool(data_etag, request, current_user["id"])
+    if etag is None:
+        return
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match and _matches(if_none_match, etag):
+        raise HTTPException(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+    request.state.etag = etag
+
+class ETagMiddleware:
+    """Adds the ETag computed by conditional_get to successful responses."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_etag(message: Message):
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                etag = scope.get("state", {}).get("etag")
+                if etag and "etag" not in Headers(raw=message["headers"]):
+                    headers = MutableHeaders(raw=message["headers"])
+                    headers["ETag"] = etag
+                    headers["Cache-Control"] = CACHE_CONTROL
+            await send(message)
+
+        await self.app(scope, receive, send_with_etag)
@@ -8,12 +8,14 @@ from app.repositories import (
     PlansRepository,
     BudgetRepository,
     UserRepository,
+    LedgerRepository,
 )
 from app.services import (
     GamificationService,
     PredictionService,
     DashboardService,
     CoachService,
+    TransactionImportService,
 )
 
 class ServiceFactory:
@@ -24,6 +26,7 @@ class ServiceFactory:
         recurring_repo = RecurringRepository(session)
         goals_repo = GoalsRepository(session)
         profile_repo = ProfileRepository(session)
+        ledger_repo = LedgerRepository(session)
 
         gamification_service = GamificationService()
         prediction_service = PredictionService()
@@ -34,10 +37,15 @@ class ServiceFactory:
             recurring_repo=recurring_repo,
             goals_repo=goals_repo,
             profile_repo=profile_repo,
+            ledger_repo=ledger_repo,
             gamification_service=gamification_service,
             prediction_service=prediction_service,
         )
 
+    @staticmethod
+    def create_import_service(session: Session) -> TransactionImportService:
+        return TransactionImportService(transaction_repo=TransactionRepository(session))
+
     @staticmethod
     def create_coach_service() -> CoachService:
         return CoachService()
@@ -0,0 +1,18 @@
+import base64
+import json
+from datetime import date
+from typing import Tuple
+
+def encode_cursor(tx_date: str, tx_id: int) -> str:
+    """Opaque keyset cursor pointing at the last (date, id) a client has seen."""
+    raw = json.dumps([str(tx_date), tx_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[date, int]:
+    """Raises ValueError on anything that was not produced by encode_cursor."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        tx_date, tx_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return date.fromisoformat(tx_date), int(tx_id)
+    except (TypeError, ValueError, UnicodeError) as e:
+        raise ValueError("Invalid cursor") from e
@@ -0,0 +1,24 @@
+from decimal import Decimal
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+def _default(value):
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+class ORJSONResponse(JSONResponse):
+    """JSON rendered by orjson: several times faster than json.dumps, dates and
+    non-string dict keys included.
+
+    Used as the app's default response class. Handlers with large payloads
+    return it directly, which also skips FastAPI's jsonable_encoder pass.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
@@ -1,6 +1,14 @@
 import os
 import sqlite3
+import threading
+from typing import Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
 from sqlmodel import SQLModel, create_engine, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.pool_metrics import instrumented, track_usage
 
 # Priority:
 # 1. DATABASE_URL
@@ -11,19 +19,120 @@ if db_url:
     # SQLAlchemy requires "postgresql://" instead of "postgres://"
     if db_url.startswith("postgres://"):
         db_url = db_url.replace("postgres://", "postgresql://", 1)
-        
-    engine_kwargs = {}
-    if db_url.startswith("sqlite"):
-         engine_kwargs = {"check_same_thread": False}
-         
-    engine = create_engine(db_url, echo=False, **engine_kwargs)
 else:
     # Local SQLite fallback
-    DB_FILE = os.getenv("SQLITE_DB_PATH", "hess_protector.db")
-    if not DB_FILE.startswith("sqlite:///"):
-        DB_FILE = f"sqlite:///{DB_FILE}"
-        
-    engine = create_engine(DB_FILE, echo=False, connect_args={"check_same_thread": False})
+    db_url = os.getenv("SQLITE_DB_PATH", "hess_protector.db")
+    if not db_url.startswith("sqlite:///"):
+        db_url = f"sqlite:///{db_url}"
+
+# Pool settings. DB_POOL_MODE=null opens one connection per checkout and keeps
+# nothing between requests, which is what serverless entry points (api/index.py)
+# want: a frozen instance must not hold connections the server has dropped.
+DB_POOL_MODE = os.getenv("DB_POOL_MODE", "queue").lower()
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+
+def _pool_kwargs(url, queue_pool: type, name: str) -> dict:
+    if DB_POOL_MODE == "null":
+        return {"poolclass": instrumented(NullPool, name)}
+    if DB_POOL_MODE != "queue":
+        raise ValueError(f"Unknown DB_POOL_MODE: {DB_POOL_MODE}")
+    kwargs = {
+        "poolclass": instrumented(queue_pool, name),
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+    }
+    if url.get_backend_name() != "sqlite":
+        # a local file cannot go stale; a server connection idle behind a proxy can
+        kwargs["pool_pre_ping"] = DB_POOL_PRE_PING
+    return kwargs
+
+# SQLite tuning, applied to every new connection. WAL lets readers run while a
+# writer commits and lets uvicorn workers share the file; busy_timeout makes a
+# blocked writer wait for the lock instead of failing with "database is locked".
+SQLITE_TUNING = os.getenv("SQLITE_TUNING", "true").lower() in ("1", "true", "yes")
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000")),
+    "cache_size": int(os.getenv("SQLITE_CACHE_SIZE", "-65536")),
+    "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))),
+    "temp_store": "MEMORY",
+}
+
+def apply_sqlite_tuning(target: Engine, pragmas: dict = SQLITE_PRAGMAS):
+    """Run the PRAGMAs on each connection `target` opens (sync engine, or an async engine's sync_engine)."""
+    if target.url.get_backend_name() != "sqlite" or target.url.database in (None, "", ":memory:"):
+        return
+
+    @event.listens_for(target, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+def _connect_args(url) -> dict:
+    if url.get_backend_name() == "sqlite":
+        return {"check_same_thread": False}
+    return {}
+
+def _async_url(url):
+    """The same database through its asyncio driver (aiosqlite / asyncpg)."""
+    url = make_url(url)
+    backend = url.get_backend_name()
+    if backend == "sqlite":
+        return url.set(drivername="sqlite+aiosqlite")
+    if backend == "postgresql":
+        query = dict(url.query)
+        # asyncpg spells libpq's sslmode as ssl
+        if "sslmode" in query:
+            query["ssl"] = query.pop("sslmode")
+        return url.set(drivername="postgresql+asyncpg", query=query)
+    raise ValueError(f"No async driver configured for {backend}")
+
+_sync_url = make_url(db_url)
+engine = create_engine(
+    _sync_url,
+    echo=False,
+    connect_args=_connect_args(_sync_url),
+    **_pool_kwargs(_sync_url, QueuePool, "sync"),
+)
+track_usage(engine.pool)
+
+if SQLITE_TUNING:
+    apply_sqlite_tuning(engine)
+
+_async_engine: Optional[AsyncEngine] = None
+_async_engine_lock = threading.Lock()
+
+def get_async_engine() -> AsyncEngine:
+    """The async engine, created on first use so that a database without an
+    async driver only breaks the async routes, not the whole app at import."""
+    global _async_engine
+    with _async_engine_lock:
+        if _async_engine is None:
+            try:
+                url = _async_url(_sync_url)
+            except ValueError as e:
+                raise RuntimeError(f"Async database access is unavailable for {_sync_url.get_backend_name()}: {e}") from e
+            _async_engine = create_async_engine(
+                url,
+                echo=False,
+                connect_args=_connect_args(url),
+                **_pool_kwargs(url, AsyncAdaptedQueuePool, "async"),
+            )
+            track_usage(_async_engine.sync_engine.pool)
+            if SQLITE_TUNING:
+                apply_sqlite_tuning(_async_engine.sync_engine)
+        return _async_engine
 
 def _get_raw_db_path():
     if "sqlite" in str(engine.url):
@@ -54,11 +163,51 @@ def _migrate_columns():
     conn.commit()
     conn.close()
 
+def _normalize_transaction_dates():
+    """transactions.date is a DATE now; trim legacy free-form text so it parses (see revision 9d2f4a6c8e13)."""
+    db_path = _get_raw_db_path()
+    if not db_path or not os.path.exists(db_path):
+        return
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    try:
+        cursor.execute("UPDATE transactions SET date = substr(trim(date), 1, 10) WHERE length(date) != 10")
+        cursor.execute("UPDATE transactions SET date = '1970-01-01' WHERE date(date) IS NULL")
+        if cursor.rowcount:
+            print(f"[MIGRATION] Reset {cursor.rowcount} unparsable transaction dates")
+    except sqlite3.OperationalError:
+        pass
+    conn.commit()
+    conn.close()
+
+def _migrate_indexes():
+    """Create indexes declared on tables that already existed (create_all skips them)."""
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+def _backfill_ledger():
+    """Summaries for users whose transactions predate the ledger tables."""
+    from app.repositories.ledger_repository import LedgerRepository
+    with Session(engine) as session:
+        count = LedgerRepository(session).backfill()
+    if count:
+        print(f"[MIGRATION] Built ledger summaries for {count} users")
+
 def init_db():
     import app.models.domain  # noqa: F401
     SQLModel.metadata.create_all(engine)
     _migrate_columns()
+    _normalize_transaction_dates()
+    _migrate_indexes()
+    _backfill_ledger()
 
 def get_session():
     with Session(engine) as session:
         yield session
+
+async def get_async_session():
+    """For async def handlers: queries are awaited instead of blocking the event loop."""
+    async with AsyncSession(get_async_engine(), expire_on_commit=False) as session:
+        yield session
@@ -1,4 +1,6 @@
+import datetime
 from typing import Optional, List
+from sqlalchemy import Index, UniqueConstraint
 from sqlmodel import Field, SQLModel, Relationship
 
 class User(SQLModel, table=True):
@@ -20,12 +22,24 @@ class User(SQLModel, table=True):
 
 class Transaction(SQLModel, table=True):
     __tablename__ = "transactions"
+    __table_args__ = (
+        # History listing / year / date-range scans: user_id = ? ORDER BY date, id
+        Index("ix_transactions_user_date", "user_id", "date", "id"),
+        # Analytics filters on type as well and only reads amount/category
+        Index(
+            "ix_transactions_user_type_date",
+            "user_id",
+            "type",
+            "date",
+            postgresql_include=["amount", "category"],
+        ),
+    )
     id: Optional[int] = Field(default=None, primary_key=True)
     label: str
     amount: float
     type: str
     category: str
-    date: str
+    date: datetime.date
     user_id: Optional[int] = Field(default=None, foreign_key="users.id")
 
     user: Optional[User] = Relationship(back_populates="transactions")
@@ -38,7 +52,7 @@ class PantryItem(SQLModel, table=True):
     category: str
     expiry: Optional[str] = None
     added_date: str
-    user_id: Optional[int] = Field(default=None, foreign_key="users.id")
+    user_id: Optional[int] = Field(default=None, foreign_key="users.id", index=True)
 
     user: Optional[User] = Relationship(back_populates="pantry_items")
 
@@ -49,7 +63,7 @@ class RecurringItem(SQLModel, table=True):
     amount: float
     day: int
     type: str
-    user_id: Optional[int] = Field(default=None, foreign_key="users.id")
+    user_id: Optional[int] = Field(default=None, foreign_key="users.id", index=True)
 
     user: Optional[User] = Relationship(back_populates="recurring_items")
 
@@ -61,7 +75,7 @@ class Goal(SQLModel, table=True):
     saved: float
     deadline: str
     priority: str
-    user_id: Optional[int] = Field(default=None, foreign_key="users.id")
+    user_id: Optional[int] = Field(default=None, foreign_key="users.id", index=True)
 
     user: Optional[User] = Relationship(back_populates="goals")
 
@@ -84,7 +98,7 @@ class Plan(SQLModel, table=True):
     name: str
     content_json: str
     created_at: str
-    user_id: Optional[int] = Field(default=None, foreign_key="users.id")
+    user_id: Optional[int] = Field(default=None, foreign_key="users.id", index=True)
 
     user: Optional[User] = Relationship(back_populates="plans")
 
@@ -93,7 +107,7 @@ class BudgetLimit(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     category: str
     amount: float
-    user_id: Optional[int] = Field(default=None, foreign_key="users.id")
+    user_id: Optional[int] = Field(default=None, foreign_key="users.id", index=True)
 
     user: Optional[User] = Relationship(back_populates="budget_limits")
 
@@ -116,6 +130,43 @@ class FuelEntry(SQLModel, table=True):
     station: Optional[str] = None
     is_full_tank: bool = Field(default=True)
     note: Optional[str] = None
-    user_id: Optional[int] = Field(default=None, foreign_key="users.id")
+    user_id: Optional[int] = Field(default=None, foreign_key="users.id", index=True)
 
     user: Optional[User] = Relationship(back_populates="fuel_entries")
+
+class LedgerSummary(SQLModel, table=True):
+    __tablename__ = "ledger_summary"
+    id: Optional[int] = Field(default=None, primary_key=True)
+    balance: float = Field(default=0.0)
+    tx_count: int = Field(default=0)
+    user_id: Optional[int] = Field(default=None, foreign_key="users.id", unique=True)
+
+class LedgerMonth(SQLModel, table=True):
+    __tablename__ = "ledger_months"
+    __table_args__ = (UniqueConstraint("user_id", "month"),)
+    id: Optional[int] = Field(default=None, primary_key=True)
+    month: str
+    income: float = Field(default=0.0)
+    expense: float = Field(default=0.0)
+    user_id: Optional[int] = Field(default=None, foreign_key="users.id")
+
+class LedgerCategory(SQLModel, table=True):
+    __tablename__ = "ledger_categories"
+    __table_args__ = (UniqueConstraint("user_id", "category"),)
+    id: Optional[int] = Field(default=None, primary_key=True)
+    category: str
+    expense: float = Field(default=0.0)
+    user_id: Optional[int] = Field(default=None, foreign_key="users.id")
+
+class AuditResult(SQLModel, table=True):
+    """Last AI audit of a month; reused while the hash of its input still matches."""
+    __tablename__ = "audit_results"
+    __table_args__ = (UniqueConstraint("user_id", "year", "month", "language"),)
+    id: Optional[int] = Field(default=None, primary_key=True)
+    year: int
+    month: int
+    language: str
+    data_hash: str
+    analysis_json: str
+    created_at: str
+    user_id: Optional[int] = Field(default=None, foreign_key="users.id")
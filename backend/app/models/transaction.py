@@ -1,9 +1,9 @@
-from pydantic import BaseModel
-from datetime import date
+import datetime
+from pydantic import BaseModel, Field
 
 class Transaction(BaseModel):
     label: str
     amount: float
     type: str
     category: str = "Autre"
-    date: str = str(date.today())
+    date: datetime.date = Field(default_factory=datetime.date.today)
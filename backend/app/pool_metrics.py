@@ -0,0 +1,81 @@
+import threading
+import time
+from collections import deque
+from typing import Dict
+from sqlalchemy import event, exc
+from sqlalchemy.pool import Pool
+
+class PoolMetrics:
+    """Checkout latency and usage counters for one engine's connection pool."""
+
+    def __init__(self, name: str, window: int = 1024):
+        self.name = name
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=window)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.in_use = 0
+        self.max_in_use = 0
+        self.max_wait = 0.0
+
+    def record_wait(self, seconds: float, timed_out: bool = False):
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+                self._latencies.append(seconds)
+            self.max_wait = max(self.max_wait, seconds)
+
+    def checked_out(self):
+        with self._lock:
+            self.in_use += 1
+            self.max_in_use = max(self.max_in_use, self.in_use)
+
+    def checked_in(self):
+        with self._lock:
+            self.in_use -= 1
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            ordered = sorted(self._latencies)
+            count = len(ordered)
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "in_use": self.in_use,
+                "max_in_use": self.max_in_use,
+                "wait_ms_p50": round(ordered[count // 2] * 1000, 3) if count else 0.0,
+                "wait_ms_p99": round(ordered[min(count - 1, int(count * 0.99))] * 1000, 3) if count else 0.0,
+                "wait_ms_max": round(self.max_wait * 1000, 3),
+            }
+
+pool_metrics: Dict[str, PoolMetrics] = {}
+
+def instrumented(pool_class: type, name: str) -> type:
+    """Subclass `pool_class` so every checkout reports how long it waited.
+
+    The wait covers queueing for a free connection and opening a new one, which
+    is what a request actually pays; in-use counts come from pool events.
+    """
+    metrics = pool_metrics.setdefault(name, PoolMetrics(name))
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            conn = pool_class._do_get(self)
+        except exc.TimeoutError:
+            metrics.record_wait(time.perf_counter() - started, timed_out=True)
+            raise
+        metrics.record_wait(time.perf_counter() - started)
+        return conn
+
+    return type(f"Instrumented{pool_class.__name__}", (pool_class,), {"_do_get": _do_get, "metrics": metrics})
+
+def track_usage(pool: Pool):
+    metrics = type(pool).metrics
+    event.listen(pool, "checkout", lambda *args: metrics.checked_out())
+    event.listen(pool, "checkin", lambda *args: metrics.checked_in())
+
+def snapshot() -> Dict[str, Dict]:
+    return {name: metrics.snapshot() for name, metrics in pool_metrics.items()}
@@ -8,6 +8,8 @@ from .plans_repository import PlansRepository
 from .budget_repository import BudgetRepository
 from .user_repository import UserRepository
 from .fuel_repository import FuelRepository
+from .ledger_repository import LedgerRepository, LedgerDelta
+from .audit_repository import AuditRepository
 
 __all__ = [
     "BaseRepository",
@@ -20,4 +22,7 @@ __all__ = [
     "BudgetRepository",
     "UserRepository",
     "FuelRepository",
+    "LedgerRepository",
+    "LedgerDelta",
+    "AuditRepository",
 ]
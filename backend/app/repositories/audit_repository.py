@@ -0,0 +1,91 @@
+import json
+from datetime import datetime, timezone
+from typing import List, Optional
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import select
+from app.repositories.base import BaseRepository
+from app.repositories.ledger_repository import UPSERT_INSERTS
+from app.models.domain import AuditResult
+
+class AuditRepository(BaseRepository):
+    """Stored monthly audits, written with save(). They are derived data, so
+    unlike create() it skips _mark_changed(): storing an audit must not
+    invalidate the user's caches and ETags."""
+
+    def _find(self, year: int, month: int, language: str, user_id: int) -> Optional[AuditResult]:
+        return self.session.exec(
+            select(AuditResult).where(
+                AuditResult.user_id == user_id,
+                AuditResult.year == year,
+                AuditResult.month == month,
+                AuditResult.language == language,
+            )
+        ).first()
+
+    def _do_create(self, audit: dict, user_id: int) -> int:
+        return self.save(audit["year"], audit["month"], audit["language"], audit["data_hash"], audit["analysis"], user_id)
+
+    def get_by_id(self, id: int, user_id: int) -> Optional[dict]:
+        db_audit = self.session.exec(select(AuditResult).where(AuditResult.id == id, AuditResult.user_id == user_id)).first()
+        return self._row_to_dict(db_audit)
+
+    def get_all(self, user_id: int) -> List[dict]:
+        db_audits = self.session.exec(
+            select(AuditResult).where(AuditResult.user_id == user_id).order_by(AuditResult.year.desc(), AuditResult.month.desc())
+        ).all()
+        return self._rows_to_dicts(db_audits)
+
+    def delete(self, id: int, user_id: int) -> bool:
+        db_audit = self.session.exec(select(AuditResult).where(AuditResult.id == id, AuditResult.user_id == user_id)).first()
+        if not db_audit:
+            return False
+        self.session.delete(db_audit)
+        self.session.commit()
+        return True
+
+    def get_analysis(self, year: int, month: int, language: str, data_hash: str, user_id: int) -> Optional[dict]:
+        """The stored analysis, or None when missing or computed from other data."""
+        db_audit = self._find(year, month, language, user_id)
+        if not db_audit or db_audit.data_hash != data_hash:
+            return None
+        return json.loads(db_audit.analysis_json)
+
+    def save(self, year: int, month: int, language: str, data_hash: str, analysis: dict, user_id: int) -> int:
+        """Store the analysis, replacing the month's previous (stale) one.
+
+        One INSERT ... ON CONFLICT DO UPDATE on SQLite and PostgreSQL, so two
+        audits of the same month finishing together both succeed (last wins).
+        """
+        keys = {"user_id": user_id, "year": year, "month": month, "language": language}
+        values = {
+            "data_hash": data_hash,
+            "analysis_json": json.dumps(analysis),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        }
+        insert = UPSERT_INSERTS.get(self.session.get_bind().dialect.name)
+        if insert is None:
+            return self._save_fallback(keys, values)
+
+        stmt = insert(AuditResult).values(**keys, **values)
+        audit_id = self.session.exec(
+            stmt.on_conflict_do_update(
+                index_elements=list(keys),
+                set_={k: getattr(stmt.excluded, k) for k in values},
+            ).returning(AuditResult.id)
+        ).scalar_one()
+        self.session.commit()
+        return audit_id
+
+    def _save_fallback(self, keys: dict, values: dict) -> int:
+        for _ in range(2):
+            db_audit = self._find(keys["year"], keys["month"], keys["language"], keys["user_id"]) or AuditResult(**keys)
+            for name, value in values.items():
+                setattr(db_audit, name, value)
+            self.session.add(db_audit)
+            try:
+                self.session.commit()
+                return db_audit.id
+            except IntegrityError:
+                # a concurrent save inserted the row first: update it instead
+                self.session.rollback()
+        raise RuntimeError("Could not store the audit")
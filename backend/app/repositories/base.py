@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from sqlmodel import Session
 from typing import List, Optional, Any
+from app.core.cache import invalidate_user
 
 class BaseRepository(ABC):
     def __init__(self, session: Session):
@@ -24,6 +25,7 @@ class BaseRepository(ABC):
         self._validate_before_create(entity, user_id)
         entity_id = self._do_create(entity, user_id)
         self._after_create(entity_id, entity, user_id)
+        self._mark_changed(user_id)
         return entity_id
 
     @abstractmethod
@@ -36,6 +38,10 @@ class BaseRepository(ABC):
     def _after_create(self, entity_id: int, entity: Any, user_id: int):
         pass
 
+    def _mark_changed(self, user_id: Optional[int]):
+        """Call after every committed write so per-user caches stop serving old data."""
+        invalidate_user(user_id)
+
     @abstractmethod
     def delete(self, id: int, user_id: int) -> bool:
         pass
@@ -35,6 +35,7 @@ class BudgetRepository(BaseRepository):
         db_budget.amount = budget.amount
         self.session.add(db_budget)
         self.session.commit()
+        self._mark_changed(user_id)
         return True
 
     def delete(self, id: int, user_id: int) -> bool:
@@ -43,4 +44,5 @@ class BudgetRepository(BaseRepository):
             return False
         self.session.delete(db_budget)
         self.session.commit()
+        self._mark_changed(user_id)
         return True
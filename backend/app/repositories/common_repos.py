@@ -1,5 +1,5 @@
 from app.repositories.base import BaseRepository
-from sqlmodel import select
+from sqlmodel import select, func
 from app.models.domain import PantryItem, RecurringItem, Goal
 from typing import List, Optional
 
@@ -26,12 +26,16 @@ class PantryRepository(BaseRepository):
         db_items = self.session.exec(select(PantryItem).where(PantryItem.user_id == user_id).order_by(PantryItem.expiry.asc())).all()
         return self._rows_to_dicts(db_items)
 
+    def count(self, user_id: int) -> int:
+        return self.session.exec(select(func.count(PantryItem.id)).where(PantryItem.user_id == user_id)).one()
+
     def delete(self, id: int, user_id: int) -> bool:
         db_item = self.session.exec(select(PantryItem).where(PantryItem.id == id, PantryItem.user_id == user_id)).first()
         if not db_item:
             return False
         self.session.delete(db_item)
         self.session.commit()
+        self._mark_changed(user_id)
         return True
 
     def update(self, id: int, item_data, user_id: int) -> bool:
@@ -45,6 +49,7 @@ class PantryRepository(BaseRepository):
         db_item.added_date = item_data.added_date
         self.session.add(db_item)
         self.session.commit()
+        self._mark_changed(user_id)
         return True
 
 class RecurringRepository(BaseRepository):
@@ -75,6 +80,7 @@ class RecurringRepository(BaseRepository):
             return False
         self.session.delete(db_rec)
         self.session.commit()
+        self._mark_changed(user_id)
         return True
 
     def update(self, id: int, recurring_data, user_id: int) -> bool:
@@ -87,6 +93,7 @@ class RecurringRepository(BaseRepository):
         db_rec.type = recurring_data.type
         self.session.add(db_rec)
         self.session.commit()
+        self._mark_changed(user_id)
         return True
 
 class GoalsRepository(BaseRepository):
@@ -121,6 +128,7 @@ class GoalsRepository(BaseRepository):
             return False
         self.session.delete(db_goal)
         self.session.commit()
+        self._mark_changed(user_id)
         return True
 
     def update(self, id: int, goal_data, user_id: int) -> bool:
@@ -136,4 +144,5 @@ class GoalsRepository(BaseRepository):
             
         self.session.add(db_goal)
         self.session.commit()
+        self._mark_changed(user_id)
         return True
@@ -41,6 +41,7 @@ class FuelRepository(BaseRepository):
             return False
         self.session.delete(db_entry)
         self.session.commit()
+        self._mark_changed(user_id)
         return True
 
     def update(self, id: int, entry_data, user_id: int) -> bool:
@@ -59,6 +60,7 @@ class FuelRepository(BaseRepository):
         db_entry.note = entry_data.note
         self.session.add(db_entry)
         self.session.commit()
+        self._mark_changed(user_id)
         return True
 
     def get_stats(self, user_id: int) -> dict:
@@ -0,0 +1,159 @@
+from app.models.domain import Transaction, LedgerSummary, LedgerMonth, LedgerCategory
+from sqlalchemy import extract
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlmodel import Session, select, update, delete, func
+from typing import Dict, List
+
+UPSERT_INSERTS = {"sqlite": sqlite_insert, "postgresql": pg_insert}
+
+class LedgerDelta:
+    """Net effect of a group of transactions on one user's ledger rows."""
+
+    def __init__(self):
+        self.balance = 0.0
+        self.tx_count = 0
+        self.months: Dict[str, List[float]] = {}
+        self.categories: Dict[str, float] = {}
+
+    def add(self, tx, sign: int = 1):
+        amount = tx.amount * sign
+        month = self.months.setdefault(str(tx.date)[:7], [0.0, 0.0])
+        self.tx_count += sign
+        if tx.type == "revenu":
+            self.balance += amount
+            month[0] += amount
+        else:
+            self.balance -= amount
+            month[1] += amount
+        if tx.type == "depense":
+            self.categories[tx.category] = self.categories.get(tx.category, 0.0) + amount
+
+class LedgerRepository:
+    """Per-user running totals kept in sync by TransactionRepository writes.
+
+    Callers own the transaction: apply methods only stage changes on the
+    session, the surrounding repository commits them together with the
+    transaction row so the summary never drifts from the ledger. Users
+    without summary rows simply have no history yet; backfill() covers data
+    written before the ledger existed.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def backfill(self) -> int:
+        """Build the summary of every user who has transactions but no summary
+        yet (data from before the ledger existed). Run at startup by init_db,
+        never on the request path: rebuilding races with concurrent writes."""
+        user_ids = self.session.exec(
+            select(Transaction.user_id)
+            .where(Transaction.user_id.not_in(select(LedgerSummary.user_id).where(LedgerSummary.user_id.is_not(None))))
+            .distinct()
+        ).all()
+        for user_id in user_ids:
+            self.rebuild(user_id)
+        self.session.commit()
+        return len(user_ids)
+
+    def rebuild(self, user_id: int):
+        for model in (LedgerSummary, LedgerMonth, LedgerCategory):
+            self.session.exec(delete(model).where(model.user_id == user_id))
+
+        year_col = extract("year", Transaction.date)
+        month_col = extract("month", Transaction.date)
+        month_rows = self.session.exec(
+            select(year_col, month_col, Transaction.type, func.sum(Transaction.amount), func.count(Transaction.id))
+            .where(Transaction.user_id == user_id)
+            .group_by(year_col, month_col, Transaction.type)
+        ).all()
+
+        balance = 0.0
+        tx_count = 0
+        months: Dict[str, LedgerMonth] = {}
+        for year, month_num, tx_type, total, count in month_rows:
+            month = f"{int(year):04d}-{int(month_num):02d}"
+            row = months.setdefault(month, LedgerMonth(month=month, user_id=user_id))
+            if tx_type == "revenu":
+                row.income += total
+                balance += total
+            else:
+                row.expense += total
+                balance -= total
+            tx_count += count
+
+        cat_rows = self.session.exec(
+            select(Transaction.category, func.sum(Transaction.amount))
+            .where(Transaction.user_id == user_id, Transaction.type == "depense")
+            .group_by(Transaction.category)
+        ).all()
+
+        self.session.add(LedgerSummary(balance=balance, tx_count=tx_count, user_id=user_id))
+        self.session.add_all(months.values())
+        self.session.add_all(
+            LedgerCategory(category=category, expense=total, user_id=user_id)
+            for category, total in cat_rows
+        )
+
+    def apply(self, tx, user_id: int, sign: int = 1):
+        """Add (sign=1) or remove (sign=-1) a transaction's contribution to the totals."""
+        delta = LedgerDelta()
+        delta.add(tx, sign)
+        self.apply_delta(delta, user_id)
+
+    def _increment(self, model, keys: Dict, increments: Dict):
+        """Add `increments` to the row identified by `keys`, creating it if needed.
+
+        One INSERT ... ON CONFLICT DO UPDATE on SQLite and PostgreSQL, so two
+        first writes for the same month or category can't both insert.
+        """
+        insert = UPSERT_INSERTS.get(self.session.get_bind().dialect.name)
+        if insert is None:
+            result = self.session.exec(
+                update(model)
+                .where(*(getattr(model, k) == v for k, v in keys.items()))
+                .values({k: getattr(model, k) + v for k, v in increments.items()})
+            )
+            if result.rowcount == 0:
+                self.session.add(model(**keys, **increments))
+            return
+
+        stmt = insert(model).values(**keys, **increments)
+        self.session.exec(
+            stmt.on_conflict_do_update(
+                index_elements=list(keys),
+                set_={k: getattr(model, k) + getattr(stmt.excluded, k) for k in increments},
+            )
+        )
+
+    def apply_delta(self, delta: "LedgerDelta", user_id: int):
+        """Stage the accumulated totals of many transactions with one upsert per touched row."""
+        if not delta.tx_count and not delta.months:
+            return
+
+        self._increment(LedgerSummary, {"user_id": user_id}, {"balance": delta.balance, "tx_count": delta.tx_count})
+        for month, (income, expense) in delta.months.items():
+            self._increment(LedgerMonth, {"user_id": user_id, "month": month}, {"income": income, "expense": expense})
+        for category, expense in delta.categories.items():
+            self._increment(LedgerCategory, {"user_id": user_id, "category": category}, {"expense": expense})
+
+    def get_balance(self, user_id: int) -> float:
+        balance = self.session.exec(select(LedgerSummary.balance).where(LedgerSummary.user_id == user_id)).first()
+        return balance or 0.0
+
+    def get_summary(self, user_id: int, month: str) -> Dict:
+        """Balance, the given month's income/expense and all-time spending per category."""
+        balance = self.session.exec(select(LedgerSummary.balance).where(LedgerSummary.user_id == user_id)).first()
+        month_row = self.session.exec(
+            select(LedgerMonth).where(LedgerMonth.user_id == user_id, LedgerMonth.month == month)
+        ).first()
+        cat_rows = self.session.exec(
+            select(LedgerCategory.category, LedgerCategory.expense).where(LedgerCategory.user_id == user_id)
+        ).all()
+
+        return {
+            "balance": balance or 0.0,
+            "income": month_row.income if month_row else 0.0,
+            "expense": month_row.expense if month_row else 0.0,
+            "categories": {category: expense for category, expense in cat_rows if round(expense, 2)},
+        }
@@ -31,4 +31,5 @@ class PlansRepository(BaseRepository):
             return False
         self.session.delete(db_plan)
         self.session.commit()
+        self._mark_changed(user_id)
         return True
@@ -37,6 +37,7 @@ class ProfileRepository(BaseRepository):
         db_profile.active_theme = profile.active_theme
         self.session.add(db_profile)
         self.session.commit()
+        self._mark_changed(user_id)
         return True
 
     def update_theme(self, theme: str, user_id: int) -> bool:
@@ -46,6 +47,7 @@ class ProfileRepository(BaseRepository):
         db_profile.active_theme = theme
         self.session.add(db_profile)
         self.session.commit()
+        self._mark_changed(user_id)
         return True
 
     def unlock_theme(self, theme: str, user_id: int) -> bool:
@@ -58,6 +60,7 @@ class ProfileRepository(BaseRepository):
             db_profile.unlocked_themes = ",".join(unlocked)
             self.session.add(db_profile)
             self.session.commit()
+            self._mark_changed(user_id)
             return True
         return False
 
@@ -67,4 +70,5 @@ class ProfileRepository(BaseRepository):
             return False
         self.session.delete(db_profile)
         self.session.commit()
+        self._mark_changed(user_id)
         return True
@@ -1,9 +1,21 @@
 from app.repositories.base import BaseRepository
+from app.repositories.ledger_repository import LedgerRepository, LedgerDelta
 from app.models.domain import Transaction
-from sqlmodel import select
-from typing import List, Optional
+from app.core.dates import DateLike, year_range, inclusive_range
+from sqlalchemy import case, extract, insert, tuple_
+from sqlmodel import Session, select, func
+from datetime import date
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
 
 class TransactionRepository(BaseRepository):
+    def __init__(self, session: Session):
+        super().__init__(session)
+        self.ledger = LedgerRepository(session)
+
     def _do_create(self, tx_data, user_id: int) -> int:
         db_tx = Transaction(
             label=tx_data.label,
@@ -14,10 +26,54 @@ class TransactionRepository(BaseRepository):
             user_id=user_id
         )
         self.session.add(db_tx)
+        self.ledger.apply(db_tx, user_id)
         self.session.commit()
-        self.session.refresh(db_tx)
         return db_tx.id
 
+    def bulk_create(self, transactions: Iterable, user_id: int, batch_size: int = 1000) -> int:
+        """Insert already-validated transactions with one executemany per batch,
+        folding each batch into the ledger with a single delta.
+
+        Consumes `transactions` lazily, so a streaming parser never has more
+        than one batch in memory. Everything lands in one transaction: if the
+        input fails halfway nothing is kept, and the import can simply be
+        retried. Returns the number of rows inserted.
+        """
+        rows = iter(transactions)
+        inserted = 0
+        try:
+            while True:
+                batch = list(islice(rows, batch_size))
+                if not batch:
+                    break
+                delta = LedgerDelta()
+                for tx in batch:
+                    delta.add(tx)
+                self.session.exec(
+                    insert(Transaction),
+                    params=[
+                        {
+                            "label": tx.label,
+                            "amount": tx.amount,
+                            "type": tx.type,
+                            "category": tx.category,
+                            "date": tx.date,
+                            "user_id": user_id,
+                        }
+                        for tx in batch
+                    ],
+                )
+                self.ledger.apply_delta(delta, user_id)
+                inserted += len(batch)
+            self.session.commit()
+        except BaseException:
+            self.session.rollback()
+            raise
+        if inserted:
+            logger.info(f"Imported {inserted} transactions for user {user_id}")
+            self._mark_changed(user_id)
+        return inserted
+
     def _validate_before_create(self, tx, user_id: int):
         if tx.amount <= 0:
             raise ValueError("Transaction amount must be positive")
@@ -25,7 +81,7 @@ class TransactionRepository(BaseRepository):
             raise ValueError("Transaction label is required")
 
     def _after_create(self, entity_id: int, tx, user_id: int):
-        print(f"Transaction {entity_id} created for user {user_id}")
+        logger.debug(f"Transaction {entity_id} created for user {user_id}")
 
     def get_by_id(self, id: int, user_id: int) -> Optional[dict]:
         db_tx = self.session.exec(select(Transaction).where(Transaction.id == id, Transaction.user_id == user_id)).first()
@@ -39,27 +95,95 @@ class TransactionRepository(BaseRepository):
         db_tx = self.session.exec(select(Transaction).where(Transaction.id == id, Transaction.user_id == user_id)).first()
         if not db_tx:
             return False
+        self.ledger.apply(db_tx, user_id, sign=-1)
         self.session.delete(db_tx)
         self.session.commit()
+        self._mark_changed(user_id)
         return True
 
     def update(self, id: int, tx, user_id: int) -> bool:
         db_tx = self.session.exec(select(Transaction).where(Transaction.id == id, Transaction.user_id == user_id)).first()
         if not db_tx:
             return False
+        self.ledger.apply(db_tx, user_id, sign=-1)
         db_tx.label = tx.label
         db_tx.amount = tx.amount
         db_tx.type = tx.type
         db_tx.category = tx.category
         db_tx.date = tx.date
         self.session.add(db_tx)
+        self.ledger.apply(db_tx, user_id)
         self.session.commit()
+        self._mark_changed(user_id)
         return True
 
+    def get_page(
+        self,
+        user_id: int,
+        limit: int,
+        after: Optional[Tuple[date, int]] = None,
+        tx_type: Optional[str] = None,
+        category: Optional[str] = None,
+        start_date: Optional[DateLike] = None,
+        end_date: Optional[DateLike] = None,
+    ) -> Tuple[List[dict], bool]:
+        """Keyset page ordered by (date, id) descending; returns the rows and whether more follow."""
+        query = select(Transaction).where(Transaction.user_id == user_id)
+        if tx_type:
+            query = query.where(Transaction.type == tx_type)
+        if category:
+            query = query.where(Transaction.category == category)
+        if start_date:
+            query = query.where(Transaction.date >= start_date)
+        if end_date:
+            query = query.where(Transaction.date < inclusive_range(end_date, end_date)[1])
+        if after:
+            query = query.where(tuple_(Transaction.date, Transaction.id) < tuple_(*after))
+
+        db_txs = self.session.exec(
+            query.order_by(Transaction.date.desc(), Transaction.id.desc()).limit(limit + 1)
+        ).all()
+        return self._rows_to_dicts(db_txs[:limit]), len(db_txs) > limit
+
     def get_by_year(self, year: str, user_id: int) -> List[dict]:
-        db_txs = self.session.exec(select(Transaction).where(Transaction.date.startswith(year), Transaction.user_id == user_id).order_by(Transaction.date.desc())).all()
+        start, end = year_range(year)
+        db_txs = self.session.exec(select(Transaction).where(Transaction.user_id == user_id, Transaction.date >= start, Transaction.date < end).order_by(Transaction.date.desc())).all()
         return self._rows_to_dicts(db_txs)
 
-    def get_by_date_range(self, start_date: str, end_date: str, user_id: int) -> List[dict]:
-        db_txs = self.session.exec(select(Transaction).where(Transaction.date >= start_date, Transaction.date <= end_date, Transaction.user_id == user_id).order_by(Transaction.date.desc())).all()
+    def get_years(self, user_id: int) -> List[str]:
+        year_col = extract("year", Transaction.date)
+        rows = self.session.exec(
+            select(year_col).where(Transaction.user_id == user_id).distinct().order_by(year_col.desc())
+        ).all()
+        return [str(int(year)) for year in rows]
+
+    def get_monthly_totals(self, year: str, user_id: int) -> Dict[int, Dict[str, float]]:
+        """Income/expense per month of the year, aggregated in SQL: at most 24 rows come back."""
+        start, end = year_range(year)
+        month_col = extract("month", Transaction.date)
+        kind_col = case((Transaction.type == "revenu", "income"), else_="expense")
+        rows = self.session.exec(
+            select(month_col, kind_col, func.sum(Transaction.amount))
+            .where(Transaction.user_id == user_id, Transaction.date >= start, Transaction.date < end)
+            .group_by(month_col, kind_col)
+        ).all()
+
+        totals: Dict[int, Dict[str, float]] = {}
+        for month, kind, total in rows:
+            totals.setdefault(int(month), {"income": 0.0, "expense": 0.0})[kind] = total or 0.0
+        return totals
+
+    def get_by_date_range(self, start_date: DateLike, end_date: DateLike, user_id: int) -> List[dict]:
+        start, end = inclusive_range(start_date, end_date)
+        db_txs = self.session.exec(select(Transaction).where(Transaction.user_id == user_id, Transaction.date >= start, Transaction.date < end).order_by(Transaction.date.desc())).all()
         return self._rows_to_dicts(db_txs)
+
+    def _row_to_dict(self, row: Any) -> Optional[dict]:
+        # Keep the ISO string shape API consumers and the frontend rely on
+        data = super()._row_to_dict(row)
+        if data is not None:
+            data["date"] = data["date"].isoformat()
+        return data
+
+    def _rows_to_dicts(self, rows: List[Any]) -> List[dict]:
+        return [self._row_to_dict(row) for row in rows]
@@ -2,6 +2,7 @@ from app.repositories.base import BaseRepository
 from app.models.domain import User
 from sqlmodel import select
 from typing import Optional, List
+from app.core.cache import invalidate_principal
 
 class UserRepository(BaseRepository):
     def _do_create(self, user, user_id: int = None) -> int:
@@ -38,6 +39,8 @@ class UserRepository(BaseRepository):
         db_user.hashed_password = hashed_password
         self.session.add(db_user)
         self.session.commit()
+        self._mark_changed(user_id)
+        invalidate_principal(user_id)
         return True
 
     def delete(self, id: int, user_id: int = None) -> bool:
@@ -46,4 +49,6 @@ class UserRepository(BaseRepository):
             return False
         self.session.delete(db_user)
         self.session.commit()
+        self._mark_changed(id)
+        invalidate_principal(id)
         return True
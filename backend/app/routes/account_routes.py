@@ -1,10 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, Response
+from typing import Literal
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from app.database import get_session
-from sqlmodel import Session, select
-from app.auth_utils import verify_password, get_password_hash, get_current_user
-from app.models.domain import User, Profile, Transaction, PantryItem, RecurringItem, Goal, Plan, BudgetLimit, UserTheme
+from app.database import get_async_session
+from sqlalchemy import delete as sa_delete, select as sa_select
+from sqlmodel import SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.auth_utils import verify_password_async, get_password_hash_async, get_current_user
+from app.core.cache import invalidate_user, invalidate_principal
+from app.models.domain import User, Profile, Transaction, PantryItem, RecurringItem, Goal, Plan
 import json
+import zlib
 
 router = APIRouter(prefix="/account", tags=["account"])
 
@@ -12,80 +18,126 @@ class PasswordChangeRequest(BaseModel):
     old_password: str
     new_password: str
 
+EXPORT_TABLES = {
+    "profile": Profile,
+    "transactions": Transaction,
+    "pantry": PantryItem,
+    "recurring": RecurringItem,
+    "goals": Goal,
+    "plans": Plan,
+}
+EXPORT_BATCH_SIZE = 500
+
+def _dumps(value) -> str:
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+async def _stream_rows(session: AsyncSession, model, user_id: int):
+    """Rows as plain dicts, fetched EXPORT_BATCH_SIZE at a time through a server-side cursor."""
+    table = model.__table__
+    result = await session.stream(
+        sa_select(table).where(table.c.user_id == user_id).execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+    async for partition in result.mappings().partitions():
+        for row in partition:
+            yield dict(row)
+
+async def _export_json(session: AsyncSession, user: dict):
+    yield '{\n  "user": ' + _dumps(user)
+    for name, model in EXPORT_TABLES.items():
+        yield f',\n  "{name}": ['
+        separator = "\n    "
+        async for row in _stream_rows(session, model, user["id"]):
+            yield separator + _dumps(row)
+            separator = ",\n    "
+        yield "\n  ]" if separator != "\n    " else "]"
+    yield "\n}\n"
+
+async def _export_ndjson(session: AsyncSession, user: dict):
+    yield _dumps({"table": "user", "data": user}) + "\n"
+    for name, model in EXPORT_TABLES.items():
+        async for row in _stream_rows(session, model, user["id"]):
+            yield _dumps({"table": name, "data": row}) + "\n"
+
+async def _gzipped(chunks):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31: gzip container
+    buffer = []
+    size = 0
+    async for chunk in chunks:
+        data = chunk.encode("utf-8")
+        buffer.append(data)
+        size += len(data)
+        if size >= 64 * 1024:
+            out = compressor.compress(b"".join(buffer))
+            buffer, size = [], 0
+            if out:
+                yield out
+    yield compressor.compress(b"".join(buffer)) + compressor.flush()
+
 @router.get("/export")
-async def export_data(current_user: dict = Depends(get_current_user), session: Session = Depends(get_session)):
-    user_id = current_user["id"]
+async def export_data(
+    format: Literal["json", "ndjson"] = "json",
+    gzip: bool = False,
+    current_user: dict = Depends(get_current_user),
+    # request-scoped (FastAPI's default): the session stays open until the stream ends
+    session: AsyncSession = Depends(get_async_session),
+):
+    user = {k: v for k, v in dict(current_user).items() if k != "hashed_password"}
+    body = _export_json(session, user) if format == "json" else _export_ndjson(session, user)
+    filename = f"hess_data_{current_user['username']}.{format}"
+    media_type = "application/json" if format == "json" else "application/x-ndjson"
+
+    if gzip:
+        body = _gzipped(body)
+        filename += ".gz"
+        media_type = "application/gzip"
 
-    def fetch_table(model_class):
-        try:
-            rows = session.exec(select(model_class).where(model_class.user_id == user_id)).all()
-            return [row.model_dump() for row in rows]
-        except Exception:
-            return []
-
-    data = {
-        "user": {k: v for k, v in dict(current_user).items() if k != "hashed_password"},
-        "profile": fetch_table(Profile),
-        "transactions": fetch_table(Transaction),
-        "pantry": fetch_table(PantryItem),
-        "recurring": fetch_table(RecurringItem),
-        "goals": fetch_table(Goal),
-        "plans": fetch_table(Plan),
-    }
-
-    json_str = json.dumps(data, indent=2, ensure_ascii=False)
-    return Response(
-        content=json_str,
-        media_type="application/json",
-        headers={
-            "Content-Disposition": f"attachment; filename=hess_data_{current_user['username']}.json"
-        },
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
     )
 
+def _user_owned_tables():
+    """Every table with a user_id column, children before the tables they reference."""
+    return [table for table in reversed(SQLModel.metadata.sorted_tables) if "user_id" in table.c]
+
+async def delete_user_rows(session: AsyncSession, user_id: int) -> int:
+    """One DELETE ... WHERE user_id = ? per table, then the user; the caller commits."""
+    deleted = 0
+    for table in _user_owned_tables():
+        result = await session.exec(sa_delete(table).where(table.c.user_id == user_id))
+        deleted += result.rowcount
+    result = await session.exec(sa_delete(User).where(User.id == user_id))
+    return deleted + result.rowcount
+
 @router.delete("/me")
-async def delete_account(current_user: dict = Depends(get_current_user), session: Session = Depends(get_session)):
+async def delete_account(current_user: dict = Depends(get_current_user), session: AsyncSession = Depends(get_async_session)):
     user_id = current_user["id"]
     try:
-        models = [
-            Transaction,
-            PantryItem,
-            RecurringItem,
-            Goal,
-            Profile,
-            Plan,
-            BudgetLimit,
-            UserTheme,
-        ]
-        for model in models:
-            items = session.exec(select(model).where(model.user_id == user_id)).all()
-            for item in items:
-                session.delete(item)
-
-        user = session.exec(select(User).where(User.id == user_id)).first()
-        if user:
-            session.delete(user)
-        session.commit()
+        await delete_user_rows(session, user_id)
+        await session.commit()
+        invalidate_user(user_id)
+        invalidate_principal(user_id)
     except Exception as e:
-        session.rollback()
+        await session.rollback()
         raise HTTPException(status_code=500, detail=str(e))
 
     return {"message": "Account and all data permanently deleted"}
 
 @router.put("/password")
 async def change_password(
-    req: PasswordChangeRequest, current_user: dict = Depends(get_current_user), session: Session = Depends(get_session)
+    req: PasswordChangeRequest, current_user: dict = Depends(get_current_user), session: AsyncSession = Depends(get_async_session)
 ):
     user_id = current_user["id"]
 
-    if not verify_password(req.old_password, current_user["hashed_password"]):
+    user = (await session.exec(select(User).where(User.id == user_id))).first()
+    await session.close()
+    if not user or not await verify_password_async(req.old_password, user.hashed_password):
         raise HTTPException(status_code=400, detail="Incorrect old password")
 
-    new_hash = get_password_hash(req.new_password)
-
-    user = session.exec(select(User).where(User.id == user_id)).first()
-    if user:
-        user.hashed_password = new_hash
-        session.add(user)
-        session.commit()
+    user.hashed_password = await get_password_hash_async(req.new_password)
+    session.add(user)
+    await session.commit()
+    invalidate_principal(user_id)
 
     return {"message": "Password updated successfully"}
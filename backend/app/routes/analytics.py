@@ -1,35 +1,53 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
-from google import genai
-import os
+import asyncio
+import hashlib
+from google.genai import types
+from starlette.concurrency import run_in_threadpool
 import calendar
 import logging
 import json
 from app.database import get_session
 from sqlmodel import Session, select, func
 from app.auth_utils import get_current_user
+from app.core.dependencies import get_audit_repository
+from app.core.etag import conditional_get
 from app.models.domain import Transaction, BudgetLimit
+from app.core.dates import month_range
+from app.core.responses import ORJSONResponse
+from app.repositories import AuditRepository
+from app.services import GenAIClientManager, HedgedModelCaller
+from app.services.model_hedging import audit_model_stats
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+MODELS_TO_TRY = [
+    "gemini-2.5-flash",
+    "gemini-2.0-flash",
+    "gemini-1.5-flash",
+    "gemini-flash-latest",
+]
+
 class AuditRequest(BaseModel):
     year: str
     month: str
     language: str
 
-@router.get("/analytics/monthly")
+@router.get("/analytics/monthly", dependencies=[Depends(conditional_get)])
 def get_monthly_analytics(
     year: str, month: str, current_user: dict = Depends(get_current_user), session: Session = Depends(get_session)
 ):
-    m_str = month.zfill(2)
-    month_prefix = f"{year}-{m_str}"
+    return ORJSONResponse(monthly_analytics(year, month, current_user, session))
 
+def monthly_analytics(year: str, month: str, current_user: dict, session: Session) -> dict:
     try:
-        num_days = calendar.monthrange(int(year), int(month))[1]
+        month_start, month_end = month_range(year, month)
     except ValueError:
-        num_days = 30
+        raise HTTPException(status_code=400, detail="Invalid year or month")
+    num_days = calendar.monthrange(month_start.year, month_start.month)[1]
+    in_month = (Transaction.date >= month_start, Transaction.date < month_end)
 
     # Single query: group by date and type for the whole month
     daily_rows = session.exec(
@@ -38,18 +56,15 @@ def get_monthly_analytics(
             Transaction.type,
             func.sum(Transaction.amount).label("total")
         ).where(
-            Transaction.date.startswith(month_prefix),
-            Transaction.user_id == current_user["id"]
+            Transaction.user_id == current_user["id"],
+            *in_month,
         ).group_by(Transaction.date, Transaction.type)
     ).all()
 
     # Build a lookup dict: {day_number: {"income": x, "expense": y}}
     daily_lookup = {}
     for row in daily_rows:
-        try:
-            day_num = int(row.date.split("-")[2])
-        except (IndexError, ValueError):
-            continue
+        day_num = row.date.day
         if day_num not in daily_lookup:
             daily_lookup[day_num] = {"income": 0.0, "expense": 0.0}
         if row.type == "revenu":
@@ -68,9 +83,9 @@ def get_monthly_analytics(
             Transaction.category,
             func.sum(Transaction.amount).label("total")
         ).where(
+            Transaction.user_id == current_user["id"],
             Transaction.type == "depense",
-            Transaction.date.startswith(month_prefix),
-            Transaction.user_id == current_user["id"]
+            *in_month,
         ).group_by(Transaction.category)
     ).all()
 
@@ -94,12 +109,12 @@ def get_monthly_analytics(
     # Top expenses (single query)
     top_txs = session.exec(
         select(Transaction.label, Transaction.amount, Transaction.date).where(
+            Transaction.user_id == current_user["id"],
             Transaction.type == "depense",
-            Transaction.date.startswith(month_prefix),
-            Transaction.user_id == current_user["id"]
+            *in_month,
         ).order_by(Transaction.amount.desc()).limit(5)
     ).all()
-    top = [{"label": tx.label, "amount": tx.amount, "date": tx.date} for tx in top_txs]
+    top = [{"label": tx.label, "amount": tx.amount, "date": tx.date.isoformat()} for tx in top_txs]
 
     total_inc = sum(d["income"] for d in daily_data)
     total_exp = sum(d["expense"] for d in daily_data)
@@ -118,21 +133,29 @@ def get_monthly_analytics(
         },
     }
 
-@router.post("/analytics/audit")
-def generate_audit(req: AuditRequest, current_user: dict = Depends(get_current_user), session: Session = Depends(get_session)):
-    data = get_monthly_analytics(req.year, req.month, current_user, session)
+def parse_audit(text: str) -> dict:
+    text = text.strip()
+    if "```json" in text:
+        text = text.split("```json")[1].split("```")[0].strip()
+    elif "```" in text:
+        text = text.split("```")[1].split("```")[0].strip()
 
-    GEMINI_KEY = os.getenv("GEMINI_API_KEY")
-    if not GEMINI_KEY:
-        return {"analysis": "Error: GEMINI_API_KEY not found."}
+    start = text.find("{")
+    end = text.rfind("}") + 1
+    if start != -1 and end != -1:
+        text = text[start:end]
 
-    client = genai.Client(api_key=GEMINI_KEY)
+    parsed = json.loads(text)
+    if not isinstance(parsed, dict):
+        raise ValueError("AI response is not a JSON object")
+    return parsed
 
+def audit_prompt(data: dict, language: str) -> str:
     lang_instruction = (
-        "Respond in French." if req.language == "fr" else "Respond in English."
+        "Respond in French." if language == "fr" else "Respond in English."
     )
 
-    prompt = f"""
+    return f"""
     You are a brutally honest but helpful financial advisor. Analyze this monthly data:
     {json.dumps(data, default=str)}
 
@@ -152,45 +175,48 @@ def generate_audit(req: AuditRequest, current_user: dict = Depends(get_current_u
     }}
     """
 
-    MODELS_TO_TRY = [
-        "gemini-2.5-flash",
-        "gemini-2.0-flash",
-        "gemini-1.5-flash",
-        "gemini-flash-latest",
-    ]
-
-    last_error = None
-    for model_name in MODELS_TO_TRY:
-        try:
-            from google.genai import types
-            config = types.GenerateContentConfig(
-                response_mime_type="application/json"
-            )
-
-            response = client.models.generate_content(
-                model=model_name, 
-                contents=[prompt],
-                config=config
-            )
-            text = response.text.strip()
-            logger.info(f"AI Response ({model_name}): {text}")
-
-            if "```json" in text:
-                text = text.split("```json")[1].split("```")[0].strip()
-            elif "```" in text:
-                text = text.split("```")[1].split("```")[0].strip()
-
-            start = text.find("{")
-            end = text.rfind("}") + 1
-            if start != -1 and end != -1:
-                text = text[start:end]
-
-            parsed = json.loads(text)
-            return {"analysis": parsed}
-
-        except Exception as e:
-            logger.error(f"Failed with {model_name}: {e}")
-            last_error = e
-            continue
-
-    return {"error": f"All AI models failed. Last error: {last_error}"}
+@router.post("/analytics/audit")
+async def generate_audit(
+    req: AuditRequest,
+    current_user: dict = Depends(get_current_user),
+    session: Session = Depends(get_session),
+    audit_repo: AuditRepository = Depends(get_audit_repository),
+):
+    data = await run_in_threadpool(monthly_analytics, req.year, req.month, current_user, session)
+    month_start, _ = month_range(req.year, req.month)
+    year, month = month_start.year, month_start.month
+    prompt = audit_prompt(data, req.language)
+    # the prompt embeds the month's figures: any change to them gives a new hash
+    data_hash = hashlib.sha256(prompt.encode()).hexdigest()
+
+    stored = await run_in_threadpool(audit_repo.get_analysis, year, month, req.language, data_hash, current_user["id"])
+    if stored is not None:
+        return {"analysis": stored}
+
+    client = GenAIClientManager()
+    if not client.configured:
+        return {"analysis": "Error: GEMINI_API_KEY not found."}
+
+    config = types.GenerateContentConfig(
+        response_mime_type="application/json"
+    )
+
+    async def call(model_name: str) -> str:
+        response = await client.aio.models.generate_content(
+            model=model_name,
+            contents=[prompt],
+            config=config
+        )
+        logger.info(f"AI Response ({model_name}): {response.text}")
+        return response.text
+
+    caller = HedgedModelCaller(MODELS_TO_TRY, audit_model_stats)
+    try:
+        analysis = await caller.run(call, parse_audit)
+    except asyncio.TimeoutError:
+        return {"error": f"All AI models failed. Timed out after {caller.timeout:g}s"}
+    except Exception as e:
+        return {"error": f"All AI models failed. Last error: {e}"}
+
+    await run_in_threadpool(audit_repo.save, year, month, req.language, data_hash, analysis, current_user["id"])
+    return {"analysis": analysis}
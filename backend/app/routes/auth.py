@@ -1,12 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from app.database import get_session
-from sqlmodel import Session, select
+from app.database import get_async_session
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from app.models.domain import User as DBUser
 from app.models import UserCreate, Token
 from app.auth_utils import (
-    get_password_hash,
-    verify_password,
+    get_password_hash_async,
+    verify_password_async,
     create_access_token,
     ACCESS_TOKEN_EXPIRE_MINUTES,
 )
@@ -17,24 +18,26 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 from fastapi import Response
 
 @router.post("/register")
-async def register(user: UserCreate, response: Response, session: Session = Depends(get_session)):
+async def register(user: UserCreate, response: Response, session: AsyncSession = Depends(get_async_session)):
     if len(user.password) < 6:
         raise HTTPException(
             status_code=400, detail="Password must be at least 6 characters"
         )
 
-    existing = session.exec(select(DBUser).where(DBUser.username == user.username)).first()
+    existing = (await session.exec(select(DBUser).where(DBUser.username == user.username))).first()
     if existing:
         raise HTTPException(status_code=400, detail="Username already registered")
+    # give the pooled connection back while bcrypt runs
+    await session.close()
 
-    hashed_pw = get_password_hash(user.password)
+    hashed_pw = await get_password_hash_async(user.password)
     db_user = DBUser(username=user.username, email=user.email, hashed_password=hashed_pw)
     session.add(db_user)
-    session.commit()
+    await session.commit()
 
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user.username}, expires_delta=access_token_expires
+        data={"sub": user.username, "uid": db_user.id}, expires_delta=access_token_expires
     )
     
     response.set_cookie(
@@ -49,10 +52,11 @@ async def register(user: UserCreate, response: Response, session: Session = Depe
     return {"message": "Successfully registered", "username": user.username, "access_token": access_token}
 
 @router.post("/login")
-async def login(response: Response, form_data: OAuth2PasswordRequestForm = Depends(), session: Session = Depends(get_session)):
-    user = session.exec(select(DBUser).where(DBUser.username == form_data.username)).first()
+async def login(response: Response, form_data: OAuth2PasswordRequestForm = Depends(), session: AsyncSession = Depends(get_async_session)):
+    user = (await session.exec(select(DBUser).where(DBUser.username == form_data.username))).first()
+    await session.close()
 
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user or not await verify_password_async(form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -61,7 +65,7 @@ async def login(response: Response, form_data: OAuth2PasswordRequestForm = Depen
 
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user.username}, expires_delta=access_token_expires
+        data={"sub": user.username, "uid": user.id}, expires_delta=access_token_expires
     )
     
     response.set_cookie(
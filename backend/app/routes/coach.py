@@ -1,6 +1,8 @@
 from fastapi import APIRouter, Depends
+from starlette.concurrency import run_in_threadpool
 from app.models import PromptRequest, PlanItem, User
 from app.auth_utils import get_current_user
+from app.core.etag import conditional_get
 from app.core.dependencies import (
     get_coach_service,
     get_plans_repository,
@@ -12,13 +14,13 @@ from app.repositories import PlansRepository
 router = APIRouter()
 
 @router.post("/smart-prompt")
-def generate_smart_prompt(
+async def generate_smart_prompt(
     req: PromptRequest,
     current_user: User = Depends(get_current_user),
     coach_service: CoachService = Depends(get_coach_service),
     dashboard_service: DashboardService = Depends(get_dashboard_service),
 ):
-    dashboard_data = dashboard_service.get_dashboard_data(current_user["id"])
+    dashboard_data = await run_in_threadpool(dashboard_service.get_dashboard_data, current_user["id"])
 
     context = {
         "profile": dashboard_data.get("profile"),
@@ -28,9 +30,9 @@ def generate_smart_prompt(
         "recurring": dashboard_data.get("recurring", []),
     }
 
-    return coach_service.generate_prompt(req, context)
+    return await coach_service.generate_prompt(req, context)
 
-@router.get("/plans")
+@router.get("/plans", dependencies=[Depends(conditional_get)])
 def get_plans(
     current_user: User = Depends(get_current_user),
     plans_repo: PlansRepository = Depends(get_plans_repository),
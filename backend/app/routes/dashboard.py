@@ -1,19 +1,39 @@
-from fastapi import APIRouter, Depends
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException
 from app.models import User
 from app.auth_utils import get_current_user
+from app.core.etag import conditional_get
 from app.core.dependencies import get_dashboard_service
 from app.services import DashboardService
+from app.services.dashboard_service import DASHBOARD_COLLECTIONS
+from app.core.responses import ORJSONResponse
 from datetime import date
 
 router = APIRouter()
 
-@router.get("/dashboard")
+def _requested_collections(view: str, fields: Optional[str]):
+    if fields is not None:
+        names = {f.strip() for f in fields.split(",") if f.strip()}
+        unknown = names - set(DASHBOARD_COLLECTIONS)
+        if unknown:
+            raise HTTPException(
+                status_code=400, detail=f"Unknown dashboard fields: {', '.join(sorted(unknown))}"
+            )
+        return tuple(name for name in DASHBOARD_COLLECTIONS if name in names)
+    if view == "summary":
+        return ()
+    return None
+
+@router.get("/dashboard", dependencies=[Depends(conditional_get)])
 def get_dashboard(
+    view: Literal["full", "summary"] = "full",
+    fields: Optional[str] = None,
     current_user: User = Depends(get_current_user),
     dashboard_service: DashboardService = Depends(get_dashboard_service),
 ):
 
-    return dashboard_service.get_dashboard_data(current_user["id"])
+    collections = _requested_collections(view, fields)
+    return ORJSONResponse(dashboard_service.get_dashboard_data(current_user["id"], collections))
 
 @router.get("/ai-export")
 def get_ai(
@@ -21,13 +41,7 @@ def get_ai(
     dashboard_service: DashboardService = Depends(get_dashboard_service),
 ):
 
-    d = dashboard_service.get_dashboard_data(current_user["id"])
-    return {
-        "role": "Coach",
-        "profile": d["profile"],
-        "balance": d["balance"],
-        "pantry": d["pantry"],
-    }
+    return dashboard_service.get_ai_export(current_user["id"])
 
 @router.get("/dashboard/years")
 def get_years(
@@ -35,16 +49,7 @@ def get_years(
     dashboard_service: DashboardService = Depends(get_dashboard_service),
 ):
 
-    data = dashboard_service.get_dashboard_data(current_user["id"])
-    transactions = data["transactions"]
-
-    years = list(set(t["date"][:4] for t in transactions if t.get("date")))
-    years.sort(reverse=True)
-
-    if not years:
-        years = [str(date.today().year)]
-
-    return years
+    return dashboard_service.get_years(current_user["id"])
 
 @router.get("/dashboard/stats")
 def get_stats(
@@ -53,4 +58,7 @@ def get_stats(
     dashboard_service: DashboardService = Depends(get_dashboard_service),
 ):
 
-    return dashboard_service.get_stats_by_year(year, current_user["id"])
+    try:
+        return dashboard_service.get_stats_by_year(year, current_user["id"])
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid year")
@@ -1,17 +1,19 @@
 from fastapi import APIRouter, Depends
 from app.models import FuelEntryCreate
 from app.auth_utils import get_current_user
+from app.core.etag import conditional_get
 from app.core.dependencies import get_fuel_repository
 from app.repositories import FuelRepository
+from app.core.responses import ORJSONResponse
 
 router = APIRouter()
 
-@router.get("/fuel")
+@router.get("/fuel", dependencies=[Depends(conditional_get)])
 def get_fuel_entries(
     current_user=Depends(get_current_user),
     repo: FuelRepository = Depends(get_fuel_repository),
 ):
-    return repo.get_all(current_user["id"])
+    return ORJSONResponse(repo.get_all(current_user["id"]))
 
 @router.post("/fuel")
 def add_fuel_entry(
@@ -0,0 +1,44 @@
+import os
+import secrets
+from typing import Optional
+from fastapi import APIRouter, Header, HTTPException
+from app import pool_metrics
+from app import database
+from app.core.cache import user_cache
+from app.services import GenAIClientManager
+from app.services.model_hedging import audit_model_stats
+
+router = APIRouter(prefix="/internal", tags=["internal"])
+
+def _check_token(token: Optional[str]):
+    expected = os.getenv("METRICS_TOKEN")
+    # without a configured token the endpoint does not exist
+    if not expected:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not token or not secrets.compare_digest(token, expected):
+        raise HTTPException(status_code=403, detail="Invalid metrics token")
+
+@router.get("/metrics")
+def get_metrics(x_metrics_token: Optional[str] = Header(default=None)):
+    _check_token(x_metrics_token)
+
+    targets = {"sync": database.engine}
+    try:
+        targets["async"] = database.get_async_engine().sync_engine
+    except RuntimeError:
+        pass
+    pools = pool_metrics.snapshot()
+    for name, target in targets.items():
+        if name in pools:
+            pools[name]["status"] = target.pool.status()
+    return {
+        "pools": pools,
+        "cache": user_cache.stats(),
+        "models": {"audit": audit_model_stats.snapshot()},
+        "genai": GenAIClientManager().metrics(),
+    }
+
+@router.get("/genai/health")
+async def get_genai_health(x_metrics_token: Optional[str] = Header(default=None)):
+    _check_token(x_metrics_token)
+    return await GenAIClientManager().health()
@@ -3,9 +3,11 @@ from pydantic import BaseModel
 from app.auth_utils import get_current_user
 from app.database import get_session
 from sqlmodel import Session, select
-from app.models.domain import Transaction, Goal, Profile, UserTheme
+from app.models.domain import Goal, Profile, UserTheme
+from app.repositories import LedgerRepository
 from app.services.gamification_service import GamificationService
 from app.core.dependencies import get_gamification_service
+from app.core.cache import invalidate_user
 
 router = APIRouter()
 
@@ -24,14 +26,10 @@ def buy_item(
     price = item.price
 
     try:
-        transactions = session.exec(select(Transaction).where(Transaction.user_id == current_user["id"])).all()
+        balance = LedgerRepository(session).get_balance(current_user["id"])
         goals = session.exec(select(Goal).where(Goal.user_id == current_user["id"])).all()
         profile = session.exec(select(Profile).where(Profile.user_id == current_user["id"])).first()
 
-        balance = sum(
-            t.amount if t.type == "revenu" else -t.amount for t in transactions
-        )
-
         goals_completed = len([g for g in goals if g.saved >= g.target])
         total_xp = gamification_service.calculate_xp(balance, goals_completed)
         xp_spent = profile.xp_spent if profile else 0
@@ -63,6 +61,7 @@ def buy_item(
             session.add(UserTheme(user_id=current_user["id"], theme_id=item_id))
 
         session.commit()
+        invalidate_user(current_user["id"])
 
         return {"status": "purchased", "item_id": item_id, "new_xp": available_xp - price}
     except Exception as e:
@@ -91,6 +90,7 @@ def equip_item(item: MarketItemRequest, current_user: dict = Depends(get_current
             session.add(profile)
 
         session.commit()
+        invalidate_user(current_user["id"])
         return {"status": "equipped", "item_id": item_id}
     except Exception as e:
         session.rollback()
@@ -3,10 +3,15 @@ from app.models import PantryItem, User
 from app.auth_utils import get_current_user
 from app.core.dependencies import get_pantry_repository
 from app.repositories import PantryRepository
+from app.services import GenAIClientManager
+from google.genai import types
+from starlette.concurrency import run_in_threadpool
 import os
 import tempfile
-from google import genai
 import json
+import logging
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -49,18 +54,16 @@ async def scan_receipt(
 ):
 
     try:
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
+        client = GenAIClientManager()
+        if not client.configured:
             raise HTTPException(status_code=500, detail="GEMINI_API_KEY not configured")
 
-        client = genai.Client(api_key=api_key)
-
         fd, temp_path = tempfile.mkstemp(suffix=os.path.splitext(file.filename)[1])
         try:
             with os.fdopen(fd, 'wb') as temp_file:
                 temp_file.write(await file.read())
             
-            uploaded_file = client.files.upload(
+            uploaded_file = await client.aio.files.upload(
                 file=temp_path, config={"display_name": file.filename}
             )
         finally:
@@ -94,12 +97,11 @@ async def scan_receipt(
         }
         """ 
 
-        from google.genai import types
         config = types.GenerateContentConfig(
             response_mime_type="application/json"
         )
 
-        response = client.models.generate_content(
+        response = await client.aio.models.generate_content(
             model="gemini-2.5-flash", 
             contents=[prompt, uploaded_file],
             config=config
@@ -123,14 +125,14 @@ async def scan_receipt(
                     category=item_data.get("category", "Autre"),
                     expiry=""
                 )
-                repo.create(pantry_item, current_user["id"])
+                await run_in_threadpool(repo.create, pantry_item, current_user["id"])
             except Exception as e:
-                print(f"Error saving scanned item: {e}")
+                logger.error(f"Error saving scanned item: {e}")
 
-        client.files.delete(name=uploaded_file.name)
+        await client.aio.files.delete(name=uploaded_file.name)
 
         return result
 
     except Exception as e:
-        print(f"Scan receipt error: {e}")
+        logger.error(f"Scan receipt error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends
 from app.models import SetupData, ProfileUpdate, BudgetLimit, User
 from app.auth_utils import get_current_user
+from app.core.etag import conditional_get
 from app.core.dependencies import (
     get_profile_repository,
     get_recurring_repository,
@@ -70,7 +71,7 @@ def set_budget_limit(
 
     return {"status": "saved"}
 
-@router.get("/budget-limits")
+@router.get("/budget-limits", dependencies=[Depends(conditional_get)])
 def get_budget_limits(
     current_user: User = Depends(get_current_user),
     budget_repo: BudgetRepository = Depends(get_budget_repository),
@@ -1,11 +1,50 @@
-from fastapi import APIRouter, Depends
+import codecs
+import csv
+import io
+import os
+from datetime import date
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
 from app.models import Transaction, User
+from app.core.pagination import encode_cursor, decode_cursor
 from app.auth_utils import get_current_user
-from app.core.dependencies import get_transaction_repository
+from app.core.dependencies import get_transaction_repository, get_import_service
 from app.repositories import TransactionRepository
+from app.services import TransactionImportService
+from app.services.import_service import IMPORT_BATCH_SIZE
+from app.services.importers import get_parser
 
 router = APIRouter()
 
+@router.get("/transactions")
+def list_transactions(
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    type: Optional[str] = None,
+    category: Optional[str] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    current_user: User = Depends(get_current_user),
+    repo: TransactionRepository = Depends(get_transaction_repository),
+):
+
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    items, has_more = repo.get_page(
+        current_user["id"],
+        limit,
+        after=after,
+        tx_type=type,
+        category=category,
+        start_date=start_date,
+        end_date=end_date,
+    )
+    next_cursor = encode_cursor(items[-1]["date"], items[-1]["id"]) if has_more else None
+    return {"items": items, "next_cursor": next_cursor}
+
 @router.post("/transactions")
 def add_transaction(
     tx: Transaction,
@@ -16,6 +55,32 @@ def add_transaction(
     repo.create(tx, current_user["id"])
     return {"status": "created"}
 
+@router.post("/transactions/import")
+def import_transactions(
+    file: UploadFile = File(...),
+    format: Optional[Literal["csv", "ofx", "qfx"]] = None,
+    encoding: str = "utf-8-sig",
+    batch_size: int = Query(IMPORT_BATCH_SIZE, ge=1, le=10000),
+    current_user: User = Depends(get_current_user),
+    import_service: TransactionImportService = Depends(get_import_service),
+):
+
+    if format is None:
+        format = os.path.splitext(file.filename or "")[1].lstrip(".").lower()
+    try:
+        parser = get_parser(format)
+        codecs.lookup(encoding)
+    except (ValueError, LookupError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    lines = io.TextIOWrapper(file.file, encoding=encoding, errors="replace", newline="")
+    try:
+        return import_service.import_statement(lines, parser, current_user["id"], batch_size=batch_size)
+    except (ValueError, csv.Error) as e:
+        raise HTTPException(status_code=400, detail=f"Nothing imported: {e}")
+    finally:
+        lines.detach()
+
 @router.delete("/transactions/{id}")
 def delete_transaction(
     id: int,
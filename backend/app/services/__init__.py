@@ -3,11 +3,18 @@
 from .gamification_service import GamificationService
 from .prediction_service import PredictionService
 from .dashboard_service import DashboardService
+from .genai_client import GenAIClientManager
 from .coach_service import CoachService
+from .import_service import TransactionImportService
+from .model_hedging import HedgedModelCaller, ModelStats
 
 __all__ = [
     "GamificationService",
     "PredictionService",
     "DashboardService",
+    "GenAIClientManager",
     "CoachService",
+    "TransactionImportService",
+    "HedgedModelCaller",
+    "ModelStats",
 ]
@@ -1,5 +1,6 @@
 
 
 from .dashboard_builder import DashboardDataBuilder
+from .dashboard_totals import DashboardTotals
 
-__all__ = ["DashboardDataBuilder"]
+__all__ = ["DashboardDataBuilder", "DashboardTotals"]
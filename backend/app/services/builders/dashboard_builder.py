@@ -1,86 +1,57 @@
 
 
-from typing import Dict, List
-from datetime import date
+from typing import Dict, List, Optional
+from app.services.builders.dashboard_totals import DashboardTotals
 
 class DashboardDataBuilder:
 
     def __init__(self):
         self._data = {}
+        self._totals = DashboardTotals("")
 
     def with_base_data(
-        self,
-        transactions: List[Dict],
-        pantry: List[Dict],
-        recurring: List[Dict],
-        goals: List[Dict],
-        profile: Dict,
+        self, collections: Dict[str, object], profile: Optional[Dict]
     ) -> "DashboardDataBuilder":
 
-        self._data["transactions"] = transactions
-        self._data["pantry"] = pantry
-        self._data["recurring"] = recurring
-        self._data["goals"] = goals
-        self._data["profile"] = profile
+        # Only the raw collections the caller asked for end up in the payload
+        self._data.update(collections)
         self._data["is_setup"] = profile is not None
         return self
 
-    def with_balance(self, transactions: List[Dict]) -> "DashboardDataBuilder":
+    def with_totals(self, totals: DashboardTotals) -> "DashboardDataBuilder":
 
-        balance = sum(
-            t["amount"] if t["type"] == "revenu" else -t["amount"] for t in transactions
-        )
-        self._data["balance"] = balance
+        self._totals = totals
         return self
 
-    def with_upcoming_bills(self, recurring: List[Dict]) -> "DashboardDataBuilder":
+    def with_balance(self) -> "DashboardDataBuilder":
 
-        today_day = date.today().day
-        upcoming_bills = sum(r["amount"] for r in recurring if r["day"] > today_day)
-        self._data["upcoming_bills"] = upcoming_bills
-        self._data["safe_balance"] = self._data.get("balance", 0) - upcoming_bills
+        self._data["balance"] = self._totals.balance
         return self
 
-    def with_monthly_data(
-        self, transactions: List[Dict], recurring: List[Dict]
-    ) -> "DashboardDataBuilder":
+    def with_upcoming_bills(self) -> "DashboardDataBuilder":
 
-        current_month = str(date.today())[:7]
+        self._data["upcoming_bills"] = self._totals.upcoming_bills
+        self._data["safe_balance"] = self._totals.balance - self._totals.upcoming_bills
+        return self
 
-        this_month_income = sum(
-            t["amount"]
-            for t in transactions
-            if t["type"] == "revenu" and t["date"].startswith(current_month)
-        )
-        this_month_expenses = sum(
-            t["amount"]
-            for t in transactions
-            if t["type"] != "revenu" and t["date"].startswith(current_month)
-        )
-        monthly_burn = sum(r["amount"] for r in recurring)
+    def with_monthly_data(self) -> "DashboardDataBuilder":
 
-        self._data["income"] = this_month_income
-        self._data["expense"] = this_month_expenses
-        self._data["monthly_burn"] = monthly_burn
+        self._data["income"] = self._totals.income
+        self._data["expense"] = self._totals.expense
+        self._data["monthly_burn"] = self._totals.monthly_burn
         return self
 
-    def with_categories(self, transactions: List[Dict]) -> "DashboardDataBuilder":
+    def with_categories(self) -> "DashboardDataBuilder":
 
-        categories = {}
-        for t in transactions:
-            if t["type"] == "depense":
-                categories[t["category"]] = (
-                    categories.get(t["category"], 0) + t["amount"]
-                )
-        self._data["categories"] = categories
+        self._data["categories"] = self._totals.categories
         return self
 
     def with_gamification(
-        self, gamification_service, balance: float, goals: List[Dict]
+        self, gamification_service, goals: List[Dict]
     ) -> "DashboardDataBuilder":
 
         goals_completed = len([g for g in goals if g["saved"] >= g["target"]])
-        total_xp = gamification_service.calculate_xp(balance, goals_completed)
+        total_xp = gamification_service.calculate_xp(self._totals.balance, goals_completed)
         rank_name, next_rank_xp = gamification_service.get_rank(total_xp)
 
         self._data["xp"] = total_xp
@@ -88,37 +59,26 @@ class DashboardDataBuilder:
         self._data["next_rank_xp"] = next_rank_xp
         return self
 
-    def with_prediction(
-        self,
-        prediction_service,
-        balance: float,
-        recurring: List[Dict],
-        transactions: List[Dict],
-    ) -> "DashboardDataBuilder":
+    def with_prediction(self, prediction: Dict) -> "DashboardDataBuilder":
 
-        prediction = prediction_service.predict_month_end(
-            balance, recurring, transactions
-        )
         self._data["prediction"] = prediction
         return self
 
     def with_achievements(
         self,
         gamification_service,
-        balance: float,
-        monthly_burn: float,
-        prediction: Dict,
         goals: List[Dict],
-        pantry: List[Dict],
+        pantry_count: int,
+        prediction: Dict,
     ) -> "DashboardDataBuilder":
 
         achievements = gamification_service.get_achievements(
             {
-                "balance": balance,
-                "monthly_burn": monthly_burn,
+                "balance": self._totals.balance,
+                "monthly_burn": self._totals.monthly_burn,
                 "prediction": prediction,
                 "goals": goals,
-                "pantry": pantry,
+                "pantry_count": pantry_count,
             }
         )
         self._data["achievements"] = achievements
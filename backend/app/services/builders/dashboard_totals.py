@@ -0,0 +1,33 @@
+from typing import Dict, List
+from datetime import date
+
+class DashboardTotals:
+    """Every figure the dashboard steps need, gathered once and shared by all of them."""
+
+    __slots__ = ("month", "balance", "income", "expense", "categories", "monthly_burn", "upcoming_bills")
+
+    def __init__(self, month: str):
+        self.month = month
+        self.balance = 0.0
+        self.income = 0.0
+        self.expense = 0.0
+        self.categories: Dict[str, float] = {}
+        self.monthly_burn = 0.0
+        self.upcoming_bills = 0.0
+
+    def add_recurring(self, recurring: List[Dict], today_day: int):
+        for r in recurring:
+            self.monthly_burn += r["amount"]
+            if r["day"] > today_day:
+                self.upcoming_bills += r["amount"]
+
+    @classmethod
+    def from_ledger(cls, summary: Dict, recurring: List[Dict], today: date) -> "DashboardTotals":
+        """Build from LedgerRepository.get_summary, no transaction scan at all."""
+        totals = cls(str(today)[:7])
+        totals.balance = summary["balance"]
+        totals.income = summary["income"]
+        totals.expense = summary["expense"]
+        totals.categories = summary["categories"]
+        totals.add_recurring(recurring, today.day)
+        return totals
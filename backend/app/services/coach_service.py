@@ -1,15 +1,24 @@
+import asyncio
+import hashlib
 import os
 import json
+import weakref
 from typing import Dict
-from google import genai
+from google.genai import types
 from app.models import PromptRequest
 from app.services.strategies import (
     EmergencyPromptStrategy,
     MealPlanPromptStrategy,
     RecipePromptStrategy,
 )
+from app.core.cache import create_backend
 from app.core.singleton import Singleton
 from app.core.decorators import logged, timed, retry
+from app.services.genai_client import GenAIClientManager
+
+GEMINI_TIMEOUT_SECONDS = float(os.getenv("GEMINI_TIMEOUT_SECONDS", "30"))
+GEMINI_MAX_CONCURRENCY = int(os.getenv("GEMINI_MAX_CONCURRENCY", "4"))
+COACH_CACHE_TTL_SECONDS = int(os.getenv("COACH_CACHE_TTL_SECONDS", str(24 * 3600)))
 
 class CoachService(metaclass=Singleton):
     def __init__(self):
@@ -17,11 +26,16 @@ class CoachService(metaclass=Singleton):
             return
 
         self._initialized = True
-        self.api_key = os.getenv("GEMINI_API_KEY")
-        if not self.api_key:
+        self.genai = GenAIClientManager()
+        if not self.genai.configured:
             raise ValueError("GEMINI_API_KEY not found in environment")
-        self.client = genai.Client(api_key=self.api_key)
         self.model = "gemini-2.5-flash"
+        self.timeout = GEMINI_TIMEOUT_SECONDS
+        self.max_concurrency = GEMINI_MAX_CONCURRENCY
+        self._semaphores = weakref.WeakKeyDictionary()
+        # Model answers outlive restarts: COACH_CACHE_BACKEND defaults to a SQLite file.
+        self.cache = create_backend("COACH_CACHE", default="sqlite", default_path="hess_coach_cache.db")
+        self.cache_ttl = COACH_CACHE_TTL_SECONDS
 
         self.strategies = {
             "emergency": EmergencyPromptStrategy(),
@@ -31,35 +45,67 @@ class CoachService(metaclass=Singleton):
 
     @logged
     @timed
-    def generate_prompt(self, request: PromptRequest, context: Dict) -> Dict:
+    async def generate_prompt(self, request: PromptRequest, context: Dict) -> Dict:
         strategy = self.strategies.get(request.type)
         if not strategy:
             return {"error": f"Invalid request type: {request.type}"}
 
         prompt = strategy.build_prompt(request, context)
-        return self._call_gemini(prompt, request)
+        return await self._call_gemini(prompt, request)
+
+    def cache_key(self, request_type: str, prompt: str) -> str:
+        """Content address of a model answer: same type, model and prompt
+        (whitespace-normalized) means the same response."""
+        normalized = " ".join(prompt.split())
+        digest = hashlib.sha256(f"{request_type}\0{self.model}\0{normalized}".encode()).hexdigest()
+        return f"coach:{request_type}:{digest}"
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if loop not in self._semaphores:
+            self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphores[loop]
 
     @retry(max_attempts=2, delay=1.0)
-    def _call_gemini(self, prompt: str, request: PromptRequest) -> Dict:
-        try:
-            from google.genai import types
-            config = types.GenerateContentConfig(
-                response_mime_type="application/json"
-            )
+    async def _generate(self, prompt: str) -> str:
+        """One model call, bounded by the concurrency limit and a deadline
+        that covers the wait for a slot as well as the request itself."""
+        config = types.GenerateContentConfig(
+            response_mime_type="application/json"
+        )
+
+        async def call():
+            async with self._semaphore():
+                return await self.genai.aio.models.generate_content(
+                    model=self.model,
+                    contents=[prompt],
+                    config=config
+                )
 
-            response = self.client.models.generate_content(
-                model=self.model, 
-                contents=[prompt],
-                config=config
-            )
-            text = response.text.strip()
+        response = await asyncio.wait_for(call(), timeout=self.timeout)
+        return response.text
 
-            start = text.find("{")
-            end = text.rfind("}") + 1
-            if start != -1 and end != -1:
-                text = text[start:end]
+    async def _answer(self, prompt: str, request_type: str) -> Dict:
+        key = self.cache_key(request_type, prompt)
+        # cache backends do blocking I/O (SQLite file, Redis socket)
+        parsed = await asyncio.to_thread(self.cache.get, key)
+        if parsed is not None:
+            return parsed
 
-            parsed = json.loads(text)
+        text = (await self._generate(prompt)).strip()
+
+        start = text.find("{")
+        end = text.rfind("}") + 1
+        if start != -1 and end != -1:
+            text = text[start:end]
+
+        parsed = json.loads(text)
+        await asyncio.to_thread(self.cache.set, key, parsed, self.cache_ttl)
+        return parsed
+
+    async def _call_gemini(self, prompt: str, request: PromptRequest) -> Dict:
+        try:
+            parsed = dict(await self._answer(prompt, request.type))
 
             if request.current_plan:
                 try:
@@ -71,5 +117,7 @@ class CoachService(metaclass=Singleton):
 
             return {"prompt": parsed}
 
+        except asyncio.TimeoutError:
+            return {"error": f"AI model timed out after {self.timeout:g}s"}
         except Exception as e:
             return {"error": f"AI model failed: {str(e)}"}
@@ -1,15 +1,19 @@
-from typing import Dict
+from typing import Dict, Iterable, List, Optional
+from datetime import date
 from app.repositories import (
     TransactionRepository,
     PantryRepository,
     RecurringRepository,
     GoalsRepository,
     ProfileRepository,
+    LedgerRepository,
 )
 from app.services.gamification_service import GamificationService
 from app.services.prediction_service import PredictionService
-from app.services.builders import DashboardDataBuilder
-from app.core.decorators import timed
+from app.services.builders import DashboardDataBuilder, DashboardTotals
+from app.core.decorators import cached, timed
+
+DASHBOARD_COLLECTIONS = ("transactions", "pantry", "recurring", "goals", "profile")
 
 class DashboardService:
     def __init__(
@@ -19,6 +23,7 @@ class DashboardService:
         recurring_repo: RecurringRepository,
         goals_repo: GoalsRepository,
         profile_repo: ProfileRepository,
+        ledger_repo: LedgerRepository,
         gamification_service: GamificationService,
         prediction_service: PredictionService,
     ):
@@ -27,75 +32,80 @@ class DashboardService:
         self.recurring_repo = recurring_repo
         self.goals_repo = goals_repo
         self.profile_repo = profile_repo
+        self.ledger_repo = ledger_repo
         self.gamification_service = gamification_service
         self.prediction_service = prediction_service
 
+    @cached(ttl_seconds=300)
     @timed
-    def get_dashboard_data(self, user_id: int) -> Dict:
-        transactions = self.transaction_repo.get_all(user_id)
-        pantry = self.pantry_repo.get_all(user_id)
+    def get_dashboard_data(
+        self, user_id: int, collections: Optional[Iterable[str]] = None
+    ) -> Dict:
+        """KPIs plus the raw collections named in `collections` (all of them when None)."""
+        wanted = set(DASHBOARD_COLLECTIONS if collections is None else collections)
+
+        # recurring, goals and profile feed the KPIs; the potentially large ones are
+        # only fetched when they are actually going to be returned
         recurring = self.recurring_repo.get_all(user_id)
         goals = self.goals_repo.get_all(user_id)
         profile = self.profile_repo.get_by_user(user_id)
+        raw = {"recurring": recurring, "goals": goals, "profile": profile}
+        if "transactions" in wanted:
+            raw["transactions"] = self.transaction_repo.get_all(user_id)
+        if "pantry" in wanted:
+            raw["pantry"] = self.pantry_repo.get_all(user_id)
+            pantry_count = len(raw["pantry"])
+        else:
+            pantry_count = self.pantry_repo.count(user_id)
+        today = date.today()
+        ledger = self.ledger_repo.get_summary(user_id, str(today)[:7])
+        totals = DashboardTotals.from_ledger(ledger, recurring, today)
 
         builder = DashboardDataBuilder()
 
-        builder.with_base_data(transactions, pantry, recurring, goals, profile)
-        builder.with_balance(transactions)
-        builder.with_upcoming_bills(recurring)
-        builder.with_monthly_data(transactions, recurring)
-        builder.with_categories(transactions)
-
-        balance = sum(
-            t["amount"] if t["type"] == "revenu" else -t["amount"] for t in transactions
+        builder.with_base_data(
+            {name: raw[name] for name in DASHBOARD_COLLECTIONS if name in wanted}, profile
         )
-        monthly_burn = sum(r["amount"] for r in recurring)
+        builder.with_totals(totals)
+        builder.with_balance()
+        builder.with_upcoming_bills()
+        builder.with_monthly_data()
+        builder.with_categories()
+        builder.with_gamification(self.gamification_service, goals)
+        # predicted once, shown on the dashboard and fed to the achievements
+        prediction = self.prediction_service.predict_month_end(totals.balance, recurring, totals.expense)
+        builder.with_prediction(prediction)
+        builder.with_achievements(self.gamification_service, goals, pantry_count, prediction)
 
-        builder.with_gamification(self.gamification_service, balance, goals)
-        builder.with_prediction(
-            self.prediction_service, balance, recurring, transactions
-        )
+        return builder.build()
 
-        prediction = self.prediction_service.predict_month_end(
-            balance, recurring, transactions
-        )
-        builder.with_achievements(
-            self.gamification_service, balance, monthly_burn, prediction, goals, pantry
-        )
+    def get_years(self, user_id: int) -> List[str]:
+        return self.transaction_repo.get_years(user_id) or [str(date.today().year)]
 
-        return builder.build()
+    def get_ai_export(self, user_id: int) -> Dict:
+        return {
+            "role": "Coach",
+            "profile": self.profile_repo.get_by_user(user_id),
+            "balance": self.ledger_repo.get_balance(user_id),
+            "pantry": self.pantry_repo.get_all(user_id),
+        }
 
+    @cached(ttl_seconds=300)
     @timed
     def get_stats_by_year(self, year: str, user_id: int) -> Dict:
-        transactions = self.transaction_repo.get_by_year(year, user_id)
+        totals = self.transaction_repo.get_monthly_totals(year, user_id)
 
-        total_income = sum(t["amount"] for t in transactions if t["type"] == "revenu")
-        total_expense = sum(t["amount"] for t in transactions if t["type"] != "revenu")
-
-        months = [
-            "01",
-            "02",
-            "03",
-            "04",
-            "05",
-            "06",
-            "07",
-            "08",
-            "09",
-            "10",
-            "11",
-            "12",
-        ]
         monthly_data = []
-
-        for m in months:
-            month_txs = [t for t in transactions if t["date"][5:7] == m]
-            inc = sum(t["amount"] for t in month_txs if t["type"] == "revenu")
-            exp = sum(t["amount"] for t in month_txs if t["type"] != "revenu")
+        for m in range(1, 13):
+            month = totals.get(m, {"income": 0.0, "expense": 0.0})
+            inc, exp = month["income"], month["expense"]
             monthly_data.append(
-                {"month": m, "income": inc, "expense": exp, "net": inc - exp}
+                {"month": f"{m:02d}", "income": inc, "expense": exp, "net": inc - exp}
             )
 
+        total_income = sum(m["income"] for m in monthly_data)
+        total_expense = sum(m["expense"] for m in monthly_data)
+
         return {
             "year": year,
             "total_income": total_income,
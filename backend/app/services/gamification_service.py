@@ -25,7 +25,7 @@ class GamificationService(metaclass=Singleton):
         monthly_burn = data.get("monthly_burn", 0)
         prediction = data.get("prediction", {})
         goals = data.get("goals", [])
-        pantry = data.get("pantry", [])
+        pantry_count = data.get("pantry_count", len(data.get("pantry", [])))
 
         savings_rate = (
             (balance - monthly_burn) / max(1, balance) * 100 if balance > 0 else 0
@@ -90,7 +90,7 @@ class GamificationService(metaclass=Singleton):
                 }
             )
 
-        if len(pantry) >= 5:
+        if pantry_count >= 5:
             achievements.append(
                 {
                     "id": "chef",
@@ -0,0 +1,117 @@
+import asyncio
+import os
+import threading
+import time
+import weakref
+from typing import Dict, Optional
+import httpx
+from google import genai
+from google.genai import types
+from app.core.singleton import Singleton
+
+GEMINI_BASE_URL = os.getenv("GEMINI_BASE_URL")
+GENAI_MAX_CONNECTIONS = int(os.getenv("GENAI_MAX_CONNECTIONS", "20"))
+GENAI_KEEPALIVE_SECONDS = float(os.getenv("GENAI_KEEPALIVE_SECONDS", "60"))
+GENAI_HEALTH_MODEL = os.getenv("GENAI_HEALTH_MODEL", "gemini-2.5-flash")
+
+class GenAIClientManager(metaclass=Singleton):
+    """Process-wide Gemini clients shared by the coach, the audit and the
+    receipt scanner, so HTTP keep-alive connections are reused between AI calls.
+
+    `client` serves synchronous calls; `aio` returns the async API of a client
+    owned by the running event loop (pooled connections can't cross loops).
+    Every request goes through event hooks that feed `metrics()`.
+    """
+
+    def __init__(self):
+        if hasattr(self, "_initialized"):
+            return
+
+        self._initialized = True
+        self.api_key = os.getenv("GEMINI_API_KEY")
+        self.base_url = GEMINI_BASE_URL
+        self._sync_client: Optional[genai.Client] = None
+        self._loop_clients = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._metrics = {"clients": 0, "requests": 0, "responses": 0, "errors": 0}
+
+    @property
+    def configured(self) -> bool:
+        return bool(self.api_key)
+
+    def _count(self, name: str):
+        with self._lock:
+            self._metrics[name] += 1
+
+    def _client_args(self, is_async: bool) -> Dict:
+        def on_request(request):
+            self._count("requests")
+
+        def on_response(response):
+            self._count("responses")
+            if response.status_code >= 400:
+                self._count("errors")
+
+        if is_async:
+            async def on_request_async(request):
+                on_request(request)
+
+            async def on_response_async(response):
+                on_response(response)
+
+            hooks = {"request": [on_request_async], "response": [on_response_async]}
+        else:
+            hooks = {"request": [on_request], "response": [on_response]}
+
+        return {
+            "limits": httpx.Limits(
+                max_connections=GENAI_MAX_CONNECTIONS,
+                max_keepalive_connections=GENAI_MAX_CONNECTIONS,
+                keepalive_expiry=GENAI_KEEPALIVE_SECONDS,
+            ),
+            "event_hooks": hooks,
+        }
+
+    def _new_client(self) -> genai.Client:
+        """Build a client; callers hold self._lock, so nothing here may take it."""
+        if not self.api_key:
+            raise ValueError("GEMINI_API_KEY not found in environment")
+        http_options = types.HttpOptions(
+            base_url=self.base_url,
+            client_args=self._client_args(is_async=False),
+            async_client_args=self._client_args(is_async=True),
+        )
+        self._metrics["clients"] += 1
+        return genai.Client(api_key=self.api_key, http_options=http_options)
+
+    @property
+    def client(self) -> genai.Client:
+        with self._lock:
+            if self._sync_client is None:
+                self._sync_client = self._new_client()
+            return self._sync_client
+
+    @property
+    def aio(self):
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if loop not in self._loop_clients:
+                self._loop_clients[loop] = self._new_client()
+            return self._loop_clients[loop].aio
+
+    def metrics(self) -> Dict:
+        with self._lock:
+            return dict(self._metrics)
+
+    async def health(self, timeout: float = 5.0) -> Dict:
+        """Probe the API with a cheap model lookup on the shared connections."""
+        if not self.configured:
+            return {"ok": False, "error": "GEMINI_API_KEY not configured"}
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(self.aio.models.get(model=GENAI_HEALTH_MODEL), timeout=timeout)
+        except asyncio.TimeoutError:
+            return {"ok": False, "error": f"timed out after {timeout:g}s"}
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+        return {"ok": True, "latency_ms": round((time.perf_counter() - started) * 1000, 1)}
@@ -0,0 +1,42 @@
+import os
+from typing import Dict, Iterable, List
+from app.repositories import TransactionRepository
+from app.services.importers import StatementParser
+from app.services.validators import AmountValidator, TransactionValidator
+
+IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", "1000"))
+MAX_REPORTED_ERRORS = 100
+
+class TransactionImportService:
+    def __init__(self, transaction_repo: TransactionRepository, validator: TransactionValidator = None):
+        self.transaction_repo = transaction_repo
+        self.validator = validator or AmountValidator()
+
+    def import_statement(
+        self, lines: Iterable[str], parser: StatementParser, user_id: int, batch_size: int = IMPORT_BATCH_SIZE
+    ) -> Dict:
+        """Parse, validate and insert a statement in one streaming pass.
+
+        Invalid rows are skipped and reported by line number (the first
+        MAX_REPORTED_ERRORS of them); valid rows go to the database in batches
+        of `batch_size`, so memory stays flat whatever the file size.
+        """
+        errors: List[Dict] = []
+        rejected = 0
+
+        def valid_rows():
+            nonlocal rejected
+            for line_number, parsed in parser.parse(lines):
+                if isinstance(parsed, str):
+                    error = parsed
+                else:
+                    is_valid, error = self.validator.validate(parsed, user_id)
+                    if is_valid:
+                        yield parsed
+                        continue
+                rejected += 1
+                if len(errors) < MAX_REPORTED_ERRORS:
+                    errors.append({"line": line_number, "error": error})
+
+        imported = self.transaction_repo.bulk_create(valid_rows(), user_id, batch_size=batch_size)
+        return {"imported": imported, "rejected": rejected, "errors": errors}
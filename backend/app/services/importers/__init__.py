@@ -0,0 +1,24 @@
+from .statement_parser import StatementParser, parse_amount, parse_date
+from .csv_parser import CsvStatementParser
+from .ofx_parser import OfxStatementParser
+
+PARSERS = {
+    "csv": CsvStatementParser,
+    "ofx": OfxStatementParser,
+    "qfx": OfxStatementParser,
+}
+
+def get_parser(format: str) -> StatementParser:
+    try:
+        return PARSERS[format.lower()]()
+    except KeyError:
+        raise ValueError(f"Unsupported statement format: {format}")
+
+__all__ = [
+    "StatementParser",
+    "CsvStatementParser",
+    "OfxStatementParser",
+    "get_parser",
+    "parse_amount",
+    "parse_date",
+]
@@ -0,0 +1,62 @@
+import csv
+import unicodedata
+from itertools import chain
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+from app.services.importers.statement_parser import StatementParser
+
+COLUMN_ALIASES = {
+    "date": ("date", "date operation", "date de l'operation", "date comptable", "booking date", "transaction date"),
+    "label": ("label", "libelle", "libelle operation", "description", "memo", "intitule", "details"),
+    "amount": ("amount", "montant", "montant eur", "montant(eur)", "valeur"),
+    "debit": ("debit", "debit eur", "withdrawal"),
+    "credit": ("credit", "credit eur", "deposit"),
+    "category": ("category", "categorie"),
+    "type": ("type",),
+}
+
+def _normalise(header: str) -> str:
+    text = unicodedata.normalize("NFKD", header).encode("ascii", "ignore").decode()
+    return " ".join(text.lower().replace("_", " ").split())
+
+class CsvStatementParser(StatementParser):
+    """Bank CSV exports: a header row, then one operation per row.
+
+    The delimiter (`;`, `,` or tab) is guessed from the header and columns are
+    matched by name (English or French), so most exports work untouched.
+    """
+
+    def __init__(self, delimiter: Optional[str] = None):
+        self.delimiter = delimiter
+
+    def _records(self, lines: Iterable[str]) -> Iterator[Tuple[int, Dict[str, str]]]:
+        lines = iter(lines)
+        first = next(lines, None)
+        if first is None:
+            return
+        delimiter = self.delimiter or max(";,\t", key=first.count)
+        reader = csv.reader(chain([first], lines), delimiter=delimiter)
+
+        header = next(reader)
+        columns = self._map_columns(header)
+        for row in reader:
+            if not any(cell.strip() for cell in row):
+                continue
+            yield reader.line_num, {
+                field: row[index] for field, index in columns.items() if index < len(row)
+            }
+
+    def _map_columns(self, header) -> Dict[str, int]:
+        names = [_normalise(h) for h in header]
+        columns = {}
+        for field, aliases in COLUMN_ALIASES.items():
+            for index, name in enumerate(names):
+                if name in aliases:
+                    columns[field] = index
+                    break
+        missing = {"date", "label"} - columns.keys()
+        if missing or not ({"amount", "debit", "credit"} & columns.keys()):
+            raise ValueError(
+                "CSV header must name date, label and amount (or debit/credit) columns, got: "
+                + ", ".join(header)
+            )
+        return columns
@@ -0,0 +1,34 @@
+import re
+from typing import Dict, Iterable, Iterator, Tuple
+from app.services.importers.statement_parser import StatementParser
+
+TAG = re.compile(r"<(/?)([A-Za-z0-9.]+)>([^<\r\n]*)")
+
+class OfxStatementParser(StatementParser):
+    """OFX / QFX statements, both the SGML (1.x, unclosed tags) and XML (2.x) flavours.
+
+    Only <STMTTRN> blocks are read; headers and balances are ignored.
+    """
+
+    def _records(self, lines: Iterable[str]) -> Iterator[Tuple[int, Dict[str, str]]]:
+        current = None
+        start_line = 0
+        for line_number, line in enumerate(lines, start=1):
+            for closing, tag, value in TAG.findall(line):
+                tag = tag.upper()
+                if tag == "STMTTRN":
+                    if closing and current is not None:
+                        yield start_line, self._fields(current)
+                        current = None
+                    elif not closing:
+                        current, start_line = {}, line_number
+                elif current is not None and not closing and value.strip():
+                    current[tag] = value.strip()
+
+    def _fields(self, record: Dict[str, str]) -> Dict[str, str]:
+        name, memo = record.get("NAME", ""), record.get("MEMO", "")
+        return {
+            "date": record.get("DTPOSTED", "")[:8],
+            "amount": record.get("TRNAMT", ""),
+            "label": name if not memo or memo == name else f"{name} {memo}".strip(),
+        }
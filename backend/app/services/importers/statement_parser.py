@@ -0,0 +1,80 @@
+import re
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from typing import Dict, Iterable, Iterator, Tuple
+from app.models import Transaction
+
+DATE_FORMATS = ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y", "%d.%m.%Y", "%Y%m%d", "%d/%m/%y")
+
+def parse_date(value: str) -> date:
+    value = value.strip()
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    raise ValueError(f"Unrecognised date: {value!r}")
+
+def parse_amount(value: str) -> float:
+    """Bank amounts: "-12.50", "1 234,56", "(45.00)", "€12", "+3,5"."""
+    text = re.sub(r"[\s€$£]", "", value)
+    negative = text.startswith("(") and text.endswith(")")
+    text = text.strip("()")
+    if "," in text and "." in text:
+        # whichever separator comes last is the decimal one
+        if text.rfind(",") > text.rfind("."):
+            text = text.replace(".", "").replace(",", ".")
+        else:
+            text = text.replace(",", "")
+    else:
+        text = text.replace(",", ".")
+    try:
+        amount = float(text)
+    except ValueError:
+        raise ValueError(f"Unrecognised amount: {value!r}")
+    return -amount if negative else amount
+
+class StatementParser(ABC):
+    """Turns a bank statement, read line by line, into transactions.
+
+    `parse` yields `(line_number, transaction_or_error)` pairs as it goes so
+    the caller never holds the whole file; a bad row yields the error message
+    instead of stopping the import.
+    """
+
+    def parse(self, lines: Iterable[str]) -> Iterator[Tuple[int, object]]:
+        for line_number, fields in self._records(lines):
+            try:
+                yield line_number, self._to_transaction(fields)
+            except ValueError as e:
+                yield line_number, str(e)
+
+    @abstractmethod
+    def _records(self, lines: Iterable[str]) -> Iterator[Tuple[int, Dict[str, str]]]:
+        pass
+
+    def _to_transaction(self, fields: Dict[str, str]) -> Transaction:
+        label = (fields.get("label") or "").strip()
+        if not label:
+            raise ValueError("Missing label")
+        if not fields.get("date"):
+            raise ValueError("Missing date")
+
+        if fields.get("amount"):
+            amount = parse_amount(fields["amount"])
+        elif fields.get("debit") or fields.get("credit"):
+            amount = parse_amount(fields.get("credit") or "0") - abs(parse_amount(fields.get("debit") or "0"))
+        else:
+            raise ValueError("Missing amount")
+
+        tx_type = (fields.get("type") or "").strip().lower()
+        if tx_type not in ("revenu", "depense"):
+            tx_type = "revenu" if amount > 0 else "depense"
+
+        return Transaction(
+            label=label[:200],
+            amount=round(abs(amount), 2),
+            type=tx_type,
+            category=(fields.get("category") or "").strip() or "Autre",
+            date=parse_date(fields["date"]),
+        )
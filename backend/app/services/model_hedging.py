@@ -0,0 +1,184 @@
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+# "auto" hedges a call once it runs well past the model's usual latency, a
+# number waits that many seconds, "off" tries the models one after another
+HEDGE_AUTO = "auto"
+_hedge_delay = os.getenv("AI_HEDGE_DELAY_SECONDS", HEDGE_AUTO).lower()
+HEDGE_DELAY_SECONDS: Union[float, str, None] = (
+    None if _hedge_delay == "off" else HEDGE_AUTO if _hedge_delay == HEDGE_AUTO else float(_hedge_delay)
+)
+HEDGE_MIN_DELAY_SECONDS = float(os.getenv("AI_HEDGE_MIN_DELAY_SECONDS", "2.0"))
+HEDGE_LATENCY_FACTOR = 1.5
+# before a model has answered once, only hedge calls that are clearly stuck
+HEDGE_COLD_DELAY_SECONDS = 10.0
+HEDGE_TIMEOUT_SECONDS = float(os.getenv("AI_HEDGE_TIMEOUT_SECONDS", "45"))
+
+class ModelStats:
+    """Rolling latency and error rate per model, used to try the healthiest first.
+
+    Latency and error rate are exponentially weighted so a model that recovers
+    climbs back up the list after a few good calls.
+    """
+
+    def __init__(self, alpha: float = 0.2, error_penalty_seconds: float = 10.0):
+        self.alpha = alpha
+        self.error_penalty_seconds = error_penalty_seconds
+        self._models: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def _entry(self, model: str) -> Dict[str, float]:
+        return self._models.setdefault(
+            model, {"calls": 0, "errors": 0, "cancelled": 0, "latency": 0.0, "error_rate": 0.0}
+        )
+
+    def _observe_latency(self, entry: Dict[str, float], latency: float):
+        entry["latency"] = latency if not entry["calls"] else entry["latency"] + self.alpha * (latency - entry["latency"])
+        entry["calls"] += 1
+
+    def record_success(self, model: str, latency: float):
+        with self._lock:
+            entry = self._entry(model)
+            entry["error_rate"] *= 1 - self.alpha
+            self._observe_latency(entry, latency)
+
+    def record_failure(self, model: str):
+        with self._lock:
+            entry = self._entry(model)
+            entry["error_rate"] += self.alpha * (1 - entry["error_rate"])
+            entry["calls"] += 1
+            entry["errors"] += 1
+
+    def record_cancelled(self, model: str, elapsed: float):
+        """A call that lost the race isn't an error, but it took at least
+        `elapsed`: count that as a latency sample when it is worse than usual."""
+        with self._lock:
+            entry = self._entry(model)
+            entry["cancelled"] += 1
+            if not entry["calls"] or elapsed > entry["latency"]:
+                self._observe_latency(entry, elapsed)
+
+    def latency(self, model: str) -> Optional[float]:
+        """Typical latency of the model's answers; None before the first one."""
+        with self._lock:
+            entry = self._models.get(model)
+            return entry["latency"] if entry and entry["latency"] > 0 else None
+
+    def score(self, model: str) -> float:
+        entry = self._models.get(model)
+        if not entry or not entry["calls"]:
+            return 0.0
+        return entry["latency"] + entry["error_rate"] * self.error_penalty_seconds
+
+    def order(self, models: Sequence[str]) -> List[str]:
+        """Models by expected cost; unseen models and ties keep the configured order."""
+        with self._lock:
+            ranked = sorted(enumerate(models), key=lambda im: (self.score(im[1]), im[0]))
+        return [model for _, model in ranked]
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {model: dict(entry) for model, entry in self._models.items()}
+
+class HedgedModelCaller:
+    """Call a list of models with hedging: start the best-ranked model, launch
+    the next one whenever `hedge_delay` passes without an answer (or as soon as
+    a running call fails), keep the first valid result and cancel the rest.
+
+    A hedge is a second paid request, so the default (HEDGE_AUTO) waits for
+    HEDGE_LATENCY_FACTOR times the latest model's usual latency, never less
+    than `min_delay`: only the slow tail gets a duplicate call. A number is a
+    fixed delay; with hedge_delay=None the models are tried strictly one
+    after another.
+
+    `call(model)` returns the raw model output; `parse` turns it into the result
+    and raises on anything invalid, which counts as a failure of that model.
+    """
+
+    def __init__(
+        self,
+        models: Sequence[str],
+        stats: ModelStats,
+        hedge_delay: Union[float, str, None] = HEDGE_DELAY_SECONDS,
+        timeout: float = HEDGE_TIMEOUT_SECONDS,
+        min_delay: float = HEDGE_MIN_DELAY_SECONDS,
+    ):
+        self.models = list(models)
+        self.stats = stats
+        self.hedge_delay = hedge_delay
+        self.timeout = timeout
+        self.min_delay = min_delay
+
+    def delay(self, model: str) -> Optional[float]:
+        """How long to wait on `model` before hedging; None never hedges."""
+        if self.hedge_delay != HEDGE_AUTO:
+            return self.hedge_delay
+        latency = self.stats.latency(model)
+        if latency is None:
+            return max(self.min_delay, HEDGE_COLD_DELAY_SECONDS)
+        return max(self.min_delay, latency * HEDGE_LATENCY_FACTOR)
+
+    async def _attempt(self, model: str, call: Callable[[str], Awaitable[Any]], parse: Callable[[Any], Any]):
+        started = time.perf_counter()
+        try:
+            result = parse(await call(model))
+        except asyncio.CancelledError:
+            self.stats.record_cancelled(model, time.perf_counter() - started)
+            raise
+        except Exception:
+            self.stats.record_failure(model)
+            raise
+        self.stats.record_success(model, time.perf_counter() - started)
+        return result
+
+    async def run(self, call: Callable[[str], Awaitable[Any]], parse: Callable[[Any], Any] = lambda raw: raw):
+        return await asyncio.wait_for(self._race(call, parse), timeout=self.timeout)
+
+    async def _race(self, call, parse):
+        pending_models = self.stats.order(self.models)
+        running: Dict[asyncio.Task, str] = {}
+        last_error: Optional[BaseException] = None
+        delay: Optional[float] = None
+
+        def launch():
+            nonlocal delay
+            model = pending_models.pop(0)
+            delay = self.delay(model)
+            running[asyncio.create_task(self._attempt(model, call, parse))] = model
+
+        launch()
+        try:
+            while running:
+                done, _ = await asyncio.wait(
+                    running,
+                    timeout=delay if pending_models else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    model = running.pop(task)
+                    if task.exception() is None:
+                        return task.result()
+                    last_error = task.exception()
+                    logger.error(f"Failed with {model}: {last_error}")
+
+                # woken by a timeout or by failures only: bring in the next model
+                if pending_models:
+                    if not done:
+                        logger.info(f"No answer within {delay:.1f}s, hedging with {pending_models[0]}")
+                    launch()
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        raise last_error or RuntimeError("No model to call")
+
+# shared by the analytics audit and the metrics endpoint
+audit_model_stats = ModelStats()
@@ -1,5 +1,6 @@
 from app.services.validators.transaction_validator import TransactionValidator
-from datetime import datetime, timedelta
+from datetime import timedelta
+from app.core.dates import to_date
 
 class DuplicateValidator(TransactionValidator):
     def __init__(self, transaction_repo, next_validator=None):
@@ -8,12 +9,12 @@ class DuplicateValidator(TransactionValidator):
 
     def _check(self, transaction, user_id: int, context: dict) -> tuple[bool, str]:
         try:
-            tx_date = datetime.strptime(transaction.date, "%Y-%m-%d")
+            tx_date = to_date(transaction.date)
         except Exception:
             return True, ""
 
-        start_date = (tx_date - timedelta(days=7)).strftime("%Y-%m-%d")
-        end_date = (tx_date + timedelta(days=1)).strftime("%Y-%m-%d")
+        start_date = tx_date - timedelta(days=7)
+        end_date = tx_date + timedelta(days=1)
 
         recent_txs = self.transaction_repo.get_by_date_range(
             start_date, end_date, user_id
@@ -24,7 +25,7 @@ class DuplicateValidator(TransactionValidator):
                 tx["label"] == transaction.label
                 and tx["amount"] == transaction.amount
                 and tx["type"] == transaction.type
-                and tx["date"] == transaction.date
+                and tx["date"] == tx_date.isoformat()
             ):
                 return (
                     False,
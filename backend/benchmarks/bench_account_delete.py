@@ -0,0 +1,86 @@
+"""Account deletion: per-row ORM deletes (the previous implementation) versus
+one set-based DELETE per table, on a throwaway SQLite file.
+
+    python benchmarks/bench_account_delete.py --rows 100000
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel, create_engine, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+import app.core  # noqa: F401  (app.routes must not be the first app package imported)
+from app.database import apply_sqlite_tuning
+from app.models.domain import User
+from app.routes.account_routes import _user_owned_tables, delete_user_rows
+
+def populate(path: str, rows: int):
+    engine = create_engine(f"sqlite:///{path}")
+    SQLModel.metadata.create_all(engine)
+    rng = random.Random(5)
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "INSERT INTO users (id, username, email, hashed_password) VALUES (1, 'leaver', 'l@example.com', 'x'), (2, 'keeper', 'k@example.com', 'x')"
+        )
+        conn.exec_driver_sql(
+            "INSERT INTO transactions (label, amount, type, category, date, user_id) VALUES (?, ?, 'depense', 'Autre', ?, ?)",
+            [
+                (f"tx {i}", round(rng.uniform(1, 100), 2), str(date(2022, 1, 1) + timedelta(days=i % 900)), 1 if i % 10 else 2)
+                for i in range(rows)
+            ],
+        )
+        conn.exec_driver_sql(
+            "INSERT INTO pantry (item, qty, category, expiry, added_date, user_id) VALUES (?, '1', 'Epicerie', '', '2024-01-01', 1)",
+            [(f"item {i}",) for i in range(rows // 20)],
+        )
+        conn.exec_driver_sql(
+            "INSERT INTO fuel_entries (date, liters, total_cost, fuel_type, is_full_tank, user_id) VALUES ('2024-01-01', 40, 70, 'diesel', 1, 1)",
+            [()] * (rows // 20),
+        )
+    engine.dispose()
+
+async def legacy_delete(session: AsyncSession, user_id: int):
+    for table in _user_owned_tables():
+        model = next(m for m in SQLModel.__subclasses__() if getattr(m, "__table__", None) is table)
+        for item in (await session.exec(select(model).where(model.user_id == user_id))).all():
+            await session.delete(item)
+    user = await session.get(User, user_id)
+    await session.delete(user)
+
+async def run(path: str, strategy):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    apply_sqlite_tuning(engine.sync_engine)
+    statements = []
+    event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(1))
+    async with AsyncSession(engine) as session:
+        t0 = time.perf_counter()
+        await strategy(session, 1)
+        await session.commit()
+        elapsed = time.perf_counter() - t0
+    await engine.dispose()
+    return elapsed, len(statements)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, strategy in (("per-row ORM", legacy_delete), ("set-based", delete_user_rows)):
+            path = os.path.join(tmp, f"{name.split()[0]}.db")
+            populate(path, args.rows)
+            elapsed, statements = asyncio.run(run(path, strategy))
+            print(f"{name:<12} {elapsed:8.2f}s  {statements:7d} statements")
+
+if __name__ == "__main__":
+    main()
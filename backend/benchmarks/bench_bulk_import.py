@@ -0,0 +1,73 @@
+"""CSV import throughput: batched bulk_create versus one create() per row.
+
+    python benchmarks/bench_bulk_import.py --rows 50000 --batch-sizes 100 1000 5000
+"""
+import argparse
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlmodel import SQLModel, Session, create_engine
+
+import app.core  # noqa: F401  (app.services must not be the first app package imported)
+from app.database import apply_sqlite_tuning
+from app.repositories import TransactionRepository
+from app.services import TransactionImportService
+from app.services.importers import CsvStatementParser
+
+def make_csv(rows: int) -> str:
+    rng = random.Random(3)
+    out = io.StringIO()
+    out.write("Date;Libellé;Montant;Catégorie\n")
+    for i in range(rows):
+        day = date(2023, 1, 1) + timedelta(days=rng.randrange(730))
+        amount = rng.uniform(1, 2500) if rng.random() < 0.1 else -rng.uniform(1, 150)
+        out.write(f"{day:%d/%m/%Y};Operation {i};{amount:.2f};{rng.choice(['Alimentation', 'Transport', 'Autre'])}\n")
+    return out.getvalue()
+
+def fresh_engine(tmp: str, name: str):
+    engine = create_engine(f"sqlite:///{os.path.join(tmp, name)}")
+    apply_sqlite_tuning(engine)
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("INSERT INTO users (id, username, email, hashed_password) VALUES (1, 'bench', 'b@example.com', 'x')")
+    return engine
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--per-row-sample", type=int, default=1000, help="rows timed for the one-by-one baseline")
+    args = parser.parse_args()
+
+    text = make_csv(args.rows)
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = fresh_engine(tmp, "per_row.db")
+        sample = [tx for _, tx in CsvStatementParser().parse(io.StringIO(text)) if not isinstance(tx, str)][: args.per_row_sample]
+        with Session(engine) as session:
+            repo = TransactionRepository(session)
+            t0 = time.perf_counter()
+            for tx in sample:
+                repo.create(tx, 1)
+            per_row = (time.perf_counter() - t0) / len(sample)
+        engine.dispose()
+        print(f"create() per row : {per_row * 1000:.2f} ms/row -> ~{per_row * args.rows:.1f}s for {args.rows} rows")
+
+        for batch_size in args.batch_sizes:
+            engine = fresh_engine(tmp, f"bulk_{batch_size}.db")
+            with Session(engine) as session:
+                service = TransactionImportService(TransactionRepository(session))
+                t0 = time.perf_counter()
+                result = service.import_statement(io.StringIO(text), CsvStatementParser(), 1, batch_size=batch_size)
+                elapsed = time.perf_counter() - t0
+            engine.dispose()
+            print(f"bulk batch {batch_size:>5}: {result['imported']} rows in {elapsed:.2f}s ({result['imported'] / elapsed:,.0f} rows/s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Dashboard aggregation cost: the original multi-pass builder over every
+transaction versus the ledger-backed path the dashboard ships with (summary
+read from a throwaway SQLite file, then DashboardTotals.from_ledger).
+
+    python benchmarks/bench_dashboard_aggregation.py --sizes 10000 100000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import timeit
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlmodel import SQLModel, Session, create_engine
+
+import app.core  # noqa: F401  (app.services must not be the first app package imported)
+import app.models.domain  # noqa: F401
+from app.models.domain import Transaction
+from app.repositories import LedgerRepository
+from app.services.builders import DashboardTotals
+from app.services.prediction_service import PredictionService
+
+CATEGORIES = ["Alimentation", "Logement", "Transport", "Loisirs", "Santé", "Autre"]
+
+def make_transactions(n: int, today: date):
+    rng = random.Random(7)
+    txs = []
+    for i in range(n):
+        is_income = rng.random() < 0.1
+        txs.append({
+            "id": i,
+            "label": f"tx {i}",
+            "amount": round(rng.uniform(1, 2500 if is_income else 150), 2),
+            "type": "revenu" if is_income else "depense",
+            "category": rng.choice(CATEGORIES),
+            "date": str(today - timedelta(days=rng.randrange(3 * 365))),
+        })
+    return txs
+
+def legacy(transactions, recurring, today):
+    """The pre-ledger DashboardService/DashboardDataBuilder computation, pass for pass."""
+    current_month = str(today)[:7]
+    balance = sum(t["amount"] if t["type"] == "revenu" else -t["amount"] for t in transactions)
+    income = sum(t["amount"] for t in transactions if t["type"] == "revenu" and t["date"].startswith(current_month))
+    expense = sum(t["amount"] for t in transactions if t["type"] != "revenu" and t["date"].startswith(current_month))
+    categories = {}
+    for t in transactions:
+        if t["type"] == "depense":
+            categories[t["category"]] = categories.get(t["category"], 0) + t["amount"]
+    balance = sum(t["amount"] if t["type"] == "revenu" else -t["amount"] for t in transactions)
+    for _ in range(2):
+        month_expenses = sum(
+            t["amount"] for t in transactions if t["type"] != "revenu" and t["date"].startswith(current_month)
+        )
+    return balance, income, expense, categories, month_expenses
+
+def ledger(session, recurring, today, prediction):
+    summary = LedgerRepository(session).get_summary(1, str(today)[:7])
+    totals = DashboardTotals.from_ledger(summary, recurring, today)
+    prediction.predict_month_end(totals.balance, recurring, totals.expense)
+    return totals
+
+def populate(engine, transactions):
+    with engine.begin() as conn:
+        conn.exec_driver_sql("INSERT INTO users (id, username, email, hashed_password) VALUES (1, 'bench', 'bench@example.com', 'x')")
+        conn.execute(
+            Transaction.__table__.insert(),
+            [{**tx, "date": date.fromisoformat(tx["date"]), "user_id": 1} for tx in transactions],
+        )
+    with Session(engine) as session:
+        LedgerRepository(session).backfill()
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    today = date.today()
+    recurring = [{"label": "Loyer", "amount": 650.0, "day": 5}, {"label": "Internet", "amount": 30.0, "day": 20}]
+    prediction = PredictionService()
+
+    for n in args.sizes:
+        txs = make_transactions(n, today)
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+            SQLModel.metadata.create_all(engine)
+            populate(engine, txs)
+
+            with Session(engine) as session:
+                totals = ledger(session, recurring, today, prediction)
+                assert round(legacy(txs, recurring, today)[0], 2) == round(totals.balance, 2)
+
+                runs = {
+                    "multi-pass (legacy)": lambda: legacy(txs, recurring, today),
+                    "ledger summary": lambda: ledger(session, recurring, today, prediction),
+                }
+                print(f"\n{n} transactions")
+                baseline = None
+                for name, fn in runs.items():
+                    best = min(timeit.repeat(fn, number=1, repeat=args.repeat))
+                    baseline = baseline or best
+                    print(f"  {name:<22} {best * 1000:9.3f} ms   x{baseline / best:8.1f}")
+            engine.dispose()
+
+if __name__ == "__main__":
+    main()
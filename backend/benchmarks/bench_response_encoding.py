@@ -0,0 +1,74 @@
+"""Serialization CPU and bytes on the wire for a large dashboard-sized payload:
+FastAPI's previous default path (jsonable_encoder + json.dumps) versus
+ORJSONResponse, and the body size with gzip / brotli.
+
+    python benchmarks/bench_response_encoding.py --transactions 5000
+"""
+import argparse
+import os
+import random
+import sys
+import timeit
+import zlib
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.core.compression import brotli, COMPRESSION_BROTLI_QUALITY, COMPRESSION_GZIP_LEVEL
+from app.core.responses import ORJSONResponse
+
+def make_payload(n: int) -> dict:
+    rng = random.Random(11)
+    start = date(2023, 1, 1)
+    return {
+        "transactions": [
+            {
+                "id": i,
+                "label": f"Operation {i}",
+                "amount": round(rng.uniform(1, 150), 2),
+                "type": "depense",
+                "category": rng.choice(["Alimentation", "Transport", "Loisirs"]),
+                "date": (start + timedelta(days=i % 700)).isoformat(),
+                "user_id": 1,
+            }
+            for i in range(n)
+        ],
+        "fuel": [
+            {"id": i, "date": "2024-01-01", "liters": 40.2, "total_cost": 71.3, "odometer": 120000.0 + i,
+             "fuel_type": "diesel", "station": "Total", "is_full_tank": True, "note": None, "user_id": 1}
+            for i in range(n // 10)
+        ],
+        "balance": 1234.56,
+        "categories": {"Alimentation": 420.0, "Transport": 130.5},
+    }
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--transactions", type=int, default=5000)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    payload = make_payload(args.transactions)
+    before = timeit.timeit(lambda: JSONResponse(jsonable_encoder(payload)), number=args.number) / args.number
+    after = timeit.timeit(lambda: ORJSONResponse(payload), number=args.number) / args.number
+    print(f"jsonable_encoder + json.dumps: {before * 1000:8.2f} ms")
+    print(f"ORJSONResponse               : {after * 1000:8.2f} ms  ({before / after:.1f}x faster)")
+
+    body = ORJSONResponse(payload).body
+    print(f"\nidentity : {len(body):>9,} bytes")
+    gz = zlib.compressobj(COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31)
+    gz_body = gz.compress(body) + gz.flush()
+    gz_time = timeit.timeit(lambda: zlib.compress(body, COMPRESSION_GZIP_LEVEL), number=args.number) / args.number
+    print(f"gzip -{COMPRESSION_GZIP_LEVEL}  : {len(gz_body):>9,} bytes ({len(body) / len(gz_body):.1f}x) in {gz_time * 1000:.2f} ms")
+    if brotli is not None:
+        br_body = brotli.compress(body, quality=COMPRESSION_BROTLI_QUALITY)
+        br_time = timeit.timeit(lambda: brotli.compress(body, quality=COMPRESSION_BROTLI_QUALITY), number=args.number) / args.number
+        print(f"brotli q{COMPRESSION_BROTLI_QUALITY}: {len(br_body):>9,} bytes ({len(body) / len(br_body):.1f}x) in {br_time * 1000:.2f} ms")
+    else:
+        print("brotli   : not installed")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Mixed read/write throughput on the SQLite fallback with and without the
+connection tuning (WAL, synchronous=NORMAL, mmap, cache, busy_timeout).
+
+Each worker process stands in for a uvicorn worker and drives the real
+TransactionRepository against a shared throwaway file:
+
+    python benchmarks/bench_sqlite_concurrency.py --workers 4 --seconds 5 --write-ratio 0.2
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+USERS = 20
+
+def worker(path: str, tuned: bool, seconds: float, write_ratio: float, seed: int, results):
+    sys.stdout = open(os.devnull, "w")  # repository writes log to stdout
+    from sqlalchemy import exc
+    from sqlmodel import Session, create_engine
+    import app.core  # noqa: F401  (app.repositories must not be the first app package imported)
+    from app.database import apply_sqlite_tuning
+    from app.models import Transaction
+    from app.repositories import TransactionRepository
+
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    if tuned:
+        apply_sqlite_tuning(engine)
+
+    rng = random.Random(seed)
+    reads, writes, errors, latencies = 0, 0, 0, []
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        user_id = rng.randrange(1, USERS + 1)
+        t0 = time.perf_counter()
+        try:
+            with Session(engine) as session:
+                repo = TransactionRepository(session)
+                if rng.random() < write_ratio:
+                    repo.create(
+                        Transaction(
+                            label="bench", amount=round(rng.uniform(1, 100), 2), type="depense",
+                            category="Autre", date=date(2024, 1, 1) + timedelta(days=rng.randrange(365)),
+                        ),
+                        user_id,
+                    )
+                    writes += 1
+                else:
+                    repo.get_page(user_id, limit=50)
+                    reads += 1
+        except exc.OperationalError:
+            errors += 1
+        latencies.append(time.perf_counter() - t0)
+    engine.dispose()
+    results.put((reads, writes, errors, latencies))
+
+def run(path: str, tuned: bool, args):
+    results = multiprocessing.Queue()
+    procs = [
+        multiprocessing.Process(target=worker, args=(path, tuned, args.seconds, args.write_ratio, i, results))
+        for i in range(args.workers)
+    ]
+    for p in procs:
+        p.start()
+    collected = [results.get() for _ in procs]
+    for p in procs:
+        p.join()
+
+    reads = sum(r[0] for r in collected)
+    writes = sum(r[1] for r in collected)
+    errors = sum(r[2] for r in collected)
+    latencies = sorted(latency for r in collected for latency in r[3])
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] if latencies else 0.0
+    label = "tuned" if tuned else "default"
+    print(
+        f"{label:<8} reads {reads / args.seconds:8.1f}/s  writes {writes / args.seconds:7.1f}/s  "
+        f"locked errors {errors:5d}  p50 {latencies[len(latencies) // 2] * 1000:7.2f} ms  p99 {p99 * 1000:8.2f} ms"
+    )
+
+def prepare(path: str, rows: int):
+    from sqlmodel import SQLModel, create_engine
+    import app.models.domain  # noqa: F401
+
+    engine = create_engine(f"sqlite:///{path}")
+    SQLModel.metadata.create_all(engine)
+    rng = random.Random(1)
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "INSERT INTO users (id, username, email, hashed_password) VALUES (?, ?, ?, 'x')",
+            [(i, f"u{i}", f"u{i}@example.com") for i in range(1, USERS + 1)],
+        )
+        conn.exec_driver_sql(
+            "INSERT INTO transactions (label, amount, type, category, date, user_id) VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                ("seed", round(rng.uniform(1, 100), 2), "depense", "Autre",
+                 str(date(2023, 1, 1) + timedelta(days=rng.randrange(365))), rng.randrange(1, USERS + 1))
+                for _ in range(rows)
+            ],
+        )
+    engine.dispose()
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--write-ratio", type=float, default=0.2)
+    parser.add_argument("--rows", type=int, default=50_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["SQLITE_DB_PATH"] = os.path.join(tmp, "unused.db")
+        os.environ["SQLITE_TUNING"] = "false"
+        for tuned in (False, True):
+            path = os.path.join(tmp, f"{'tuned' if tuned else 'default'}.db")
+            prepare(path, args.rows)
+            run(path, tuned, args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Query plans and latency of the transactions access paths, with and without
+the composite indexes from revision 5b7c1e9a4f20.
+
+Runs the real repository / analytics queries against a throwaway SQLite file:
+
+    python benchmarks/bench_transaction_indexes.py --rows 1000000 --users 1000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import event
+from sqlmodel import SQLModel, Session, create_engine
+
+import app.models.domain  # noqa: F401
+from app.models.domain import Transaction
+from app.repositories import TransactionRepository
+from app.routes.analytics import monthly_analytics
+
+CATEGORIES = ["Alimentation", "Logement", "Transport", "Loisirs", "Santé", "Autre"]
+
+def populate(engine, rows: int, users: int):
+    start = date(2020, 1, 1)
+    rng = random.Random(42)
+    batch = []
+    with engine.begin() as conn:
+        conn.exec_driver_sql("INSERT INTO users (id, username, email, hashed_password) VALUES (1, 'bench', 'bench@example.com', 'x')")
+        for i in range(rows):
+            is_income = rng.random() < 0.1
+            batch.append((
+                f"tx {i}",
+                round(rng.uniform(1, 2500 if is_income else 150), 2),
+                "revenu" if is_income else "depense",
+                rng.choice(CATEGORIES),
+                str(start + timedelta(days=rng.randrange(6 * 365))),
+                rng.randrange(1, users + 1),
+            ))
+            if len(batch) == 50_000:
+                conn.exec_driver_sql("INSERT INTO transactions (label, amount, type, category, date, user_id) VALUES (?, ?, ?, ?, ?, ?)", batch)
+                batch.clear()
+        if batch:
+            conn.exec_driver_sql("INSERT INTO transactions (label, amount, type, category, date, user_id) VALUES (?, ?, ?, ?, ?, ?)", batch)
+
+def workload(session: Session, user_id: int):
+    repo = TransactionRepository(session)
+    current_user = {"id": user_id}
+    return {
+        "get_all": lambda: repo.get_all(user_id),
+        "get_by_year": lambda: repo.get_by_year("2023", user_id),
+        "get_by_date_range": lambda: repo.get_by_date_range("2023-03-01", "2023-03-08", user_id),
+        "analytics_monthly": lambda: monthly_analytics("2023", "3", current_user, session),
+    }
+
+def run(engine, label: str, user_id: int, repeat: int):
+    statements = {}
+    current = {"name": None}
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if current["name"] and statement.lstrip().upper().startswith("SELECT"):
+            statements.setdefault(current["name"], []).append((statement, parameters))
+
+    print(f"\n=== {label} ===")
+    with Session(engine) as session:
+        for name, query in workload(session, user_id).items():
+            current["name"] = name
+            query()
+            current["name"] = None
+            timings = []
+            for _ in range(repeat):
+                session.expire_all()
+                t0 = time.perf_counter()
+                query()
+                timings.append(time.perf_counter() - t0)
+            timings.sort()
+            print(f"{name:<20} median {timings[len(timings) // 2] * 1000:8.2f} ms   best {timings[0] * 1000:8.2f} ms")
+
+    event.remove(engine, "before_cursor_execute", capture)
+
+    raw = engine.raw_connection()
+    try:
+        for name, captured in statements.items():
+            for statement, parameters in captured:
+                plan = raw.execute(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+                print(f"  [{name}] " + " | ".join(row[-1] for row in plan))
+    finally:
+        raw.close()
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        SQLModel.metadata.create_all(engine)
+        indexes = list(Transaction.__table__.indexes)
+        for index in indexes:
+            index.drop(bind=engine)
+
+        t0 = time.perf_counter()
+        populate(engine, args.rows, args.users)
+        print(f"Inserted {args.rows} transactions for {args.users} users in {time.perf_counter() - t0:.1f}s")
+
+        run(engine, "before (primary key only)", user_id=1, repeat=args.repeat)
+
+        t0 = time.perf_counter()
+        for index in indexes:
+            index.create(bind=engine)
+        with engine.begin() as conn:
+            conn.exec_driver_sql("ANALYZE")
+        print(f"\nBuilt indexes in {time.perf_counter() - t0:.1f}s")
+
+        run(engine, "after (composite indexes)", user_id=1, repeat=args.repeat)
+        engine.dispose()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Latency of an unrelated endpoint while a burst of logins is being served.
+
+Drives the real app in-process over ASGI (one event loop, like one uvicorn
+worker) against a throwaway SQLite file. --blocking restores the old
+behaviour of hashing on the event loop for comparison:
+
+    python benchmarks/load_login_storm.py --logins 200 --concurrency 50
+    python benchmarks/load_login_storm.py --logins 200 --concurrency 50 --blocking
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+async def storm(app, args):
+    import httpx
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.post(
+            "/api/auth/register",
+            json={"username": "storm", "password": "password123", "email": "storm@example.com"},
+        )
+
+        done = asyncio.Event()
+        probe_latencies = []
+        statuses = {}
+
+        async def probe():
+            while not done.is_set():
+                t0 = time.perf_counter()
+                await client.get("/")
+                probe_latencies.append(time.perf_counter() - t0)
+                await asyncio.sleep(args.probe_interval)
+
+        sem = asyncio.Semaphore(args.concurrency)
+
+        async def login():
+            async with sem:
+                response = await client.post(
+                    "/api/auth/login", data={"username": "storm", "password": "password123"}
+                )
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        probe_task = asyncio.create_task(probe())
+        t0 = time.perf_counter()
+        await asyncio.gather(*(login() for _ in range(args.logins)))
+        elapsed = time.perf_counter() - t0
+        done.set()
+        await probe_task
+
+    print(f"{args.logins} logins in {elapsed:.2f}s ({args.logins / elapsed:.1f}/s), statuses {statuses}")
+    print(
+        f"GET / during storm: n={len(probe_latencies)} "
+        f"p50 {percentile(probe_latencies, 50) * 1000:.1f} ms  "
+        f"p99 {percentile(probe_latencies, 99) * 1000:.1f} ms  "
+        f"max {max(probe_latencies) * 1000:.1f} ms"
+    )
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--probe-interval", type=float, default=0.005)
+    parser.add_argument("--blocking", action="store_true", help="hash on the event loop (pre-pool behaviour)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ.pop("DATABASE_URL", None)
+        os.environ.pop("POSTGRES_URL", None)
+        os.environ["SQLITE_DB_PATH"] = os.path.join(tmp, "bench.db")
+
+        from main import app
+        from app import auth_utils
+
+        if args.blocking:
+            async def inline(func, *func_args):
+                return func(*func_args)
+            auth_utils._run_hash = inline
+
+        mode = "blocking" if args.blocking else f"pool of {auth_utils.PASSWORD_HASH_WORKERS}"
+        print(f"bcrypt rounds {auth_utils.BCRYPT_ROUNDS}, hashing: {mode}")
+        asyncio.run(storm(app, args))
+
+if __name__ == "__main__":
+    main()
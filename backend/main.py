@@ -7,9 +7,12 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.database import init_db
-from app.routes import dashboard, transactions, pantry, recurring, goals, coach, settings, analytics, auth, account_routes, market, fuel
+from app.core.compression import CompressionMiddleware
+from app.core.etag import ETagMiddleware
+from app.core.responses import ORJSONResponse
+from app.routes import dashboard, transactions, pantry, recurring, goals, coach, settings, analytics, auth, account_routes, market, fuel, internal
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 @app.get("/")
 def read_root():
@@ -29,6 +32,8 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(ETagMiddleware)
+app.add_middleware(CompressionMiddleware)
 
 # Routes
 app.include_router(auth.router, prefix="/api")
@@ -42,4 +47,5 @@ app.include_router(settings.router, prefix="/api")
 app.include_router(analytics.router, prefix="/api")
 app.include_router(account_routes.router, prefix="/api")
 app.include_router(market.router, prefix="/api")
-app.include_router(fuel.router, prefix="/api")
\ No newline at end of file
+app.include_router(fuel.router, prefix="/api")
+app.include_router(internal.router, prefix="/api")
\ No newline at end of file
@@ -1,60 +1,61 @@
+import os
+
+# cheap hashes keep the suite fast; must be set before app.auth_utils is imported
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
 import pytest
-import sqlite3
 from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel, Session, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 from main import app
-from app.database import get_db_connection
-from app.auth_utils import get_password_hash
+from app import auth_utils
+from app.database import get_session, get_async_session
+from app.core.cache import user_cache
+
+@pytest.fixture(scope="function")
+def db_path(tmp_path):
+    # a file rather than :memory: so the sync and async engines see the same data
+    return tmp_path / "test.db"
 
-# Mock DB Connection
 @pytest.fixture(scope="function")
-def db_connection():
-    connection = sqlite3.connect(":memory:", check_same_thread=False)
-    connection.row_factory = sqlite3.Row
-    
-    # Init Schema
-    c = connection.cursor()
-    c.execute('''CREATE TABLE IF NOT EXISTS users (id INTEGER PRIMARY KEY AUTOINCREMENT, username TEXT UNIQUE, email TEXT UNIQUE, hashed_password TEXT)''')
-    c.execute('''CREATE TABLE IF NOT EXISTS transactions (id INTEGER PRIMARY KEY AUTOINCREMENT, label TEXT, amount REAL, type TEXT, category TEXT, date TEXT, user_id INTEGER, FOREIGN KEY(user_id) REFERENCES users(id))''')
-    # Add other tables if needed for specific tests:
-    c.execute('''CREATE TABLE IF NOT EXISTS pantry (id INTEGER PRIMARY KEY AUTOINCREMENT, item TEXT, qty TEXT, category TEXT, expiry TEXT, added_date TEXT, user_id INTEGER, FOREIGN KEY(user_id) REFERENCES users(id))''')
-    c.execute('''CREATE TABLE IF NOT EXISTS recurring (id INTEGER PRIMARY KEY AUTOINCREMENT, label TEXT, amount REAL, day INTEGER, type TEXT, user_id INTEGER, FOREIGN KEY(user_id) REFERENCES users(id))''')
-    c.execute('''CREATE TABLE IF NOT EXISTS goals (id INTEGER PRIMARY KEY AUTOINCREMENT, label TEXT, target REAL, saved REAL, deadline TEXT, priority TEXT, user_id INTEGER, FOREIGN KEY(user_id) REFERENCES users(id))''')
-    c.execute('''CREATE TABLE IF NOT EXISTS profile (id INTEGER PRIMARY KEY AUTOINCREMENT, supermarket TEXT, diet TEXT, initial_balance REAL, active_theme TEXT DEFAULT 'default', unlocked_themes TEXT DEFAULT 'default', user_id INTEGER, FOREIGN KEY(user_id) REFERENCES users(id))''')
-    c.execute('''CREATE TABLE IF NOT EXISTS plans (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, content_json TEXT, created_at TEXT, user_id INTEGER, FOREIGN KEY(user_id) REFERENCES users(id))''')
-    c.execute('''CREATE TABLE IF NOT EXISTS budget_limits (id INTEGER PRIMARY KEY AUTOINCREMENT, category TEXT, amount REAL, user_id INTEGER, FOREIGN KEY(user_id) REFERENCES users(id))''')
-    c.execute('''CREATE TABLE IF NOT EXISTS user_themes (id INTEGER PRIMARY KEY AUTOINCREMENT, user_id INTEGER, theme_id TEXT, FOREIGN KEY(user_id) REFERENCES users(id))''')
-
-    connection.commit()
-    
-    yield connection
-    connection.close()
-
-# Override Dependency
+def engine(db_path):
+    engine = create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False})
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+@pytest.fixture(scope="function")
+def async_engine(engine, db_path):
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    yield async_engine
+    async_engine.sync_engine.dispose()
+
 @pytest.fixture(scope="function")
-def client(db_connection):
-    def override_get_db_connection():
-        return db_connection
-
-    app.dependency_overrides[get_db_connection] = override_get_db_connection
-    
-    # Also patch usage in auth.py where it might be imported directly
-    # Ideally usage should be via dependency, but if it is direct import, we might need patch.
-    # However, for simplicity, let's assume factories use app.database.get_db_connection
-    # and we can patch it using unittest.mock if needed, but dependency override is cleaner for Depends().
-    # For `auth.py` which calls `get_db_connection()` directly, we definitely need to patch it.
-    
-    import app.routes.auth
-    import app.core.factories
-    
-    orig_auth_db = app.routes.auth.get_db_connection
-    orig_factory_db = app.core.factories.get_db_connection
-    
-    app.routes.auth.get_db_connection = override_get_db_connection
-    app.core.factories.get_db_connection = override_get_db_connection
-    
+def session(engine):
+    with Session(engine) as session:
+        yield session
+
+@pytest.fixture(scope="function")
+def client(engine, async_engine, monkeypatch):
+    def override_get_session():
+        with Session(engine) as session:
+            yield session
+
+    async def override_get_async_session():
+        async with AsyncSession(async_engine, expire_on_commit=False) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_async_session] = override_get_async_session
+
+    # get_current_user opens its own session instead of going through Depends()
+    monkeypatch.setattr(auth_utils, "get_async_session", override_get_async_session)
+
+    # each test starts a fresh database whose user ids repeat
+    user_cache.clear()
+
     with TestClient(app) as c:
         yield c
-        
-    app.routes.auth.get_db_connection = orig_auth_db
-    app.core.factories.get_db_connection = orig_factory_db
+
     app.dependency_overrides.clear()
@@ -0,0 +1,27 @@
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+from app.models.domain import FuelEntry, Transaction, User
+
+def register(client: TestClient, username: str):
+    client.post(
+        "/api/auth/register",
+        json={"username": username, "password": "password123", "email": f"{username}@example.com"},
+    )
+
+def fill(client: TestClient):
+    client.post("/api/transactions", json={"label": "Rent", "amount": 500.0, "type": "depense", "date": "2024-03-01"})
+    client.post("/api/fuel", json={"date": "2024-03-02", "liters": 40.0, "total_cost": 70.0})
+
+def test_delete_account_removes_every_owned_row(client: TestClient, engine):
+    register(client, "keeper")
+    fill(client)
+    client.post("/api/auth/logout")
+
+    register(client, "leaver")
+    fill(client)
+    assert client.delete("/api/account/me").status_code == 200
+
+    with Session(engine) as session:
+        assert [u.username for u in session.exec(select(User)).all()] == ["keeper"]
+        assert len(session.exec(select(Transaction)).all()) == 1
+        assert len(session.exec(select(FuelEntry)).all()) == 1
@@ -0,0 +1,36 @@
+import gzip
+import json
+from fastapi.testclient import TestClient
+
+def setup_account(client: TestClient):
+    client.post(
+        "/api/auth/register",
+        json={"username": "exporter", "password": "password123", "email": "exporter@example.com"},
+    )
+    for i in range(3):
+        client.post(
+            "/api/transactions",
+            json={"label": f"Tx {i}", "amount": 10.0 + i, "type": "depense", "category": "Autre", "date": f"2024-03-0{i + 1}"},
+        )
+
+def test_export_streams_valid_json(client: TestClient):
+    setup_account(client)
+    response = client.get("/api/account/export")
+    assert response.status_code == 200
+    assert "hess_data_exporter.json" in response.headers["content-disposition"]
+
+    data = response.json()
+    assert data["user"]["username"] == "exporter"
+    assert "hashed_password" not in data["user"]
+    assert sorted(tx["date"] for tx in data["transactions"]) == ["2024-03-01", "2024-03-02", "2024-03-03"]
+    assert data["goals"] == [] and data["plans"] == []
+
+def test_export_ndjson_gzip(client: TestClient):
+    setup_account(client)
+    response = client.get("/api/account/export?format=ndjson&gzip=true")
+    assert response.headers["content-type"] == "application/gzip"
+    assert response.headers["content-disposition"].endswith(".ndjson.gz")
+
+    lines = [json.loads(line) for line in gzip.decompress(response.content).decode().splitlines()]
+    assert lines[0]["table"] == "user"
+    assert [line["data"]["label"] for line in lines if line["table"] == "transactions"] == ["Tx 0", "Tx 1", "Tx 2"]
@@ -38,3 +38,22 @@ def test_get_monthly_analytics(client: TestClient):
     assert data["stats"]["income"] == 3000.0
     assert data["stats"]["expense"] == 1000.0
     assert data["stats"]["net"] == 2000.0
+
+def test_monthly_analytics_uses_month_bounds(client: TestClient):
+    client.post("/api/auth/register", json={"username": "bounds", "password": "password123", "email": "bounds@example.com"})
+    for label, amount, tx_type, day in [
+        ("Salary", 2500.0, "revenu", "2024-02-01"),
+        ("Rent", 800.0, "depense", "2024-02-29"),
+        ("January", 40.0, "depense", "2024-01-31"),
+        ("March", 60.0, "depense", "2024-03-01"),
+    ]:
+        client.post("/api/transactions", json={"label": label, "amount": amount, "type": tx_type, "category": "Misc", "date": day})
+
+    data = client.get("/api/analytics/monthly?year=2024&month=2").json()
+    assert len(data["daily_data"]) == 29
+    assert data["daily_data"][0]["income"] == 2500.0
+    assert data["daily_data"][28]["expense"] == 800.0
+    assert data["stats"]["expense"] == 800.0
+    assert data["top_expenses"] == [{"label": "Rent", "amount": 800.0, "date": "2024-02-29"}]
+
+    assert client.get("/api/analytics/monthly?year=2024&month=13").status_code == 400
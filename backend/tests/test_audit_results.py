@@ -0,0 +1,55 @@
+from fastapi.testclient import TestClient
+from app.routes import analytics
+from app.models.domain import User
+from app.repositories import AuditRepository
+
+def test_audits_are_reused_until_the_month_changes(client: TestClient, monkeypatch):
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    calls = []
+
+    async def fake_run(self, call, parse):
+        calls.append(1)
+        return {"score": len(calls)}
+
+    monkeypatch.setattr(analytics.HedgedModelCaller, "run", fake_run)
+
+    client.post(
+        "/api/auth/register",
+        json={"username": "auditor", "password": "password123", "email": "auditor@example.com"},
+    )
+
+    def add(day: str):
+        client.post(
+            "/api/transactions",
+            json={"label": "Courses", "amount": 40, "type": "depense", "category": "Alimentation", "date": day},
+        )
+
+    def audit(language: str = "fr"):
+        return client.post("/api/analytics/audit", json={"year": "2024", "month": "3", "language": language}).json()
+
+    add("2024-03-04")
+    assert audit() == {"analysis": {"score": 1}}
+    assert audit() == {"analysis": {"score": 1}}
+    assert len(calls) == 1
+
+    add("2024-04-02")
+    assert audit() == {"analysis": {"score": 1}}
+    assert audit("en") == {"analysis": {"score": 2}}
+
+    add("2024-03-20")
+    assert audit() == {"analysis": {"score": 3}}
+    assert audit() == {"analysis": {"score": 3}}
+    assert len(calls) == 3
+
+def test_saving_an_audit_twice_updates_the_same_row(session):
+    user = User(username="auditor", email="auditor@example.com", hashed_password="x")
+    session.add(user)
+    session.commit()
+    repo = AuditRepository(session)
+
+    first = repo.save(2024, 3, "fr", "old", {"score": 1}, user.id)
+    second = repo.save(2024, 3, "fr", "new", {"score": 2}, user.id)
+    assert first == second
+    assert repo.get_analysis(2024, 3, "fr", "old", user.id) is None
+    assert repo.get_analysis(2024, 3, "fr", "new", user.id) == {"score": 2}
+    assert len(repo.get_all(user.id)) == 1
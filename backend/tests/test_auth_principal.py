@@ -0,0 +1,43 @@
+from sqlalchemy import event
+from fastapi.testclient import TestClient
+
+def register(client: TestClient, username: str):
+    return client.post(
+        "/api/auth/register",
+        json={"username": username, "password": "password123", "email": f"{username}@example.com"},
+    )
+
+def test_authenticated_requests_skip_user_lookup(client: TestClient, engine, async_engine):
+    register(client, "principal")
+    assert client.get("/api/dashboard/years").status_code == 200
+
+    user_queries = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if "FROM users" in statement:
+            user_queries.append(statement)
+
+    for target in (engine, async_engine.sync_engine):
+        event.listen(target, "before_cursor_execute", capture)
+    for _ in range(3):
+        assert client.get("/api/dashboard/years").status_code == 200
+    for target in (engine, async_engine.sync_engine):
+        event.remove(target, "before_cursor_execute", capture)
+
+    assert user_queries == []
+
+def test_password_change_and_deletion_invalidate_principal(client: TestClient):
+    register(client, "rotating")
+    assert client.put("/api/account/password", json={"old_password": "wrong", "new_password": "x" * 8}).status_code == 400
+    assert client.put("/api/account/password", json={"old_password": "password123", "new_password": "newpassword"}).status_code == 200
+
+    login = client.post("/api/auth/login", data={"username": "rotating", "password": "newpassword"})
+    assert login.status_code == 200
+
+    client.post("/api/transactions", json={"label": "Rent", "amount": 500.0, "type": "depense", "category": "Logement", "date": "2024-03-01"})
+    export = client.get("/api/account/export").json()
+    assert export["user"]["username"] == "rotating"
+    assert [tx["label"] for tx in export["transactions"]] == ["Rent"]
+
+    assert client.delete("/api/account/me").status_code == 200
+    assert client.get("/api/dashboard/years").status_code == 401
@@ -0,0 +1,198 @@
+import socketserver
+import threading
+import time
+import pytest
+from app.core.cache import MemoryBackend, SQLiteBackend, RedisBackend, UserScopedCache, create_user_cache
+from app.core import decorators
+
+class FakeRedisHandler(socketserver.StreamRequestHandler):
+    """Tiny in-memory server speaking the subset of RESP the backend uses."""
+
+    def read_command(self):
+        header = self.rfile.readline()
+        if not header:
+            return None
+        args = []
+        for _ in range(int(header[1:])):
+            length = int(self.rfile.readline()[1:])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+    def reply(self, value):
+        if value is None:
+            self.wfile.write(b"$-1\r\n")
+        elif isinstance(value, int):
+            self.wfile.write(b":%d\r\n" % value)
+        elif isinstance(value, bytes):
+            self.wfile.write(b"$%d\r\n%s\r\n" % (len(value), value))
+        elif isinstance(value, list):
+            self.wfile.write(b"*%d\r\n" % len(value))
+            for item in value:
+                self.reply(item)
+        else:
+            self.wfile.write(b"+%s\r\n" % value.encode())
+
+    def handle(self):
+        store = self.server.store
+        while True:
+            args = self.read_command()
+            if args is None:
+                return
+            command = args[0].upper()
+            now = time.monotonic()
+            for key in [k for k, (_, exp) in store.items() if exp and exp < now]:
+                del store[key]
+            if command == b"GET":
+                self.reply(store.get(args[1], (None, None))[0])
+            elif command == b"SET":
+                expires = now + int(args[4]) / 1000 if len(args) > 3 else None
+                store[args[1]] = (args[2], expires)
+                self.reply("OK")
+            elif command == b"INCR":
+                value = int(store.get(args[1], (b"0", None))[0]) + 1
+                store[args[1]] = (str(value).encode(), None)
+                self.reply(value)
+            elif command == b"DEL":
+                self.reply(sum(store.pop(k, None) is not None for k in args[1:]))
+            elif command == b"SCAN":
+                prefix = args[3].rstrip(b"*")
+                self.reply([b"0", [k for k in store if k.startswith(prefix)]])
+            else:
+                self.wfile.write(b"-ERR unknown command\r\n")
+
+@pytest.fixture
+def fake_redis():
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), FakeRedisHandler)
+    server.daemon_threads = True
+    server.store = {}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"redis://127.0.0.1:{server.server_address[1]}/0"
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+def backend(request, tmp_path, fake_redis):
+    if request.param == "memory":
+        backend = MemoryBackend(maxsize=2)
+    elif request.param == "sqlite":
+        backend = SQLiteBackend(str(tmp_path / "cache.db"), maxsize=2)
+    else:
+        backend = RedisBackend(fake_redis)
+    yield backend
+    backend.close()
+
+def test_backend_roundtrip_and_ttl(backend):
+    backend.set("a", {"balance": 12.5, "items": [1, 2]}, ttl_seconds=60)
+    backend.set("short", "soon gone", ttl_seconds=0.01)
+    assert backend.get("a") == {"balance": 12.5, "items": [1, 2]}
+    assert backend.get("missing") is None
+    time.sleep(0.05)
+    assert backend.get("short") is None
+
+    assert backend.get_counter("gen:1") == 0
+    backend.incr("gen:1")
+    backend.incr("gen:1")
+    assert backend.get_counter("gen:1") == 2
+
+    stats = backend.stats.snapshot()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+
+    backend.clear()
+    assert backend.get("a") is None
+    assert backend.get_counter("gen:1") == 0
+
+@pytest.mark.parametrize("kind", ["memory", "sqlite"])
+def test_lru_eviction_counts(kind, tmp_path):
+    if kind == "memory":
+        backend = MemoryBackend(maxsize=2)
+    else:
+        backend = SQLiteBackend(str(tmp_path / "c.db"), maxsize=2, touch_interval=0)
+    backend.set("a", 1, 60)
+    time.sleep(0.01)
+    backend.set("b", 2, 60)
+    time.sleep(0.01)
+    assert backend.get("a") == 1
+    time.sleep(0.01)
+    backend.set("c", 3, 60)
+
+    assert backend.get("b") is None
+    assert backend.get("a") == 1 and backend.get("c") == 3
+    assert backend.stats.snapshot()["evictions"] == 1
+
+def test_sqlite_backend_is_shared_between_workers(tmp_path):
+    path = str(tmp_path / "shared.db")
+    worker_a = UserScopedCache(SQLiteBackend(path))
+    worker_b = UserScopedCache(SQLiteBackend(path))
+
+    key = worker_a.key("dashboard", 7, "()")
+    worker_a.set(key, {"balance": 1.0}, 60)
+    assert worker_b.get(worker_b.key("dashboard", 7, "()")) == {"balance": 1.0}
+
+    worker_b.invalidate_user(7)
+    assert worker_a.get(worker_a.key("dashboard", 7, "()")) is None
+
+def test_redis_backend_fails_open():
+    backend = RedisBackend("redis://127.0.0.1:1/0")
+    backend.set("a", 1, 60)
+    assert backend.get("a") is None
+    assert backend.stats.snapshot()["errors"] == 2
+
+def test_unreadable_generation_bypasses_the_cache():
+    cache = UserScopedCache(RedisBackend("redis://127.0.0.1:1/0"))
+    key = cache.key("dashboard", 7, "()")
+    assert key is None
+    cache.set(key, {"balance": 1.0}, 60)
+    assert cache.get(key) is None
+
+    cache.invalidate_user(7)
+    stats = cache.backend.stats.snapshot()
+    assert stats["lost_invalidations"] == 1
+    assert stats["sets"] == 0
+
+def test_sqlite_hits_refresh_access_time_sparingly(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / "c.db"), touch_interval=60)
+    backend.set("a", 1, 60)
+    conn = backend._conn()
+    before = conn.execute("SELECT accessed_at FROM cache_entries").fetchone()[0]
+    time.sleep(0.01)
+    assert backend.get("a") == 1
+    assert conn.execute("SELECT accessed_at FROM cache_entries").fetchone()[0] == before
+
+def test_cached_decorator_counts_hits(monkeypatch):
+    cache = UserScopedCache(MemoryBackend())
+    monkeypatch.setattr(decorators, "user_cache", cache)
+    calls = []
+
+    @decorators.cached(ttl_seconds=60)
+    def load(user_id: int, year: str = "2024"):
+        calls.append((user_id, year))
+        return {"user": user_id, "year": year}
+
+    assert load(1) == load(user_id=1, year="2024")
+    load(2)
+    cache.invalidate_user(1)
+    load(1)
+
+    assert calls == [(1, "2024"), (2, "2024"), (1, "2024")]
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 3
+
+def test_per_process_cache_is_off_with_several_workers(monkeypatch, tmp_path):
+    monkeypatch.delenv("CACHE_BACKEND", raising=False)
+    assert create_user_cache().enabled
+
+    monkeypatch.setenv("WEB_CONCURRENCY", "4")
+    cache = create_user_cache()
+    assert not cache.enabled
+    cache.set(cache.key("dashboard", 1, "()"), {"stale": True}, 60)
+    assert cache.get(cache.key("dashboard", 1, "()")) is None
+
+    monkeypatch.setenv("CACHE_BACKEND", "memory")
+    with pytest.raises(ValueError):
+        create_user_cache()
+
+    monkeypatch.setenv("CACHE_BACKEND", "sqlite")
+    monkeypatch.setenv("CACHE_URL", str(tmp_path / "cache.db"))
+    assert create_user_cache().enabled
@@ -0,0 +1,134 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from app.core.singleton import Singleton
+from app.models import PromptRequest
+from app.services import genai_client
+from app.services.coach_service import CoachService
+from app.services.genai_client import GenAIClientManager
+
+class StubGemini(BaseHTTPRequestHandler):
+    """Answers generateContent like the Gemini API, after `delay` seconds."""
+
+    delay = 0.0
+    calls = 0
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        self.reply({"name": "models/gemini-2.5-flash"})
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        cls = type(self)
+        with cls.lock:
+            cls.calls += 1
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        time.sleep(cls.delay)
+        with cls.lock:
+            cls.in_flight -= 1
+
+        text = json.dumps({"title": "Plan", "meals": []})
+        self.reply({"candidates": [{"content": {"role": "model", "parts": [{"text": text}]}}]})
+
+    def reply(self, payload):
+        body = json.dumps(payload).encode()
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def service(monkeypatch, tmp_path):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubGemini)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    StubGemini.delay, StubGemini.calls, StubGemini.in_flight, StubGemini.max_in_flight = 0.0, 0, 0, 0
+
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    monkeypatch.setenv("COACH_CACHE_URL", str(tmp_path / "coach_cache.db"))
+    monkeypatch.setattr(genai_client, "GEMINI_BASE_URL", f"http://127.0.0.1:{server.server_port}")
+    for cls in (CoachService, GenAIClientManager):
+        Singleton._instances.pop(cls, None)
+    yield CoachService()
+    for cls in (CoachService, GenAIClientManager):
+        Singleton._instances.pop(cls, None)
+    server.shutdown()
+    server.server_close()
+
+def test_generate_prompt_calls_the_model_asynchronously(service):
+    request = PromptRequest(type="recipe", current_plan=json.dumps({"meals": ["kept"]}))
+    result = asyncio.run(service.generate_prompt(request, {"pantry": []}))
+    assert result == {"prompt": {"title": "Plan", "meals": ["kept"]}}
+
+def test_concurrent_calls_are_bounded_by_the_semaphore(service):
+    StubGemini.delay = 0.1
+    service.max_concurrency = 2
+
+    async def burst():
+        requests = [PromptRequest(type="meal_plan", days=days) for days in range(1, 7)]
+        return await asyncio.gather(*(service.generate_prompt(request, {}) for request in requests))
+
+    results = asyncio.run(burst())
+    assert all("prompt" in r for r in results)
+    assert StubGemini.max_in_flight == 2
+
+def test_slow_model_hits_the_deadline(service):
+    StubGemini.delay = 3.0
+    service.timeout = 0.2
+
+    started = time.perf_counter()
+    result = asyncio.run(service.generate_prompt(PromptRequest(type="recipe"), {}))
+    assert result == {"error": "AI model timed out after 0.2s"}
+    # two attempts of 0.2s with a 1s backoff in between, not the stub's 3s
+    assert time.perf_counter() - started < 2.5
+
+def test_identical_requests_are_answered_from_the_persistent_cache(service):
+    request = PromptRequest(type="recipe")
+    first = asyncio.run(service.generate_prompt(request, {"pantry": [{"item": "riz", "qty": "1kg"}]}))
+    assert StubGemini.calls == 1
+
+    Singleton._instances.pop(CoachService, None)
+    restarted = CoachService()
+    assert restarted is not service
+    again = asyncio.run(restarted.generate_prompt(request, {"pantry": [{"item": "riz", "qty": "1kg"}]}))
+    assert again == first
+    assert StubGemini.calls == 1
+
+    asyncio.run(restarted.generate_prompt(request, {"pantry": [{"item": "pâtes", "qty": "500g"}]}))
+    assert StubGemini.calls == 2
+    assert restarted.cache_key("recipe", "a  b\n c") == restarted.cache_key("recipe", "a b c")
+    assert restarted.cache_key("recipe", "a b c") != restarted.cache_key("emergency", "a b c")
+
+def test_calls_share_one_client_manager(service):
+    async def two_calls():
+        for days in (1, 2):
+            await service.generate_prompt(PromptRequest(type="meal_plan", days=days), {})
+        return await GenAIClientManager().health()
+
+    assert asyncio.run(two_calls())["ok"] is True
+    metrics = GenAIClientManager().metrics()
+    assert metrics["clients"] == 1
+    assert metrics["requests"] == metrics["responses"] == 3
+    assert metrics["errors"] == 0
+
+def test_manager_builds_clients_once(service):
+    manager = GenAIClientManager()
+    assert manager.client is manager.client
+
+    async def aio_twice():
+        return manager.aio is manager.aio
+
+    assert asyncio.run(aio_twice())
+    assert manager.metrics()["clients"] == 2
@@ -0,0 +1,40 @@
+from datetime import date
+from fastapi.testclient import TestClient
+from app.core.compression import accepted_encodings
+from app.core.responses import ORJSONResponse
+
+def register(client: TestClient):
+    client.post(
+        "/api/auth/register",
+        json={"username": "squeeze", "password": "password123", "email": "squeeze@example.com"},
+    )
+    for day in range(1, 29):
+        client.post(
+            "/api/transactions",
+            json={"label": f"Courses {day}", "amount": 12.5, "type": "depense", "category": "Alimentation", "date": f"2024-02-{day:02d}"},
+        )
+
+def test_large_responses_are_compressed(client: TestClient):
+    register(client)
+
+    br = client.get("/api/dashboard", headers={"Accept-Encoding": "br, gzip"})
+    assert br.headers["content-encoding"] == "br"
+    assert "Accept-Encoding" in br.headers["vary"]
+    assert len(br.json()["transactions"]) == 28
+
+    gz = client.get("/api/dashboard", headers={"Accept-Encoding": "gzip, br;q=0"})
+    assert gz.headers["content-encoding"] == "gzip"
+    assert gz.json() == br.json()
+
+    plain = client.get("/api/dashboard", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+
+    small = client.get("/api/dashboard/years", headers={"Accept-Encoding": "br, gzip"})
+    assert "content-encoding" not in small.headers
+
+    export = client.get("/api/account/export?gzip=true", headers={"Accept-Encoding": "br, gzip"})
+    assert "content-encoding" not in export.headers
+
+def test_accepted_encodings_and_orjson_rendering():
+    assert accepted_encodings("gzip;q=1.0, br;q=0, *;q=0.1") == {"gzip", "*"}
+    assert ORJSONResponse({1: {"a"}, "d": date(2024, 1, 2)}).body == b'{"1":["a"],"d":"2024-01-02"}'
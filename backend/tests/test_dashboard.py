@@ -0,0 +1,85 @@
+from datetime import date
+from fastapi.testclient import TestClient
+
+def register(client: TestClient, username: str = "dashboard"):
+    client.post(
+        "/api/auth/register",
+        json={"username": username, "password": "password123", "email": f"{username}@example.com"},
+    )
+
+def add_tx(client: TestClient, label, amount, tx_type, day, category="Misc"):
+    client.post(
+        "/api/transactions",
+        json={"label": label, "amount": amount, "type": tx_type, "category": category, "date": day},
+    )
+
+def test_stats_by_year_groups_months_in_sql(client: TestClient):
+    register(client)
+    add_tx(client, "Salary", 2000.0, "revenu", "2024-01-15")
+    add_tx(client, "Rent", 700.0, "depense", "2024-01-20")
+    add_tx(client, "Gift", 100.0, "revenu", "2024-12-31")
+    add_tx(client, "Other year", 999.0, "depense", "2023-12-31")
+
+    data = client.get("/api/dashboard/stats?year=2024").json()
+    assert data["total_income"] == 2100.0
+    assert data["total_expense"] == 700.0
+    assert data["net_result"] == 1400.0
+    assert len(data["monthly_data"]) == 12
+    assert data["monthly_data"][0] == {"month": "01", "income": 2000.0, "expense": 700.0, "net": 1300.0}
+    assert data["monthly_data"][11] == {"month": "12", "income": 100.0, "expense": 0.0, "net": 100.0}
+
+    assert client.get("/api/dashboard/stats?year=abc").status_code == 400
+
+def test_summary_view_omits_collections(client: TestClient):
+    register(client, "slim")
+    add_tx(client, "Salary", 1000.0, "revenu", "2024-01-15")
+    for i in range(5):
+        client.post("/api/pantry", json={"item": f"Item {i}", "qty": "1", "category": "Epicerie", "expiry": "", "added_date": "2024-01-01"})
+
+    full = client.get("/api/dashboard").json()
+    summary = client.get("/api/dashboard?view=summary").json()
+
+    for key in ("transactions", "pantry", "recurring", "goals", "profile"):
+        assert key in full
+        assert key not in summary
+    for key in ("balance", "safe_balance", "prediction", "xp", "rank", "categories", "achievements", "is_setup"):
+        assert summary[key] == full[key]
+    assert any(a["id"] == "chef" for a in summary["achievements"])
+
+    partial = client.get("/api/dashboard?fields=goals,recurring").json()
+    assert "goals" in partial and "recurring" in partial
+    assert "transactions" not in partial and "pantry" not in partial
+
+    assert client.get("/api/dashboard?fields=secrets").status_code == 400
+
+def test_years_and_ai_export(client: TestClient):
+    register(client, "years")
+    assert client.get("/api/dashboard/years").json() == [str(date.today().year)]
+
+    add_tx(client, "Salary", 1000.0, "revenu", "2022-06-01")
+    add_tx(client, "Rent", 400.0, "depense", "2024-02-01")
+    add_tx(client, "Food", 20.0, "depense", "2024-03-01")
+    assert client.get("/api/dashboard/years").json() == ["2024", "2022"]
+
+    client.post("/api/pantry", json={"item": "Rice", "qty": "1kg", "category": "Epicerie"})
+    export = client.get("/api/ai-export").json()
+    assert export["role"] == "Coach"
+    assert export["balance"] == 580.0
+    assert [p["item"] for p in export["pantry"]] == ["Rice"]
+    assert export["profile"] is None
+
+def test_dashboard_cache_invalidated_by_writes(client: TestClient):
+    register(client, "cached")
+    add_tx(client, "Salary", 1000.0, "revenu", "2024-01-15")
+
+    first = client.get("/api/dashboard").json()
+    assert client.get("/api/dashboard").json() == first
+    assert client.get("/api/dashboard/stats?year=2024").json()["total_income"] == 1000.0
+
+    add_tx(client, "Bonus", 500.0, "revenu", "2024-01-20")
+    assert client.get("/api/dashboard").json()["balance"] == first["balance"] + 500.0
+    assert client.get("/api/dashboard/stats?year=2024").json()["total_income"] == 1500.0
+
+    tx_id = client.get("/api/transactions").json()["items"][0]["id"]
+    client.delete(f"/api/transactions/{tx_id}")
+    assert client.get("/api/dashboard").json()["balance"] == first["balance"]
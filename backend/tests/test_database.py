@@ -0,0 +1,28 @@
+import pytest
+from sqlalchemy import text
+from sqlmodel import create_engine
+from app.database import apply_sqlite_tuning, _async_url
+
+def test_sqlite_tuning_applies_pragmas_on_connect(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'tuned.db'}")
+    apply_sqlite_tuning(engine)
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+        assert conn.execute(text("PRAGMA temp_store")).scalar() == 2
+    engine.dispose()
+
+def test_async_url_maps_drivers():
+    assert str(_async_url("sqlite:///hess.db")) == "sqlite+aiosqlite:///hess.db"
+    assert (
+        _async_url("postgresql://u:p@db.example.com/hess?sslmode=require").render_as_string(hide_password=False)
+        == "postgresql+asyncpg://u:p@db.example.com/hess?ssl=require"
+    )
+
+def test_async_engine_is_created_on_first_use(monkeypatch):
+    from app import database
+    monkeypatch.setattr(database, "_sync_url", database.make_url("mysql://u:p@db.example.com/hess"))
+    monkeypatch.setattr(database, "_async_engine", None)
+    with pytest.raises(RuntimeError, match="mysql"):
+        database.get_async_engine()
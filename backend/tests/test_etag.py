@@ -0,0 +1,54 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+def register(client: TestClient):
+    client.post(
+        "/api/auth/register",
+        json={"username": "tagged", "password": "password123", "email": "tagged@example.com"},
+    )
+
+def test_unchanged_data_revalidates_without_queries(client: TestClient, engine):
+    register(client)
+
+    first = client.get("/api/dashboard")
+    etag = first.headers["etag"]
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == "private, no-cache"
+
+    statements = []
+
+    def listener(*args):
+        statements.append(args[2])
+
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        again = client.get("/api/dashboard", headers={"If-None-Match": etag})
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    assert again.status_code == 304
+    assert again.headers["etag"] == etag
+    assert again.content == b""
+    assert statements == []
+
+    assert client.get("/api/dashboard?view=summary", headers={"If-None-Match": etag}).status_code == 200
+
+def test_writes_change_the_etag(client: TestClient):
+    register(client)
+    etag = client.get("/api/fuel").headers["etag"]
+
+    client.post(
+        "/api/transactions",
+        json={"label": "Loyer", "amount": 700, "type": "depense", "category": "Logement", "date": "2024-03-01"},
+    )
+
+    fresh = client.get("/api/fuel", headers={"If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert fresh.headers["etag"] != etag
+    assert client.get("/api/fuel", headers={"If-None-Match": fresh.headers["etag"]}).status_code == 304
+
+def test_no_etags_with_per_process_versions(client: TestClient, monkeypatch):
+    register(client)
+    monkeypatch.setenv("WEB_CONCURRENCY", "4")
+    response = client.get("/api/fuel")
+    assert response.status_code == 200
+    assert "etag" not in response.headers
@@ -0,0 +1,71 @@
+from fastapi.testclient import TestClient
+
+def register(client: TestClient, username: str = "importer"):
+    client.post(
+        "/api/auth/register",
+        json={"username": username, "password": "password123", "email": f"{username}@example.com"},
+    )
+
+CSV = """Date;Libellé;Montant;Catégorie
+15/01/2024;Salaire;2 000,00;Salaire
+16/01/2024;Loyer;-700,00;Logement
+17/01/2024;;-5,00;
+32/01/2024;Bad date;-5,00;
+18/01/2024;Huge;-2 000 000,00;
+"""
+
+OFX = """OFXHEADER:100
+<OFX><BANKMSGSRSV1><STMTTRNRS><STMTRS><BANKTRANLIST>
+<STMTTRN>
+<TRNTYPE>DEBIT
+<DTPOSTED>20240203120000[-5:EST]
+<TRNAMT>-42.10
+<NAME>SUPERMARCHE
+</STMTTRN>
+<STMTTRN><TRNTYPE>CREDIT</TRNTYPE><DTPOSTED>20240205</DTPOSTED><TRNAMT>100.00</TRNAMT><NAME>REMBOURSEMENT</NAME><MEMO>Ami</MEMO></STMTTRN>
+</BANKTRANLIST></STMTRS></STMTTRNRS></BANKMSGSRSV1></OFX>
+"""
+
+def test_csv_import_batches_rows_and_reports_errors(client: TestClient):
+    register(client)
+    response = client.post(
+        "/api/transactions/import?batch_size=1",
+        files={"file": ("releve.csv", CSV.encode("utf-8"), "text/csv")},
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["imported"] == 2
+    assert body["rejected"] == 3
+    assert [e["line"] for e in body["errors"]] == [4, 5, 6]
+
+    items = client.get("/api/transactions").json()["items"]
+    assert {(tx["label"], tx["amount"], tx["type"], tx["category"]) for tx in items} == {
+        ("Salaire", 2000.0, "revenu", "Salaire"),
+        ("Loyer", 700.0, "depense", "Logement"),
+    }
+    assert client.get("/api/dashboard?view=summary").json()["balance"] == 1300.0
+
+def test_ofx_import_and_bad_uploads(client: TestClient):
+    register(client, "ofx")
+    body = client.post(
+        "/api/transactions/import", files={"file": ("statement.ofx", OFX.encode(), "application/x-ofx")}
+    ).json()
+    assert body == {"imported": 2, "rejected": 0, "errors": []}
+    labels = {tx["label"]: tx for tx in client.get("/api/transactions").json()["items"]}
+    assert labels["SUPERMARCHE"]["date"] == "2024-02-03"
+    assert labels["REMBOURSEMENT Ami"]["type"] == "revenu"
+
+    assert client.post("/api/transactions/import", files={"file": ("x.pdf", b"%PDF", "application/pdf")}).status_code == 400
+    bad_header = client.post("/api/transactions/import", files={"file": ("x.csv", b"foo;bar\n1;2\n", "text/csv")})
+    assert bad_header.status_code == 400
+
+def test_failed_import_keeps_nothing(client: TestClient):
+    register(client, "broken")
+    broken = CSV.splitlines()[:3] + ['19/01/2024;"' + "x" * 200_000 + '";-1,00;']
+    response = client.post(
+        "/api/transactions/import?batch_size=1",
+        files={"file": ("releve.csv", "\n".join(broken).encode("utf-8"), "text/csv")},
+    )
+    assert response.status_code == 400
+    assert client.get("/api/transactions").json()["items"] == []
+    assert client.get("/api/dashboard?view=summary").json()["balance"] == 0
@@ -0,0 +1,100 @@
+from datetime import date
+from fastapi.testclient import TestClient
+from app.models import Transaction
+from app.models.domain import User, Transaction as DBTransaction
+from app.repositories import TransactionRepository, LedgerRepository, LedgerDelta
+from app.services.builders import DashboardTotals
+
+def make_user(session, username="ledger"):
+    user = User(username=username, email=f"{username}@example.com", hashed_password="x")
+    session.add(user)
+    session.commit()
+    session.refresh(user)
+    return user.id
+
+def test_ledger_tracks_create_update_delete(session):
+    user_id = make_user(session)
+    repo = TransactionRepository(session)
+    ledger = LedgerRepository(session)
+
+    salary = repo.create(Transaction(label="Salary", amount=2000.0, type="revenu", category="Job", date="2024-05-01"), user_id)
+    rent = repo.create(Transaction(label="Rent", amount=700.0, type="depense", category="Housing", date="2024-05-03"), user_id)
+    repo.create(Transaction(label="Food", amount=50.0, type="depense", category="Food", date="2024-06-02"), user_id)
+
+    summary = ledger.get_summary(user_id, "2024-05")
+    assert summary["balance"] == 1250.0
+    assert summary["income"] == 2000.0
+    assert summary["expense"] == 700.0
+    assert summary["categories"] == {"Housing": 700.0, "Food": 50.0}
+
+    repo.update(rent, Transaction(label="Rent", amount=800.0, type="depense", category="Rent", date="2024-06-03"), user_id)
+    summary = ledger.get_summary(user_id, "2024-06")
+    assert summary["balance"] == 1150.0
+    assert summary["expense"] == 850.0
+    assert summary["categories"] == {"Rent": 800.0, "Food": 50.0}
+    assert ledger.get_summary(user_id, "2024-05")["expense"] == 0.0
+
+    repo.delete(salary, user_id)
+    assert ledger.get_balance(user_id) == -850.0
+
+def test_first_writes_for_a_month_upsert(session):
+    user_id = make_user(session)
+    ledger = LedgerRepository(session)
+    tx = DBTransaction(label="Food", amount=10.0, type="depense", category="Food", date=date(2024, 7, 1))
+    for _ in range(2):
+        # creates the month/category rows, then adds to them in place
+        delta = LedgerDelta()
+        delta.add(tx)
+        ledger.apply_delta(delta, user_id)
+    session.commit()
+
+    assert ledger.get_summary(user_id, "2024-07") == {"balance": -20.0, "income": 0.0, "expense": 20.0, "categories": {"Food": 20.0}}
+
+def test_ledger_backfills_existing_transactions(session):
+    user_id = make_user(session)
+    session.add(DBTransaction(label="Old", amount=100.0, type="revenu", category="Job", date=date(2023, 1, 1), user_id=user_id))
+    session.add(DBTransaction(label="Older", amount=30.0, type="depense", category="Food", date=date(2023, 1, 2), user_id=user_id))
+    session.commit()
+
+    ledger = LedgerRepository(session)
+    assert ledger.get_balance(user_id) == 0.0
+    assert ledger.backfill() == 1
+    assert ledger.backfill() == 0
+
+    summary = ledger.get_summary(user_id, "2023-01")
+    assert summary == {"balance": 70.0, "income": 100.0, "expense": 30.0, "categories": {"Food": 30.0}}
+
+def test_dashboard_reads_ledger_balance(client: TestClient):
+    client.post("/api/auth/register", json={"username": "dash", "password": "password123", "email": "dash@example.com"})
+    today = str(date.today())
+    client.post("/api/transactions", json={"label": "Salary", "amount": 1500.0, "type": "revenu", "category": "Job", "date": today})
+    client.post("/api/transactions", json={"label": "Groceries", "amount": 40.0, "type": "depense", "category": "Food", "date": today})
+
+    data = client.get("/api/dashboard").json()
+    assert data["balance"] == 1460.0
+    assert data["income"] == 1500.0
+    assert data["expense"] == 40.0
+    assert data["categories"] == {"Food": 40.0}
+
+def test_ledger_summary_feeds_dashboard_totals(session):
+    user_id = make_user(session)
+    repo = TransactionRepository(session)
+    today = date.today()
+    for label, amount, tx_type, category in [
+        ("Salary", 1800.0, "revenu", "Job"),
+        ("Rent", 650.0, "depense", "Housing"),
+        ("Cinema", 12.5, "depense", "Leisure"),
+    ]:
+        repo.create(Transaction(label=label, amount=amount, type=tx_type, category=category, date=today), user_id)
+    repo.create(Transaction(label="Old", amount=20.0, type="depense", category="Leisure", date="2020-01-01"), user_id)
+
+    recurring = [{"amount": 30.0, "day": 31}, {"amount": 10.0, "day": 0}]
+    summary = LedgerRepository(session).get_summary(user_id, str(today)[:7])
+    totals = DashboardTotals.from_ledger(summary, recurring, today)
+
+    assert totals.balance == 1117.5
+    assert totals.income == 1800.0
+    assert totals.expense == 662.5
+    assert totals.categories == {"Housing": 650.0, "Leisure": 32.5}
+    assert totals.monthly_burn == 40.0
+    assert totals.upcoming_bills == (30.0 if today.day < 31 else 0.0)
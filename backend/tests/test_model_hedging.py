@@ -0,0 +1,80 @@
+import asyncio
+import time
+import pytest
+from app.services import HedgedModelCaller, ModelStats
+from app.routes.analytics import parse_audit
+
+def fake_models(behaviour):
+    """behaviour: model -> (delay, text or exception)."""
+    started, cancelled = [], []
+
+    async def call(model):
+        started.append(model)
+        delay, outcome = behaviour[model]
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(model)
+            raise
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return call, started, cancelled
+
+def test_slow_primary_is_hedged_and_cancelled():
+    call, started, cancelled = fake_models({
+        "primary": (5.0, '{"score": 1}'),
+        "backup": (0.05, '```json\n{"score": 7}\n```'),
+    })
+    stats = ModelStats()
+    caller = HedgedModelCaller(["primary", "backup"], stats, hedge_delay=0.1)
+
+    t0 = time.perf_counter()
+    assert asyncio.run(caller.run(call, parse_audit)) == {"score": 7}
+    assert time.perf_counter() - t0 < 1
+    assert started == ["primary", "backup"]
+    assert cancelled == ["primary"]
+    assert stats.snapshot()["primary"]["cancelled"] == 1
+    assert stats.order(["primary", "backup"]) == ["backup", "primary"]
+
+def test_failures_and_invalid_json_move_on_immediately():
+    call, started, _ = fake_models({
+        "down": (0.0, RuntimeError("503")),
+        "garbage": (0.0, "not json"),
+        "ok": (0.0, '{"score": 5}'),
+    })
+    stats = ModelStats()
+    caller = HedgedModelCaller(["down", "garbage", "ok"], stats, hedge_delay=10)
+
+    assert asyncio.run(caller.run(call, parse_audit)) == {"score": 5}
+    assert started == ["down", "garbage", "ok"]
+    assert stats.snapshot()["down"]["errors"] == 1
+    assert stats.order(["down", "garbage", "ok"])[0] == "ok"
+
+def test_sequential_mode_and_total_failure():
+    call, started, _ = fake_models({"a": (0.05, ValueError("a broke")), "b": (0.05, ValueError("b broke"))})
+    caller = HedgedModelCaller(["a", "b"], ModelStats(), hedge_delay=None)
+
+    with pytest.raises(ValueError, match="b broke"):
+        asyncio.run(caller.run(call, parse_audit))
+    assert started == ["a", "b"]
+
+def test_auto_delay_follows_observed_latency():
+    stats = ModelStats()
+    stats.record_success("primary", 0.05)
+    stats.record_success("backup", 1.0)
+    caller = HedgedModelCaller(["primary", "backup"], stats, hedge_delay="auto", min_delay=0.01)
+    assert caller.delay("primary") == pytest.approx(0.075)
+    assert caller.delay("unseen") == 10.0
+    assert HedgedModelCaller(["a"], stats, hedge_delay="auto", min_delay=2.0).delay("primary") == 2.0
+
+    call, started, cancelled = fake_models({
+        "primary": (5.0, '{"score": 1}'),
+        "backup": (0.05, '{"score": 7}'),
+    })
+    t0 = time.perf_counter()
+    assert asyncio.run(caller.run(call, parse_audit)) == {"score": 7}
+    assert time.perf_counter() - t0 < 1
+    assert started == ["primary", "backup"]
+    assert cancelled == ["primary"]
@@ -0,0 +1,18 @@
+import asyncio
+from fastapi.testclient import TestClient
+from app import auth_utils
+
+def test_hash_uses_configured_cost_and_runs_on_pool():
+    hashed = asyncio.run(auth_utils.get_password_hash_async("password123"))
+    assert hashed.startswith(f"$2b${auth_utils.BCRYPT_ROUNDS:02d}$")
+    assert asyncio.run(auth_utils.verify_password_async("password123", hashed))
+    assert not asyncio.run(auth_utils.verify_password_async("wrong", hashed))
+
+def test_hashing_sheds_load_when_queue_is_full(client: TestClient, monkeypatch):
+    monkeypatch.setattr(auth_utils, "PASSWORD_HASH_MAX_PENDING", 0)
+    response = client.post(
+        "/api/auth/register",
+        json={"username": "storm", "password": "password123", "email": "storm@example.com"},
+    )
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
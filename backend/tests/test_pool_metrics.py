@@ -0,0 +1,44 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, exc
+from sqlalchemy.pool import QueuePool
+from app.pool_metrics import instrumented, track_usage
+
+def test_instrumented_pool_reports_waits_and_usage(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=instrumented(QueuePool, "test-pool"),
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    track_usage(engine.pool)
+    metrics = type(engine.pool).metrics
+
+    first = engine.connect()
+    assert metrics.snapshot()["in_use"] == 1
+    with pytest.raises(exc.TimeoutError):
+        engine.connect()
+    first.close()
+
+    with engine.connect():
+        pass
+    snapshot = metrics.snapshot()
+    assert snapshot["checkouts"] == 2
+    assert snapshot["timeouts"] == 1
+    assert snapshot["in_use"] == 0
+    assert snapshot["max_in_use"] == 1
+    assert snapshot["wait_ms_max"] >= 50
+    engine.dispose()
+
+def test_metrics_endpoint_requires_token(client: TestClient, monkeypatch):
+    assert client.get("/api/internal/metrics").status_code == 404
+
+    monkeypatch.setenv("METRICS_TOKEN", "s3cret")
+    assert client.get("/api/internal/metrics").status_code == 403
+    assert client.get("/api/internal/metrics", headers={"X-Metrics-Token": "nope"}).status_code == 403
+
+    data = client.get("/api/internal/metrics", headers={"X-Metrics-Token": "s3cret"}).json()
+    assert {"sync", "async"} <= set(data["pools"])
+    assert "in_use" in data["pools"]["sync"]
+    assert data["cache"]["backend"] == "memory"
@@ -73,3 +73,31 @@ def test_delete_transaction(client: TestClient):
     response = client.delete("/api/transactions/1", headers=headers)
     assert response.status_code == 200
     assert response.json()["status"] == "deleted"
+
+def test_list_transactions_keyset_pages(client: TestClient):
+    client.post("/api/auth/register", json={"username": "pager", "password": "password123", "email": "pager@example.com"})
+    for i in range(5):
+        client.post("/api/transactions", json={"label": f"Coffee {i}", "amount": 2.0 + i, "type": "depense", "category": "Food", "date": "2024-03-01"})
+    client.post("/api/transactions", json={"label": "Salary", "amount": 1500.0, "type": "revenu", "category": "Job", "date": "2024-03-05"})
+    client.post("/api/transactions", json={"label": "Old", "amount": 9.0, "type": "depense", "category": "Misc", "date": "2023-12-31"})
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 3}
+        if cursor:
+            params["cursor"] = cursor
+        page = client.get("/api/transactions", params=params).json()
+        seen.extend(tx["label"] for tx in page["items"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+
+    assert seen == ["Salary", "Coffee 4", "Coffee 3", "Coffee 2", "Coffee 1", "Coffee 0", "Old"]
+
+    filtered = client.get("/api/transactions", params={"type": "depense", "start_date": "2024-01-01", "end_date": "2024-03-01"}).json()
+    assert [tx["label"] for tx in filtered["items"]] == ["Coffee 4", "Coffee 3", "Coffee 2", "Coffee 1", "Coffee 0"]
+    assert filtered["next_cursor"] is None
+
+    assert client.get("/api/transactions", params={"category": "Misc"}).json()["items"][0]["label"] == "Old"
+    assert client.get("/api/transactions", params={"cursor": "not-a-cursor"}).status_code == 400